@@ -3,7 +3,7 @@
 Parses Markdown using md_parser, then builds a HwpxDocument using the library API.
 """
 from .md_parser import (
-    parse_markdown, Heading, ParagraphNode, TableNode,
+    iter_markdown, Heading, ParagraphNode, TableNode,
     CodeBlock, BulletList, OrderedList, HorizontalRule, BlockQuote,
     TextSegment,
 )
@@ -48,10 +48,10 @@ def convert_md_to_hwpx(md_text: str) -> HwpxDocument:
     Returns:
         HwpxDocument ready to save.
     """
-    ast = parse_markdown(md_text)
     doc = HwpxDocument.new()
 
-    for node in ast:
+    # Blocks are consumed as they are parsed; no intermediate AST list.
+    for node in iter_markdown(md_text):
         if isinstance(node, Heading):
             doc.add_heading(node.text, level=node.level)
 
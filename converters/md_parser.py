@@ -140,8 +140,21 @@ def parse_markdown(text: str) -> list:
     Returns:
         List of ASTNode objects.
     """
+    return list(_iter_blocks(text))
+
+
+def iter_markdown(text: str):
+    """Yield the AST nodes of *text* one block at a time.
+
+    Same nodes as parse_markdown(), but each block is parsed only when the
+    caller asks for it, so a consumer that handles every block once (like
+    convert_md_to_hwpx) never builds the intermediate node list.
+    """
+    return _iter_blocks(text)
+
+
+def _iter_blocks(text: str):
     lines = text.split('\n')
-    ast = []
     i = 0
 
     while i < len(lines):
@@ -162,12 +175,12 @@ def parse_markdown(text: str) -> list:
                 code_lines.append(lines[i])
                 i += 1
             i += 1  # skip closing ```
-            ast.append(CodeBlock(code='\n'.join(code_lines), language=language))
+            yield CodeBlock(code='\n'.join(code_lines), language=language)
             continue
 
         # --- Horizontal rule ---
         if RE_HR.match(line):
-            ast.append(HorizontalRule())
+            yield HorizontalRule()
             i += 1
             continue
 
@@ -177,7 +190,7 @@ def parse_markdown(text: str) -> list:
             level = len(m.group(1))
             heading_text = m.group(2).strip()
             segments = parse_inline(heading_text)
-            ast.append(Heading(level=level, text=heading_text, segments=segments))
+            yield Heading(level=level, text=heading_text, segments=segments)
             i += 1
             continue
 
@@ -200,7 +213,7 @@ def parse_markdown(text: str) -> list:
                     i += 1
                 else:
                     break
-            ast.append(TableNode(headers=header_cells, rows=data_rows))
+            yield TableNode(headers=header_cells, rows=data_rows)
             continue
 
         # --- Bullet list ---
@@ -219,7 +232,7 @@ def parse_markdown(text: str) -> list:
                     break
                 else:
                     break
-            ast.append(BulletList(items=items))
+            yield BulletList(items=items)
             continue
 
         # --- Ordered list ---
@@ -238,7 +251,7 @@ def parse_markdown(text: str) -> list:
                     break
                 else:
                     break
-            ast.append(OrderedList(items=items))
+            yield OrderedList(items=items)
             continue
 
         # --- Block quote ---
@@ -255,7 +268,7 @@ def parse_markdown(text: str) -> list:
                 else:
                     break
             quote_text = ' '.join(quote_lines)
-            ast.append(BlockQuote(segments=parse_inline(quote_text)))
+            yield BlockQuote(segments=parse_inline(quote_text))
             continue
 
         # --- Regular paragraph ---
@@ -279,6 +292,4 @@ def parse_markdown(text: str) -> list:
 
         if para_lines:
             para_text = ' '.join(para_lines)
-            ast.append(ParagraphNode(segments=parse_inline(para_text)))
-
-    return ast
+            yield ParagraphNode(segments=parse_inline(para_text))
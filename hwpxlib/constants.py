@@ -1,4 +1,5 @@
 """OWPML namespace URIs, unit constants, and default values."""
+import functools
 
 # === OWPML Namespace URIs ===
 NS_HH = "http://www.hancom.co.kr/hwpml/2011/head"
@@ -37,6 +38,9 @@ def pt_to_hwpunit(pt: float) -> int:
     return round(pt * HWPUNIT_PER_PT)
 
 
+# Called with a handful of fixed paper/margin sizes; a float round() costs
+# more than the cache lookup.
+@functools.lru_cache(maxsize=64)
 def mm_to_hwpunit(mm: float) -> int:
     """Convert millimeters to HWPUNIT."""
     return round(mm * HWPUNIT_PER_MM)
@@ -24,11 +24,14 @@ from .xml_writer import (
     write_mimetype, write_version_xml, write_settings_xml,
     write_container_xml, write_manifest_xml, write_container_rdf,
     write_content_hpf, write_prv_text,
-    write_header_xml, write_section_xml,
+    write_header_xml, stream_section_xml,
     set_id_seed, reset_id_seed,
 )
+import functools
 import os
 import struct
+import zipfile
+from typing import BinaryIO
 from .package import HwpxPackage
 
 
@@ -43,6 +46,20 @@ _HEADING_MAP = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _default_header() -> tuple:
+    """Build the default-template header.xml once.
+
+    Returns (parts, xml_bytes) where parts is the tuple of default
+    font faces, border fills, charPrs, paraPrs, and styles it was built from.
+    """
+    parts = (
+        default_font_faces(), default_border_fills(),
+        default_char_prs(), default_para_prs(), default_styles(),
+    )
+    return parts, write_header_xml(*parts).encode('utf-8')
+
+
 def _detect_image_size(data: bytes) -> tuple:
     """Detect image dimensions from raw bytes. Returns (width, height) in pixels."""
     # PNG
@@ -410,8 +427,9 @@ class HwpxDocument:
             paragraphs.append(para)
         return paragraphs
 
-    _BULLET_LEVEL_MAP = {0: PARAPR_BULLET, 1: PARAPR_BULLET_L2, 2: PARAPR_BULLET_L3}
-    _ORDERED_LEVEL_MAP = {0: PARAPR_ORDERED, 1: PARAPR_ORDERED_L2, 2: PARAPR_ORDERED_L3}
+    # Indexed by the clamped nesting level (0-2)
+    _BULLET_LEVEL_MAP = (PARAPR_BULLET, PARAPR_BULLET_L2, PARAPR_BULLET_L3)
+    _ORDERED_LEVEL_MAP = (PARAPR_ORDERED, PARAPR_ORDERED_L2, PARAPR_ORDERED_L3)
 
     def add_bullet_list(self, items: list) -> list:
         """Add a bullet list.
@@ -430,7 +448,7 @@ class HwpxDocument:
                 content, level = item
                 level = min(max(level, 0), 2)
 
-            para_pr = self._BULLET_LEVEL_MAP.get(level, PARAPR_BULLET)
+            para_pr = self._BULLET_LEVEL_MAP[level]
 
             if isinstance(content, str):
                 run = Run(text=content, char_pr_id_ref=CHARPR_BODY)
@@ -464,7 +482,7 @@ class HwpxDocument:
                 content, level = item
                 level = min(max(level, 0), 2)
 
-            para_pr = self._ORDERED_LEVEL_MAP.get(level, PARAPR_ORDERED)
+            para_pr = self._ORDERED_LEVEL_MAP[level]
 
             if isinstance(content, str):
                 run = Run(text=content, char_pr_id_ref=CHARPR_BODY)
@@ -697,15 +715,20 @@ class HwpxDocument:
         self._elements.append(("image", image, PARAPR_BODY, 0))
         return image
 
-    def _build_header_xml(self) -> str:
-        """Build the header.xml content."""
-        return write_header_xml(
-            font_faces=self._font_faces,
-            border_fills=self._border_fills,
-            char_prs=self._char_prs,
-            para_prs=self._para_prs,
-            styles=self._styles,
+    def _build_header_xml(self) -> bytes:
+        """Build the header.xml content.
+
+        Documents still using the default template (the common case) get the
+        pre-serialized header instead of re-rendering every property.
+        """
+        parts = (
+            self._font_faces, self._border_fills,
+            self._char_prs, self._para_prs, self._styles,
         )
+        default_parts, default_xml = _default_header()
+        if parts == default_parts:
+            return default_xml
+        return write_header_xml(*parts).encode('utf-8')
 
     def _get_all_sections(self) -> list:
         """Return list of (elements, page_setup, header, footer) for all sections."""
@@ -763,12 +786,14 @@ class HwpxDocument:
         pkg.add_file('Contents/header.xml', self._build_header_xml())
 
         for i, (elements, page_setup, header, footer) in enumerate(all_sections):
-            section_xml = write_section_xml(
-                elements, first_para_idx=0,
+            # Rendered while the package is written, straight into the
+            # zip entry, so no section is ever held as one string.
+            pkg.add_file(f'Contents/section{i}.xml', functools.partial(
+                stream_section_xml,
+                elements=elements, first_para_idx=0,
                 page_setup=page_setup,
                 header=header, footer=footer,
-            )
-            pkg.add_file(f'Contents/section{i}.xml', section_xml)
+            ))
 
         pkg.add_file('Preview/PrvText.txt', write_prv_text(self._get_preview_text()))
 
@@ -778,21 +803,36 @@ class HwpxDocument:
 
         return pkg
 
-    def save(self, path: str) -> None:
-        """Save the document as a HWPX file."""
+    def save(self, path: str | BinaryIO, compresslevel: int | None = None,
+             compression: int = zipfile.ZIP_DEFLATED) -> None:
+        """Save the document as a HWPX file.
+
+        path: a filesystem path or a writable binary file object.
+
+        compresslevel: optional DEFLATE level (0-9); 1 is much faster than
+        the default for throwaway output such as test fixtures.
+        compression: zipfile method for the package entries; pass
+        zipfile.ZIP_STORED to skip compression altogether. A compresslevel
+        together with ZIP_STORED raises ValueError.
+        """
         if self._seed is not None:
             set_id_seed(self._seed)
-        pkg = self._build_package()
-        pkg.save(path)
-        if self._seed is not None:
-            reset_id_seed()
-
-    def to_bytes(self) -> bytes:
+        try:
+            pkg = self._build_package()
+            pkg.save(path, compresslevel=compresslevel, compression=compression)
+        finally:
+            if self._seed is not None:
+                reset_id_seed()
+
+    def to_bytes(self, compresslevel: int | None = None,
+                 compression: int = zipfile.ZIP_DEFLATED) -> bytes:
         """Return the document as bytes (for MCP server responses)."""
         if self._seed is not None:
             set_id_seed(self._seed)
-        pkg = self._build_package()
-        result = pkg.to_bytes()
-        if self._seed is not None:
-            reset_id_seed()
-        return result
+        try:
+            pkg = self._build_package()
+            return pkg.to_bytes(compresslevel=compresslevel,
+                                compression=compression)
+        finally:
+            if self._seed is not None:
+                reset_id_seed()
@@ -56,10 +56,10 @@ class HwpxForm:
                 data = zf.read(entry)
                 if entry.startswith('Contents/section') and entry.endswith('.xml'):
                     form._section_paths.append(entry)
-                    tree = ET.ElementTree(ET.fromstring(data.decode('utf-8')))
+                    tree = ET.ElementTree(ET.fromstring(data))
                     form._xml_files[entry] = tree
                 elif entry == 'Contents/header.xml':
-                    tree = ET.ElementTree(ET.fromstring(data.decode('utf-8')))
+                    tree = ET.ElementTree(ET.fromstring(data))
                     form._xml_files[entry] = tree
                     form._files[entry] = data
                 else:
@@ -76,10 +76,10 @@ class HwpxForm:
                 file_data = zf.read(entry)
                 if entry.startswith('Contents/section') and entry.endswith('.xml'):
                     form._section_paths.append(entry)
-                    tree = ET.ElementTree(ET.fromstring(file_data.decode('utf-8')))
+                    tree = ET.ElementTree(ET.fromstring(file_data))
                     form._xml_files[entry] = tree
                 elif entry == 'Contents/header.xml':
-                    tree = ET.ElementTree(ET.fromstring(file_data.decode('utf-8')))
+                    tree = ET.ElementTree(ET.fromstring(file_data))
                     form._xml_files[entry] = tree
                     form._files[entry] = file_data
                 else:
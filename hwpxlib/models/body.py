@@ -10,7 +10,10 @@ from ..constants import (
 )
 
 
-@dataclass
+# Body models are slotted: smaller instances and faster attribute reads in
+# the serializer's loops. Image is the exception, since packaging attaches
+# _filename to it.
+@dataclass(slots=True)
 class Run:
     """Text run within a paragraph."""
     text: str = ""
@@ -20,7 +23,7 @@ class Run:
     endnote: object = None   # Endnote object (if this run has an endnote)
 
 
-@dataclass
+@dataclass(slots=True)
 class Paragraph:
     """A paragraph (hp:p)."""
     runs: list = field(default_factory=list)  # list of Run
@@ -31,7 +34,7 @@ class Paragraph:
     page_break: bool = False  # force page break before this paragraph
 
 
-@dataclass
+@dataclass(slots=True)
 class TableCell:
     """Table cell (hp:tc)."""
     paragraphs: list = field(default_factory=list)  # list of Paragraph
@@ -45,13 +48,13 @@ class TableCell:
     header: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TableRow:
     """Table row (hp:tr)."""
     cells: list = field(default_factory=list)  # list of TableCell
 
 
-@dataclass
+@dataclass(slots=True)
 class Table:
     """Table (hp:tbl)."""
     rows: list = field(default_factory=list)  # list of TableRow
@@ -72,7 +75,7 @@ class Image:
     media_type: str = "image/png"  # MIME type
 
 
-@dataclass
+@dataclass(slots=True)
 class PageSetup:
     """Page size, margins, and orientation."""
     width: int = PAGE_WIDTH       # 59530 (A4 210mm)
@@ -115,28 +118,28 @@ class PageSetup:
         return self.width - self.margin_left - self.margin_right
 
 
-@dataclass
+@dataclass(slots=True)
 class HeaderFooter:
     """Header or footer content."""
     paragraphs: list = field(default_factory=list)  # list of Paragraph
     apply_page_type: str = "BOTH"  # BOTH, EVEN, ODD
 
 
-@dataclass
+@dataclass(slots=True)
 class Footnote:
     """Footnote content attached to a run."""
     paragraphs: list = field(default_factory=list)  # list of Paragraph
     number: int = 0  # auto-numbered if 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Endnote:
     """Endnote content attached to a run."""
     paragraphs: list = field(default_factory=list)  # list of Paragraph
     number: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """Section root containing paragraphs and tables."""
     elements: list = field(default_factory=list)  # list of Paragraph or Table-wrapping Paragraph
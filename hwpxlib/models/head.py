@@ -3,9 +3,12 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FontRef:
-    """Font reference for each language."""
+    """Font reference for each language.
+
+    Frozen so a single instance can be shared by every CharPr that uses it.
+    """
     hangul: int = 0
     latin: int = 0
     hanja: int = 0
@@ -23,7 +26,7 @@ class CharPr:
     text_color: str = "#000000"
     shade_color: str = "none"
     border_fill_id_ref: int = 2
-    font_ref: FontRef = field(default_factory=FontRef)
+    font_ref: FontRef = FontRef()
     bold: bool = False
     italic: bool = False
     underline_type: str = "NONE"
@@ -85,9 +88,13 @@ class BorderFill:
     fill_color: Optional[str] = None  # None means no fill
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Font:
-    """Font definition."""
+    """Font definition.
+
+    Frozen so every language group can share one instance and its rendered
+    XML can be cached.
+    """
     id: int = 0
     face: str = "나눔고딕"
     type: str = "TTF"
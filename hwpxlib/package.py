@@ -1,22 +1,30 @@
 """ZIP/OPC container management for HWPX files.
 
 HWPX is a ZIP-based format. The 'mimetype' file MUST be the first entry
-and stored uncompressed (no DEFLATE). All other XML files use DEFLATED compression.
+and stored uncompressed (no DEFLATE). All other XML files use DEFLATED
+compression unless the caller asks for something else (e.g. ZIP_STORED for
+throwaway test output).
 """
 import posixpath
 import zipfile
 import io
+from typing import BinaryIO, Callable, TextIO
 
 
 class HwpxPackage:
     """Manages the ZIP container for a HWPX document."""
 
     def __init__(self):
-        self._files: dict[str, bytes] = {}
+        self._files: dict[str, bytes | Callable[[TextIO], None]] = {}
 
-    def add_file(self, path: str, content: bytes | str):
+    def add_file(self, path: str,
+                 content: bytes | str | Callable[[TextIO], None]):
         """Add a file to the package.
 
+        content may also be a callable taking a text stream; it is called
+        when the package is written and its output is encoded as UTF-8
+        straight into the ZIP entry.
+
         Raises ValueError if the path contains traversal sequences or is absolute.
         """
         # Reject absolute paths and path traversal
@@ -34,39 +42,59 @@ class HwpxPackage:
             content = content.encode('utf-8')
         self._files[path] = content
 
-    def save(self, output_path: str):
-        """Save the HWPX package as a ZIP file."""
-        with zipfile.ZipFile(output_path, 'w') as zf:
-            # mimetype MUST be first entry, STORED (not compressed)
-            if 'mimetype' in self._files:
-                zf.writestr(
-                    zipfile.ZipInfo('mimetype'),
-                    self._files['mimetype'],
-                    compress_type=zipfile.ZIP_STORED,
-                )
+    def _write_zip(self, zf: zipfile.ZipFile):
+        # mimetype MUST be first entry, STORED (not compressed)
+        if 'mimetype' in self._files:
+            zf.writestr(
+                zipfile.ZipInfo('mimetype'),
+                self._files['mimetype'],
+                compress_type=zipfile.ZIP_STORED,
+            )
+
+        # All other files use the archive's compression (DEFLATED by default)
+        for path, content in self._files.items():
+            if path == 'mimetype':
+                continue
+            if callable(content):
+                with zf.open(path, 'w') as raw, \
+                        io.TextIOWrapper(raw, encoding='utf-8', newline='') as tw:
+                    content(tw)
+            else:
+                zf.writestr(zipfile.ZipInfo(path), content,
+                            compress_type=zf.compression,
+                            compresslevel=zf.compresslevel)
+
+    @staticmethod
+    def _open_zip(file, compression: int,
+                  compresslevel: int | None) -> zipfile.ZipFile:
+        # ZipFile silently ignores a level for ZIP_STORED; refuse the
+        # combination instead of pretending the level was applied.
+        if compression == zipfile.ZIP_STORED and compresslevel is not None:
+            raise ValueError(
+                "compresslevel cannot be combined with ZIP_STORED")
+        return zipfile.ZipFile(file, 'w', compression=compression,
+                               compresslevel=compresslevel)
 
-            # All other files use DEFLATED compression
-            for path, content in self._files.items():
-                if path == 'mimetype':
-                    continue
-                info = zipfile.ZipInfo(path)
-                info.compress_type = zipfile.ZIP_DEFLATED
-                zf.writestr(info, content)
+    def save(self, output_path: str | BinaryIO, compresslevel: int | None = None,
+             compression: int = zipfile.ZIP_DEFLATED):
+        """Save the HWPX package as a ZIP file.
+
+        output_path: a filesystem path or a writable binary file object
+        (e.g. io.BytesIO, which skips the disk entirely).
+
+        compression: zipfile method for every entry but mimetype;
+        ZIP_STORED skips compression entirely.
+        compresslevel: level for that method, e.g. DEFLATE 0-9 (default:
+        zlib's 6). Lower levels trade size for speed. Only meaningful for a
+        compressing method: ZIP_STORED with a level raises ValueError.
+        """
+        with self._open_zip(output_path, compression, compresslevel) as zf:
+            self._write_zip(zf)
 
-    def to_bytes(self) -> bytes:
-        """Return the HWPX package as bytes."""
+    def to_bytes(self, compresslevel: int | None = None,
+                 compression: int = zipfile.ZIP_DEFLATED) -> bytes:
+        """Return the HWPX package as bytes; arguments as for save()."""
         buf = io.BytesIO()
-        with zipfile.ZipFile(buf, 'w') as zf:
-            if 'mimetype' in self._files:
-                zf.writestr(
-                    zipfile.ZipInfo('mimetype'),
-                    self._files['mimetype'],
-                    compress_type=zipfile.ZIP_STORED,
-                )
-            for path, content in self._files.items():
-                if path == 'mimetype':
-                    continue
-                info = zipfile.ZipInfo(path)
-                info.compress_type = zipfile.ZIP_DEFLATED
-                zf.writestr(info, content)
+        with self._open_zip(buf, compression, compresslevel) as zf:
+            self._write_zip(zf)
         return buf.getvalue()
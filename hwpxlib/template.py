@@ -23,19 +23,22 @@ from .style_config import StyleConfig
 from .models.head import CharPr, ParaPr, Style, BorderFill, Font, FontFace, FontRef
 
 
+# Shared font references (FontRef is frozen, so one instance serves every charPr)
+FONT_REF_DEFAULT = FontRef()  # all 0 (body font)
+FONT_REF_CODE = FontRef(hangul=1, latin=1, hanja=1, japanese=1,
+                        other=1, symbol=1, user=1)  # all 1 (code font)
+
+
 def default_font_faces(config: StyleConfig = None) -> list:
     """Create font face definitions for all language groups."""
     cfg = config or StyleConfig()
     langs = ["HANGUL", "LATIN", "HANJA", "JAPANESE", "OTHER", "SYMBOL", "USER"]
+    # Font is frozen, so all language groups share the same two instances
+    body_font = Font(id=0, face=cfg.font_body, type="TTF")
+    code_font = Font(id=1, face=cfg.font_code, type="TTF")
     faces = []
     for lang in langs:
-        faces.append(FontFace(
-            lang=lang,
-            fonts=[
-                Font(id=0, face=cfg.font_body, type="TTF"),
-                Font(id=1, face=cfg.font_code, type="TTF"),
-            ]
-        ))
+        faces.append(FontFace(lang=lang, fonts=[body_font, code_font]))
     return faces
 
 
@@ -100,9 +103,8 @@ def default_border_fills(config: StyleConfig = None) -> list:
 def default_char_prs(config: StyleConfig = None) -> list:
     """Create character property definitions."""
     cfg = config or StyleConfig()
-    font_default = FontRef()  # all 0 (body font)
-    font_code = FontRef(hangul=1, latin=1, hanja=1, japanese=1,
-                         other=1, symbol=1, user=1)  # all 1 (code font)
+    font_default = FONT_REF_DEFAULT
+    font_code = FONT_REF_CODE
 
     return [
         # 0: 본문
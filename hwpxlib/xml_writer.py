@@ -3,32 +3,60 @@
 Uses string-based XML generation to ensure exact namespace prefix control,
 which is critical for HWPX compatibility with Hancom Office.
 """
+import functools
 import random
 import threading
-from xml.sax.saxutils import escape as xml_escape
 
 from .constants import (
     NS_HH, NS_HP, NS_HS, NS_HC, NS_HV, NS_HA,
-    PAGE_WIDTH, PAGE_HEIGHT,
-    MARGIN_LEFT, MARGIN_RIGHT, MARGIN_TOP, MARGIN_BOTTOM,
-    MARGIN_HEADER, MARGIN_FOOTER,
+    CHARPR_LINK,
 )
 from .models.head import CharPr, ParaPr, Style, BorderFill, Font, FontFace
-from .models.body import Paragraph, Run, Table, TableRow, TableCell, Image, PageSetup, HeaderFooter
+from .models.body import Paragraph, Run, Table, Image, PageSetup, HeaderFooter
+
+
+def _escape_text(text: str) -> str:
+    if '&' in text or '<' in text or '>' in text:
+        return text.replace('&', '&amp;').replace('>', '&gt;').replace('<', '&lt;')
+    return text
+
+
+# Escaping is memoized: the same run text and the small repertoire of
+# attribute values ("SOLID", "#000000", font faces...) recur every time a
+# document is serialized. Long body text rarely repeats, so it skips the
+# cache rather than evicting the short strings that do and pinning itself.
+_ESC_CACHE_MAX_LEN = 256
+_esc_cached = functools.lru_cache(maxsize=4096)(_escape_text)
 
 
 def _esc(text: str) -> str:
     """Escape XML special characters in text content."""
-    return xml_escape(text)
+    if len(text) > _ESC_CACHE_MAX_LEN:
+        return _escape_text(text)
+    return _esc_cached(text)
 
 
+# typed=True keeps e.g. 1 and True from sharing a cache slot.
+@functools.lru_cache(maxsize=1024, typed=True)
 def _esc_attr(value: str) -> str:
     """Escape XML special characters in attribute values.
 
-    In addition to <, >, & (handled by xml_escape), this also escapes
+    In addition to <, >, &, this also escapes
     double quotes which could break out of attribute boundaries.
     """
-    return xml_escape(str(value), {'"': '&quot;'})
+    value = str(value)
+    if '&' in value or '<' in value or '>' in value or '"' in value:
+        return (value.replace('&', '&amp;').replace('>', '&gt;')
+                .replace('<', '&lt;').replace('"', '&quot;'))
+    return value
+
+
+# Header attributes fall into two groups. Enum-like fields (border/underline/
+# strikeout types, border widths, alignment, heading type, keep flags,
+# fontface lang, font type, style type) only ever hold controlled vocabulary
+# from template.py and are interpolated as-is. Anything that can carry user
+# input -- font faces, style names, colors from StyleConfig, and all body
+# attributes -- still goes through _esc_attr.
 
 
 # =============================================================================
@@ -39,56 +67,66 @@ def write_mimetype() -> bytes:
     return b"application/hwp+zip"
 
 
-def write_version_xml() -> str:
-    return (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
-        f'<hv:HCFVersion xmlns:hv="{NS_HV}" tagetApplication="WORDPROCESSOR"'
-        ' major="5" minor="1" micro="1" buildNumber="0" os="1"'
-        ' xmlVersion="1.5" application="Hancom Office Hangul"'
-        ' appVersion="12.0.0.1"/>\n'
-    )
-
-
-def write_settings_xml() -> str:
-    return (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
-        f'<ha:HWPApplicationSetting xmlns:ha="{NS_HA}"'
-        ' xmlns:config="urn:oasis:names:tc:opendocument:xmlns:config:1.0">\n'
-        '  <ha:CaretPosition listIDRef="0" paraIDRef="0" pos="0"/>\n'
-        '  <config:config-item-set name="PrintInfo">\n'
-        '    <config:config-item name="PrintAutoFootNote" type="boolean">false</config:config-item>\n'
-        '    <config:config-item name="PrintAutoHeadNote" type="boolean">false</config:config-item>\n'
-        '    <config:config-item name="PrintCropMark" type="short">0</config:config-item>\n'
-        '    <config:config-item name="BinderHoleType" type="short">0</config:config-item>\n'
-        '    <config:config-item name="ZoomX" type="short">100</config:config-item>\n'
-        '    <config:config-item name="ZoomY" type="short">100</config:config-item>\n'
-        '  </config:config-item-set>\n'
-        '</ha:HWPApplicationSetting>\n'
-    )
-
-
-def write_container_xml() -> str:
-    return (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
-        '<ocf:container xmlns:ocf="urn:oasis:names:tc:opendocument:xmlns:container"'
-        ' xmlns:hpf="http://www.hancom.co.kr/schema/2011/hpf">\n'
-        '  <ocf:rootfiles>\n'
-        '    <ocf:rootfile full-path="Contents/content.hpf"'
-        ' media-type="application/hwpml-package+xml"/>\n'
-        '    <ocf:rootfile full-path="Preview/PrvText.txt"'
-        ' media-type="text/plain"/>\n'
-        '    <ocf:rootfile full-path="META-INF/container.rdf"'
-        ' media-type="application/rdf+xml"/>\n'
-        '  </ocf:rootfiles>\n'
-        '</ocf:container>\n'
-    )
-
-
-def write_manifest_xml() -> str:
-    return (
-        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
-        '<odf:manifest xmlns:odf="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0"/>\n'
-    )
+# Static meta files never vary, so they are encoded once at import.
+_VERSION_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<hv:HCFVersion xmlns:hv="{NS_HV}" tagetApplication="WORDPROCESSOR"'
+    ' major="5" minor="1" micro="1" buildNumber="0" os="1"'
+    ' xmlVersion="1.5" application="Hancom Office Hangul"'
+    ' appVersion="12.0.0.1"/>\n'
+).encode('utf-8')
+
+_SETTINGS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<ha:HWPApplicationSetting xmlns:ha="{NS_HA}"'
+    ' xmlns:config="urn:oasis:names:tc:opendocument:xmlns:config:1.0">\n'
+    '  <ha:CaretPosition listIDRef="0" paraIDRef="0" pos="0"/>\n'
+    '  <config:config-item-set name="PrintInfo">\n'
+    '    <config:config-item name="PrintAutoFootNote" type="boolean">false</config:config-item>\n'
+    '    <config:config-item name="PrintAutoHeadNote" type="boolean">false</config:config-item>\n'
+    '    <config:config-item name="PrintCropMark" type="short">0</config:config-item>\n'
+    '    <config:config-item name="BinderHoleType" type="short">0</config:config-item>\n'
+    '    <config:config-item name="ZoomX" type="short">100</config:config-item>\n'
+    '    <config:config-item name="ZoomY" type="short">100</config:config-item>\n'
+    '  </config:config-item-set>\n'
+    '</ha:HWPApplicationSetting>\n'
+).encode('utf-8')
+
+_CONTAINER_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<ocf:container xmlns:ocf="urn:oasis:names:tc:opendocument:xmlns:container"'
+    ' xmlns:hpf="http://www.hancom.co.kr/schema/2011/hpf">\n'
+    '  <ocf:rootfiles>\n'
+    '    <ocf:rootfile full-path="Contents/content.hpf"'
+    ' media-type="application/hwpml-package+xml"/>\n'
+    '    <ocf:rootfile full-path="Preview/PrvText.txt"'
+    ' media-type="text/plain"/>\n'
+    '    <ocf:rootfile full-path="META-INF/container.rdf"'
+    ' media-type="application/rdf+xml"/>\n'
+    '  </ocf:rootfiles>\n'
+    '</ocf:container>\n'
+).encode('utf-8')
+
+_MANIFEST_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<odf:manifest xmlns:odf="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0"/>\n'
+).encode('utf-8')
+
+
+def write_version_xml() -> bytes:
+    return _VERSION_XML
+
+
+def write_settings_xml() -> bytes:
+    return _SETTINGS_XML
+
+
+def write_container_xml() -> bytes:
+    return _CONTAINER_XML
+
+
+def write_manifest_xml() -> bytes:
+    return _MANIFEST_XML
 
 
 def write_container_rdf(section_count: int = 1) -> str:
@@ -122,6 +160,11 @@ def write_container_rdf(section_count: int = 1) -> str:
     return '\n'.join(parts) + '\n'
 
 
+_OPF_IMAGE_ITEM_TMPL = (
+    '    <opf:item id="%s" href="BinData/%s" media-type="%s" isEmbeded="1"/>'
+)
+
+
 def write_content_hpf(images: list = None, section_count: int = 1) -> str:
     """Generate the content.hpf (OPF manifest).
 
@@ -146,17 +189,16 @@ def write_content_hpf(images: list = None, section_count: int = 1) -> str:
         ' media-type="application/xml"/>',
     ]
     if images:
-        for item_id, filename, media_type in images:
-            lines.append(
-                f'    <opf:item id="{_esc_attr(item_id)}"'
-                f' href="BinData/{_esc_attr(filename)}"'
-                f' media-type="{_esc_attr(media_type)}" isEmbeded="1"/>'
-            )
-    for i in range(section_count):
-        lines.append(
-            f'    <opf:item id="section{i}" href="Contents/section{i}.xml"'
-            ' media-type="application/xml"/>'
+        lines.extend(
+            _OPF_IMAGE_ITEM_TMPL % (
+                _esc_attr(item_id), _esc_attr(filename), _esc_attr(media_type))
+            for item_id, filename, media_type in images
         )
+    lines.extend(
+        f'    <opf:item id="section{i}" href="Contents/section{i}.xml"'
+        ' media-type="application/xml"/>'
+        for i in range(section_count)
+    )
     lines.extend([
         '    <opf:item id="settings" href="settings.xml"'
         ' media-type="application/xml"/>',
@@ -164,8 +206,10 @@ def write_content_hpf(images: list = None, section_count: int = 1) -> str:
         '  <opf:spine>',
         '    <opf:itemref idref="header" linear="yes"/>',
     ])
-    for i in range(section_count):
-        lines.append(f'    <opf:itemref idref="section{i}" linear="yes"/>')
+    lines.extend(
+        f'    <opf:itemref idref="section{i}" linear="yes"/>'
+        for i in range(section_count)
+    )
     lines.extend([
         '  </opf:spine>',
         '</opf:package>',
@@ -182,139 +226,130 @@ def write_prv_text(text: str = "") -> str:
 # HEADER.XML
 # =============================================================================
 
+@functools.lru_cache(maxsize=256)
+def _write_font(font: Font) -> str:
+    """Write a single font element (Font is frozen, so this is memoized)."""
+    return (
+        f'        <hh:font id="{font.id}" face="{_esc_attr(font.face)}"'
+        f' type="{font.type}" isEmbedded="0" />'
+    )
+
+
 def _write_font_face(ff: FontFace) -> str:
     """Write a single fontface element."""
-    lines = [f'      <hh:fontface lang="{_esc_attr(ff.lang)}" fontCnt="{len(ff.fonts)}">']
-    for font in ff.fonts:
-        lines.append(
-            f'        <hh:font id="{font.id}" face="{_esc_attr(font.face)}"'
-            f' type="{_esc_attr(font.type)}" isEmbedded="0" />'
-        )
-    lines.append('      </hh:fontface>')
-    return '\n'.join(lines)
+    return '\n'.join([
+        f'      <hh:fontface lang="{ff.lang}" fontCnt="{len(ff.fonts)}">',
+        *[_write_font(font) for font in ff.fonts],
+        '      </hh:fontface>',
+    ])
 
 
 def _write_border_fill(bf: BorderFill) -> str:
     """Write a single borderFill element."""
+    face_color = bf.fill_color if bf.fill_color and bf.fill_color != "none" else "none"
     lines = [
         f'      <hh:borderFill id="{bf.id}" threeD="0" shadow="0"'
         f' centerLine="NONE" breakCellSeparateLine="0">',
         '        <hh:slash type="NONE" Crooked="0" isCounter="0" />',
         '        <hh:backSlash type="NONE" Crooked="0" isCounter="0" />',
-        f'        <hh:leftBorder type="{_esc_attr(bf.left_type)}" width="{_esc_attr(bf.left_width)}"'
+        f'        <hh:leftBorder type="{bf.left_type}" width="{bf.left_width}"'
         f' color="{_esc_attr(bf.left_color)}" />',
-        f'        <hh:rightBorder type="{_esc_attr(bf.right_type)}" width="{_esc_attr(bf.right_width)}"'
+        f'        <hh:rightBorder type="{bf.right_type}" width="{bf.right_width}"'
         f' color="{_esc_attr(bf.right_color)}" />',
-        f'        <hh:topBorder type="{_esc_attr(bf.top_type)}" width="{_esc_attr(bf.top_width)}"'
+        f'        <hh:topBorder type="{bf.top_type}" width="{bf.top_width}"'
         f' color="{_esc_attr(bf.top_color)}" />',
-        f'        <hh:bottomBorder type="{_esc_attr(bf.bottom_type)}" width="{_esc_attr(bf.bottom_width)}"'
+        f'        <hh:bottomBorder type="{bf.bottom_type}" width="{bf.bottom_width}"'
         f' color="{_esc_attr(bf.bottom_color)}" />',
         '        <hh:diagonal type="SOLID" width="0.1 mm" color="#000000" />',
+        '        <hc:fillBrush>',
+        f'          <hc:winBrush faceColor="{_esc_attr(face_color)}"'
+        ' hatchColor="#000000" alpha="0" />',
+        '        </hc:fillBrush>',
+        '      </hh:borderFill>',
     ]
-    if bf.fill_color and bf.fill_color != "none":
-        lines.append('        <hc:fillBrush>')
-        lines.append(
-            f'          <hc:winBrush faceColor="{_esc_attr(bf.fill_color)}"'
-            f' hatchColor="#000000" alpha="0" />'
-        )
-        lines.append('        </hc:fillBrush>')
-    else:
-        lines.append('        <hc:fillBrush>')
-        lines.append(
-            '          <hc:winBrush faceColor="none"'
-            ' hatchColor="#000000" alpha="0" />'
-        )
-        lines.append('        </hc:fillBrush>')
-    lines.append('      </hh:borderFill>')
     return '\n'.join(lines)
 
 
 def _write_char_pr(cp: CharPr) -> str:
     """Write a single charPr element."""
     fr = cp.font_ref
-    lines = [
+    off = cp.offset
+    emphasis = (
+        ('        <hh:bold />\n' if cp.bold else '')
+        + ('        <hh:italic />\n' if cp.italic else '')
+    )
+    return (
         f'      <hh:charPr id="{cp.id}" height="{cp.height}"'
         f' textColor="{_esc_attr(cp.text_color)}" shadeColor="{_esc_attr(cp.shade_color)}"'
-        f' useFontSpace="0" useKerning="0" symMark="NONE"'
-        f' borderFillIDRef="{cp.border_fill_id_ref}">',
+        ' useFontSpace="0" useKerning="0" symMark="NONE"'
+        f' borderFillIDRef="{cp.border_fill_id_ref}">\n'
         f'        <hh:fontRef hangul="{fr.hangul}" latin="{fr.latin}"'
         f' hanja="{fr.hanja}" japanese="{fr.japanese}" other="{fr.other}"'
-        f' symbol="{fr.symbol}" user="{fr.user}" />',
+        f' symbol="{fr.symbol}" user="{fr.user}" />\n'
         '        <hh:ratio hangul="100" latin="100" hanja="100"'
-        ' japanese="100" other="100" symbol="100" user="100" />',
+        ' japanese="100" other="100" symbol="100" user="100" />\n'
         '        <hh:spacing hangul="0" latin="0" hanja="0"'
-        ' japanese="0" other="0" symbol="0" user="0" />',
+        ' japanese="0" other="0" symbol="0" user="0" />\n'
         '        <hh:relSz hangul="100" latin="100" hanja="100"'
-        ' japanese="100" other="100" symbol="100" user="100" />',
-        f'        <hh:offset hangul="{cp.offset}" latin="{cp.offset}" hanja="{cp.offset}"'
-        f' japanese="{cp.offset}" other="{cp.offset}" symbol="{cp.offset}" user="{cp.offset}" />',
-    ]
-    if cp.bold:
-        lines.append('        <hh:bold />')
-    if cp.italic:
-        lines.append('        <hh:italic />')
-    lines.append(
-        f'        <hh:underline type="{_esc_attr(cp.underline_type)}" shape="SOLID"'
-        f' color="{_esc_attr(cp.underline_color)}" />'
+        ' japanese="100" other="100" symbol="100" user="100" />\n'
+        f'        <hh:offset hangul="{off}" latin="{off}" hanja="{off}"'
+        f' japanese="{off}" other="{off}" symbol="{off}" user="{off}" />\n'
+        f'{emphasis}'
+        f'        <hh:underline type="{cp.underline_type}" shape="SOLID"'
+        f' color="{_esc_attr(cp.underline_color)}" />\n'
+        f'        <hh:strikeout shape="{cp.strikeout}" color="#000000" />\n'
+        '        <hh:outline type="NONE" />\n'
+        '        <hh:shadow type="NONE" color="#C0C0C0" offsetX="5" offsetY="5" />\n'
+        '      </hh:charPr>'
     )
-    lines.append(f'        <hh:strikeout shape="{_esc_attr(cp.strikeout)}" color="#000000" />')
-    lines.append('        <hh:outline type="NONE" />')
-    lines.append('        <hh:shadow type="NONE" color="#C0C0C0" offsetX="5" offsetY="5" />')
-    lines.append('      </hh:charPr>')
-    return '\n'.join(lines)
 
 
 def _write_para_pr(pp: ParaPr) -> str:
     """Write a single paraPr element."""
-    lines = [
+    # hp:case and hp:default carry the same margin/lineSpacing block
+    spacing = (
+        '            <hh:margin>\n'
+        f'              <hc:intent value="{pp.margin_intent}" unit="HWPUNIT" />\n'
+        f'              <hc:left value="{pp.margin_left}" unit="HWPUNIT" />\n'
+        f'              <hc:right value="{pp.margin_right}" unit="HWPUNIT" />\n'
+        f'              <hc:prev value="{pp.margin_prev}" unit="HWPUNIT" />\n'
+        f'              <hc:next value="{pp.margin_next}" unit="HWPUNIT" />\n'
+        '            </hh:margin>\n'
+        f'            <hh:lineSpacing type="{pp.line_spacing_type}"'
+        f' value="{pp.line_spacing_value}" unit="HWPUNIT" />\n'
+    )
+    return (
         f'      <hh:paraPr id="{pp.id}" tabPrIDRef="{pp.tab_pr_id_ref}"'
-        f' condense="0" fontLineHeight="0" snapToGrid="1"'
-        f' suppressLineNumbers="0" checked="0">',
-        f'        <hh:align horizontal="{_esc_attr(pp.align_horizontal)}" vertical="BASELINE" />',
-        f'        <hh:heading type="{_esc_attr(pp.heading_type)}" idRef="{pp.heading_id_ref}"'
-        f' level="{pp.heading_level}" />',
-        f'        <hh:breakSetting breakLatinWord="KEEP_WORD"'
-        f' breakNonLatinWord="BREAK_WORD" widowOrphan="0"'
-        f' keepWithNext="{_esc_attr(pp.keep_with_next)}" keepLines="{_esc_attr(pp.keep_lines)}"'
-        f' pageBreakBefore="0" lineWrap="BREAK" />',
-        '        <hh:autoSpacing eAsianEng="0" eAsianNum="0" />',
-        '        <hp:switch>',
+        ' condense="0" fontLineHeight="0" snapToGrid="1"'
+        ' suppressLineNumbers="0" checked="0">\n'
+        f'        <hh:align horizontal="{pp.align_horizontal}" vertical="BASELINE" />\n'
+        f'        <hh:heading type="{pp.heading_type}" idRef="{pp.heading_id_ref}"'
+        f' level="{pp.heading_level}" />\n'
+        '        <hh:breakSetting breakLatinWord="KEEP_WORD"'
+        ' breakNonLatinWord="BREAK_WORD" widowOrphan="0"'
+        f' keepWithNext="{pp.keep_with_next}" keepLines="{pp.keep_lines}"'
+        ' pageBreakBefore="0" lineWrap="BREAK" />\n'
+        '        <hh:autoSpacing eAsianEng="0" eAsianNum="0" />\n'
+        '        <hp:switch>\n'
         '          <hp:case hp:required-namespace='
-        '"http://www.hancom.co.kr/hwpml/2016/HwpUnitChar">',
-        '            <hh:margin>',
-        f'              <hc:intent value="{pp.margin_intent}" unit="HWPUNIT" />',
-        f'              <hc:left value="{pp.margin_left}" unit="HWPUNIT" />',
-        f'              <hc:right value="{pp.margin_right}" unit="HWPUNIT" />',
-        f'              <hc:prev value="{pp.margin_prev}" unit="HWPUNIT" />',
-        f'              <hc:next value="{pp.margin_next}" unit="HWPUNIT" />',
-        '            </hh:margin>',
-        f'            <hh:lineSpacing type="{pp.line_spacing_type}"'
-        f' value="{pp.line_spacing_value}" unit="HWPUNIT" />',
-        '          </hp:case>',
-        '          <hp:default>',
-        '            <hh:margin>',
-        f'              <hc:intent value="{pp.margin_intent}" unit="HWPUNIT" />',
-        f'              <hc:left value="{pp.margin_left}" unit="HWPUNIT" />',
-        f'              <hc:right value="{pp.margin_right}" unit="HWPUNIT" />',
-        f'              <hc:prev value="{pp.margin_prev}" unit="HWPUNIT" />',
-        f'              <hc:next value="{pp.margin_next}" unit="HWPUNIT" />',
-        '            </hh:margin>',
-        f'            <hh:lineSpacing type="{pp.line_spacing_type}"'
-        f' value="{pp.line_spacing_value}" unit="HWPUNIT" />',
-        '          </hp:default>',
-        '        </hp:switch>',
+        '"http://www.hancom.co.kr/hwpml/2016/HwpUnitChar">\n'
+        f'{spacing}'
+        '          </hp:case>\n'
+        '          <hp:default>\n'
+        f'{spacing}'
+        '          </hp:default>\n'
+        '        </hp:switch>\n'
         f'        <hh:border borderFillIDRef="{pp.border_fill_id_ref}"'
-        f' offsetLeft="400" offsetRight="400" offsetTop="100"'
-        f' offsetBottom="100" connect="0" ignoreMargin="0" />',
-        '      </hh:paraPr>',
-    ]
-    return '\n'.join(lines)
+        ' offsetLeft="400" offsetRight="400" offsetTop="100"'
+        ' offsetBottom="100" connect="0" ignoreMargin="0" />\n'
+        '      </hh:paraPr>'
+    )
 
 
 def _write_style(s: Style) -> str:
     """Write a single style element."""
     return (
-        f'      <hh:style id="{s.id}" type="{_esc_attr(s.type)}"'
+        f'      <hh:style id="{s.id}" type="{s.type}"'
         f' name="{_esc_attr(s.name)}" engName="{_esc_attr(s.eng_name)}"'
         f' paraPrIDRef="{s.para_pr_id_ref}"'
         f' charPrIDRef="{s.char_pr_id_ref}"'
@@ -323,6 +358,41 @@ def _write_style(s: Style) -> str:
     )
 
 
+# Level 1-10 paraHead blocks for the default numbering/bullet (invariant)
+_NUMBERING_PARA_HEADS = '\n'.join(
+    f'        <hh:paraHead start="1" level="{lvl}" align="LEFT"'
+    f' useInstWidth="1" autoIndent="0" widthAdjust="0"'
+    f' textOffsetType="PERCENT" textOffset="35"'
+    f' numFormat="DIGIT" charPrIDRef="1" checkable="0" />'
+    for lvl in range(1, 11)
+)
+_BULLET_PARA_HEADS = '\n'.join(
+    f'        <hh:paraHead start="1" level="{lvl}" align="LEFT"'
+    f' useInstWidth="1" autoIndent="1" widthAdjust="0"'
+    f' textOffsetType="PERCENT" textOffset="50"'
+    f' numFormat="BULLET" charPrIDRef="0" checkable="0" />'
+    for lvl in range(1, 11)
+)
+
+_STATIC_REF_LISTS = '\n'.join([
+    '    <hh:tabProperties itemCnt="2">',
+    '      <hh:tabPr id="0" autoTabLeft="0" autoTabRight="0" />',
+    '      <hh:tabPr id="1" autoTabLeft="1" autoTabRight="0" />',
+    '    </hh:tabProperties>',
+    '    <hh:numberings itemCnt="1">',
+    '      <hh:numbering id="1" start="0">',
+    _NUMBERING_PARA_HEADS,
+    '      </hh:numbering>',
+    '    </hh:numberings>',
+    '    <hh:bullets itemCnt="1">',
+    '      <hh:bullet id="1" char="&#x25CF;"'
+    ' checkedChar="&#x25CF;">',
+    _BULLET_PARA_HEADS,
+    '      </hh:bullet>',
+    '    </hh:bullets>',
+])
+
+
 def write_header_xml(
     font_faces: list,
     border_fills: list,
@@ -341,69 +411,32 @@ def write_header_xml(
 
     # Font faces
     lines.append(f'    <hh:fontfaces itemCnt="{len(font_faces)}">')
-    for ff in font_faces:
-        lines.append(_write_font_face(ff))
+    lines.extend(map(_write_font_face, font_faces))
     lines.append('    </hh:fontfaces>')
 
     # Border fills
     lines.append(f'    <hh:borderFills itemCnt="{len(border_fills)}">')
-    for bf in border_fills:
-        lines.append(_write_border_fill(bf))
+    lines.extend(map(_write_border_fill, border_fills))
     lines.append('    </hh:borderFills>')
 
     # Char properties
     lines.append(f'    <hh:charProperties itemCnt="{len(char_prs)}">')
-    for cp in char_prs:
-        lines.append(_write_char_pr(cp))
+    lines.extend(map(_write_char_pr, char_prs))
     lines.append('    </hh:charProperties>')
 
     # Para properties
     lines.append(f'    <hh:paraProperties itemCnt="{len(para_prs)}">')
-    for pp in para_prs:
-        lines.append(_write_para_pr(pp))
+    lines.extend(map(_write_para_pr, para_prs))
     lines.append('    </hh:paraProperties>')
 
-    # Tab properties
-    lines.append('    <hh:tabProperties itemCnt="2">')
-    lines.append('      <hh:tabPr id="0" autoTabLeft="0" autoTabRight="0" />')
-    lines.append('      <hh:tabPr id="1" autoTabLeft="1" autoTabRight="0" />')
-    lines.append('    </hh:tabProperties>')
-
-    # Numberings
-    lines.append('    <hh:numberings itemCnt="1">')
-    lines.append('      <hh:numbering id="1" start="0">')
-    for lvl in range(1, 11):
-        lines.append(
-            f'        <hh:paraHead start="1" level="{lvl}" align="LEFT"'
-            f' useInstWidth="1" autoIndent="0" widthAdjust="0"'
-            f' textOffsetType="PERCENT" textOffset="35"'
-            f' numFormat="DIGIT" charPrIDRef="1" checkable="0" />'
-        )
-    lines.append('      </hh:numbering>')
-    lines.append('    </hh:numberings>')
-
-    # Bullets
-    lines.append('    <hh:bullets itemCnt="1">')
-    lines.append(
-        '      <hh:bullet id="1" char="&#x25CF;"'
-        ' checkedChar="&#x25CF;">'
-    )
-    for lvl in range(1, 11):
-        lines.append(
-            f'        <hh:paraHead start="1" level="{lvl}" align="LEFT"'
-            f' useInstWidth="1" autoIndent="1" widthAdjust="0"'
-            f' textOffsetType="PERCENT" textOffset="50"'
-            f' numFormat="BULLET" charPrIDRef="0" checkable="0" />'
-        )
-    lines.append('      </hh:bullet>')
-    lines.append('    </hh:bullets>')
+    # Tab properties, numberings and bullets never vary
+    lines.append(_STATIC_REF_LISTS)
 
     lines.append('  </hh:refList>')
 
     # Styles
     lines.append(f'  <hh:styles itemCnt="{len(styles)}">')
-    for s in styles:
-        lines.append(_write_style(s))
+    lines.extend(map(_write_style, styles))
     lines.append('  </hh:styles>')
 
     lines.append('</hh:head>')
@@ -417,33 +450,68 @@ def write_header_xml(
 class _IdGenerator:
     """Thread-safe element ID generator for HWPX elements.
 
-    Each thread gets its own RNG state via threading.local(), so concurrent
-    save() calls in different threads won't corrupt each other's ID sequences.
+    IDs only have to be distinct within a document, so each thread draws a
+    random 9-digit starting point once and then counts up from it; this
+    avoids a Mersenne Twister draw per table cell and subList. Each thread
+    keeps its own counter via threading.local(), so concurrent save() calls
+    in different threads won't corrupt each other's ID sequences.
 
-    Default: random IDs (unique across documents).
-    With seed: deterministic counter (reproducible output).
+    Default: random start (unique-ish across documents).
+    With seed: start derived from the seed (reproducible output).
     """
 
+    # Leave 10**8 IDs of headroom before the counter reaches _ID_MAX; a
+    # long-lived thread that does get there wraps back to _START_MIN.
+    _START_MIN = 100000000
+    _START_MAX = 899999999
+    _ID_MAX = 999999999
+
     def __init__(self):
         self._local = threading.local()
 
-    def _get_rng(self) -> random.Random:
-        """Get the thread-local RNG, creating one if needed."""
-        if not hasattr(self._local, 'rng'):
-            self._local.rng = random.Random()
-        return self._local.rng
+    def _count_from(self, start: int):
+        # A range iterator is as cheap as itertools.count but stops at
+        # _ID_MAX, which next_id turns into the wrap-around.
+        return iter(range(start, self._ID_MAX + 1))
+
+    def _new_counter(self, seed: int = None):
+        if seed is None:
+            # The shared module RNG is fine for a one-off start value and
+            # saves seeding a fresh Mersenne Twister from os.urandom
+            start = random.randint(self._START_MIN, self._START_MAX)
+        else:
+            start = random.Random(seed).randint(self._START_MIN, self._START_MAX)
+        return self._count_from(start)
 
     def set_seed(self, seed: int):
         """Enable deterministic mode with a fixed seed (thread-local)."""
-        self._local.rng = random.Random(seed)
+        self._local.counter = self._new_counter(seed)
 
     def reset(self):
-        """Reset to non-deterministic random mode (thread-local)."""
-        self._local.rng = random.Random()
+        """Reset to non-deterministic random mode (thread-local).
+
+        The new counter is created lazily by next_id, so seeded saves that
+        reset on the way out pay nothing unless more IDs are drawn.
+        """
+        self._local.__dict__.pop('counter', None)
 
     def next_id(self) -> int:
         """Generate the next element ID."""
-        return self._get_rng().randint(100000000, 999999999)
+        try:
+            return next(self._local.counter)
+        except AttributeError:
+            self._local.counter = self._new_counter()
+        except StopIteration:
+            self._local.counter = self._count_from(self._START_MIN)
+        return next(self._local.counter)
+
+    def next_ids(self, n: int) -> range:
+        """Reserve n consecutive element IDs in one step."""
+        start = self.next_id()
+        if start + n - 1 > self._ID_MAX:
+            start = self._START_MIN
+        self._local.counter = self._count_from(start + n)
+        return range(start, start + n)
 
 
 _id_gen = _IdGenerator()
@@ -459,190 +527,313 @@ def reset_id_seed():
     _id_gen.reset()
 
 
-def _unique_id() -> int:
-    """Generate a unique-ish ID for HWPX elements."""
-    return _id_gen.next_id()
+# Generate a unique-ish ID for HWPX elements. Bound straight to the
+# generator's method: it is called per table cell and subList, so the extra
+# wrapper frame showed up in profiles.
+_unique_id = _id_gen.next_id
+# Batch form: one counter update for the n IDs an element needs up front.
+_unique_ids = _id_gen.next_ids
+
+
+# secPr scaffolding around hp:pagePr does not depend on the page setup
+_SEC_PR_HEAD = (
+    f'<hp:secPr xmlns:hp="{NS_HP}" id=""'
+    ' textDirection="HORIZONTAL" spaceColumns="1134"'
+    ' tabStop="8000" tabStopVal="4000" tabStopUnit="HWPUNIT"'
+    ' outlineShapeIDRef="1" memoShapeIDRef="1"'
+    ' textVerticalWidthHead="0" masterPageCnt="0">\n'
+    '        <hp:grid lineGrid="0" charGrid="0" wonggojiFormat="0" />\n'
+    '        <hp:startNum pageStartsOn="BOTH" page="0" pic="0"'
+    ' tbl="0" equation="0" />\n'
+    '        <hp:visibility hideFirstHeader="0" hideFirstFooter="0"'
+    ' hideFirstMasterPage="0" border="SHOW_ALL" fill="SHOW_ALL"'
+    ' hideFirstPageNum="0" hideFirstEmptyLine="0" showLineNumber="0" />\n'
+    '        <hp:lineNumberShape restartType="0" countBy="0"'
+    ' distance="0" startNumber="0" />\n'
+)
+_SEC_PR_TAIL = (
+    '        <hp:footNotePr>\n'
+    '          <hp:autoNumFormat type="DIGIT" userChar=""'
+    ' prefixChar="" suffixChar="" supscript="1" />\n'
+    '          <hp:noteLine length="-1" type="SOLID"'
+    ' width="0.25 mm" color="#000000" />\n'
+    '          <hp:noteSpacing betweenNotes="283"'
+    ' belowLine="0" aboveLine="1000" />\n'
+    '          <hp:numbering type="CONTINUOUS" newNum="1" />\n'
+    '          <hp:placement place="EACH_COLUMN" beneathText="0" />\n'
+    '        </hp:footNotePr>\n'
+    '        <hp:endNotePr>\n'
+    '          <hp:autoNumFormat type="ROMAN_SMALL" userChar=""'
+    ' prefixChar="" suffixChar="" supscript="1" />\n'
+    '          <hp:noteLine length="-1" type="SOLID"'
+    ' width="0.25 mm" color="#000000" />\n'
+    '          <hp:noteSpacing betweenNotes="0"'
+    ' belowLine="0" aboveLine="1000" />\n'
+    '          <hp:numbering type="CONTINUOUS" newNum="1" />\n'
+    '          <hp:placement place="END_OF_DOCUMENT" beneathText="0" />\n'
+    '        </hp:endNotePr>\n'
+    '        <hp:pageBorderFill type="BOTH" borderFillIDRef="1"'
+    ' textBorder="PAPER" headerInside="0" footerInside="0"'
+    ' fillArea="PAPER">\n'
+    '          <hp:offset left="1417" right="1417"'
+    ' top="1417" bottom="1417" />\n'
+    '        </hp:pageBorderFill>\n'
+    '        <hp:pageBorderFill type="EVEN" borderFillIDRef="1"'
+    ' textBorder="PAPER" headerInside="0" footerInside="0"'
+    ' fillArea="PAPER">\n'
+    '          <hp:offset left="1417" right="1417"'
+    ' top="1417" bottom="1417" />\n'
+    '        </hp:pageBorderFill>\n'
+    '        <hp:pageBorderFill type="ODD" borderFillIDRef="1"'
+    ' textBorder="PAPER" headerInside="0" footerInside="0"'
+    ' fillArea="PAPER">\n'
+    '          <hp:offset left="1417" right="1417"'
+    ' top="1417" bottom="1417" />\n'
+    '        </hp:pageBorderFill>\n'
+    '      </hp:secPr>'
+)
 
 
-def write_sec_pr(page_setup: PageSetup = None) -> str:
-    """Write section properties (page setup) - goes in first paragraph's first run."""
-    ps = page_setup or PageSetup()
+def _write_page_pr(ps: PageSetup) -> str:
+    """Write the hp:pagePr element, the only page-setup-dependent part of secPr."""
     return (
-        f'<hp:secPr xmlns:hp="{NS_HP}" id=""'
-        ' textDirection="HORIZONTAL" spaceColumns="1134"'
-        ' tabStop="8000" tabStopVal="4000" tabStopUnit="HWPUNIT"'
-        ' outlineShapeIDRef="1" memoShapeIDRef="1"'
-        ' textVerticalWidthHead="0" masterPageCnt="0">\n'
-        '        <hp:grid lineGrid="0" charGrid="0" wonggojiFormat="0" />\n'
-        '        <hp:startNum pageStartsOn="BOTH" page="0" pic="0"'
-        ' tbl="0" equation="0" />\n'
-        '        <hp:visibility hideFirstHeader="0" hideFirstFooter="0"'
-        ' hideFirstMasterPage="0" border="SHOW_ALL" fill="SHOW_ALL"'
-        ' hideFirstPageNum="0" hideFirstEmptyLine="0" showLineNumber="0" />\n'
-        '        <hp:lineNumberShape restartType="0" countBy="0"'
-        ' distance="0" startNumber="0" />\n'
         f'        <hp:pagePr landscape="{ps.orientation}" width="{ps.width}"'
         f' height="{ps.height}" gutterType="LEFT_ONLY">\n'
         f'          <hp:margin header="{ps.margin_header}" footer="{ps.margin_footer}"'
         f' gutter="{ps.margin_gutter}" left="{ps.margin_left}" right="{ps.margin_right}"'
         f' top="{ps.margin_top}" bottom="{ps.margin_bottom}" />\n'
         '        </hp:pagePr>\n'
-        '        <hp:footNotePr>\n'
-        '          <hp:autoNumFormat type="DIGIT" userChar=""'
-        ' prefixChar="" suffixChar="" supscript="1" />\n'
-        '          <hp:noteLine length="-1" type="SOLID"'
-        ' width="0.25 mm" color="#000000" />\n'
-        '          <hp:noteSpacing betweenNotes="283"'
-        ' belowLine="0" aboveLine="1000" />\n'
-        '          <hp:numbering type="CONTINUOUS" newNum="1" />\n'
-        '          <hp:placement place="EACH_COLUMN" beneathText="0" />\n'
-        '        </hp:footNotePr>\n'
-        '        <hp:endNotePr>\n'
-        '          <hp:autoNumFormat type="ROMAN_SMALL" userChar=""'
-        ' prefixChar="" suffixChar="" supscript="1" />\n'
-        '          <hp:noteLine length="-1" type="SOLID"'
-        ' width="0.25 mm" color="#000000" />\n'
-        '          <hp:noteSpacing betweenNotes="0"'
-        ' belowLine="0" aboveLine="1000" />\n'
-        '          <hp:numbering type="CONTINUOUS" newNum="1" />\n'
-        '          <hp:placement place="END_OF_DOCUMENT" beneathText="0" />\n'
-        '        </hp:endNotePr>\n'
-        '        <hp:pageBorderFill type="BOTH" borderFillIDRef="1"'
-        ' textBorder="PAPER" headerInside="0" footerInside="0"'
-        ' fillArea="PAPER">\n'
-        '          <hp:offset left="1417" right="1417"'
-        ' top="1417" bottom="1417" />\n'
-        '        </hp:pageBorderFill>\n'
-        '        <hp:pageBorderFill type="EVEN" borderFillIDRef="1"'
-        ' textBorder="PAPER" headerInside="0" footerInside="0"'
-        ' fillArea="PAPER">\n'
-        '          <hp:offset left="1417" right="1417"'
-        ' top="1417" bottom="1417" />\n'
-        '        </hp:pageBorderFill>\n'
-        '        <hp:pageBorderFill type="ODD" borderFillIDRef="1"'
-        ' textBorder="PAPER" headerInside="0" footerInside="0"'
-        ' fillArea="PAPER">\n'
-        '          <hp:offset left="1417" right="1417"'
-        ' top="1417" bottom="1417" />\n'
-        '        </hp:pageBorderFill>\n'
-        '      </hp:secPr>'
     )
 
 
-def _write_footnote_ctrl(fn) -> str:
-    """Write a footnote ctrl element."""
-    fn_id = _unique_id()
-    sub_id = _unique_id()
-    parts = [
-        '<hp:ctrl>',
-        f'<hp:footNote id="{fn_id}" number="{fn.number}">',
-        f'<hp:subList id="{sub_id}" textDirection="HORIZONTAL"'
-        ' lineWrap="BREAK" vertAlign="TOP" linkListIDRef="0"'
-        ' linkListNextIDRef="0" textWidth="0" textHeight="0"'
-        ' hasTextRef="0" hasNumRef="0">',
-    ]
+# Documents pass their own (usually default A4) PageSetup instance, so the
+# pre-rendered secPr is matched by value, not just for page_setup=None.
+_DEFAULT_PAGE_SETUP = PageSetup()
+_DEFAULT_SEC_PR = _SEC_PR_HEAD + _write_page_pr(_DEFAULT_PAGE_SETUP) + _SEC_PR_TAIL
+
+
+def write_sec_pr(page_setup: PageSetup = None) -> str:
+    """Write section properties (page setup) - goes in first paragraph's first run."""
+    if page_setup is None or page_setup == _DEFAULT_PAGE_SETUP:
+        return _DEFAULT_SEC_PR
+    return _SEC_PR_HEAD + _write_page_pr(page_setup) + _SEC_PR_TAIL
+
+
+# Notes, headers/footers and table cells all open an identical subList.
+# Container writers emit their opening and closing tags as one fragment
+# each to keep the shared output list short.
+_SUBLIST_OPEN_TMPL = (
+    '<hp:subList id="%s" textDirection="HORIZONTAL"'
+    ' lineWrap="BREAK" vertAlign="TOP" linkListIDRef="0"'
+    ' linkListNextIDRef="0" textWidth="0" textHeight="0"'
+    ' hasTextRef="0" hasNumRef="0">'
+)
+
+
+def _write_footnote_ctrl(out: list, fn) -> None:
+    """Append a footnote ctrl element to out."""
+    fn_id, sub_id = _unique_ids(2)
+    out.append(
+        f'<hp:ctrl><hp:footNote id="{fn_id}" number="{fn.number}">'
+        + _SUBLIST_OPEN_TMPL % sub_id
+    )
     for p in fn.paragraphs:
-        parts.append(write_paragraph(p, is_first=False))
-    parts.append('</hp:subList>')
-    parts.append('</hp:footNote>')
-    parts.append('</hp:ctrl>')
-    return ''.join(parts)
+        _write_paragraph(out, p)
+    out.append('</hp:subList></hp:footNote></hp:ctrl>')
 
 
-def _write_endnote_ctrl(en) -> str:
-    """Write an endnote ctrl element."""
-    en_id = _unique_id()
-    sub_id = _unique_id()
-    parts = [
-        '<hp:ctrl>',
-        f'<hp:endNote id="{en_id}" number="{en.number}">',
-        f'<hp:subList id="{sub_id}" textDirection="HORIZONTAL"'
-        ' lineWrap="BREAK" vertAlign="TOP" linkListIDRef="0"'
-        ' linkListNextIDRef="0" textWidth="0" textHeight="0"'
-        ' hasTextRef="0" hasNumRef="0">',
-    ]
+def _write_endnote_ctrl(out: list, en) -> None:
+    """Append an endnote ctrl element to out."""
+    en_id, sub_id = _unique_ids(2)
+    out.append(
+        f'<hp:ctrl><hp:endNote id="{en_id}" number="{en.number}">'
+        + _SUBLIST_OPEN_TMPL % sub_id
+    )
     for p in en.paragraphs:
-        parts.append(write_paragraph(p, is_first=False))
-    parts.append('</hp:subList>')
-    parts.append('</hp:endNote>')
-    parts.append('</hp:ctrl>')
-    return ''.join(parts)
+        _write_paragraph(out, p)
+    out.append('</hp:subList></hp:endNote></hp:ctrl>')
 
 
-def _write_run(run: Run) -> str:
-    """Write a single run element."""
-    parts = [
-        f'<hp:run charPrIDRef="{run.char_pr_id_ref}">',
-        f'<hp:t>{_esc(run.text)}</hp:t>',
-    ]
+def _write_run_content(out: list, run: Run) -> None:
+    """Append a run's text and any footnote/endnote ctrl to out."""
+    out.append(f'<hp:t>{_esc(run.text)}</hp:t>')
     if run.footnote is not None:
-        parts.append(_write_footnote_ctrl(run.footnote))
+        _write_footnote_ctrl(out, run.footnote)
     if run.endnote is not None:
-        parts.append(_write_endnote_ctrl(run.endnote))
-    parts.append('</hp:run>')
-    return ''.join(parts)
+        _write_endnote_ctrl(out, run.endnote)
+
+
+_PLAIN_RUN_TMPL = '<hp:run charPrIDRef="%s"><hp:t>%s</hp:t></hp:run>'
+
+
+def _write_run(out: list, run: Run) -> None:
+    """Append a single run element to out."""
+    if run.footnote is None and run.endnote is None:
+        # Plain text runs are the overwhelming majority; emit in one piece
+        out.append(_PLAIN_RUN_TMPL % (run.char_pr_id_ref, _esc(run.text)))
+        return
+    out.append(f'<hp:run charPrIDRef="{run.char_pr_id_ref}">')
+    _write_run_content(out, run)
+    out.append('</hp:run>')
+
+
+_LINK_RUNS_TMPL = (
+    # Run 1: fieldBegin
+    '<hp:run charPrIDRef="%(cp)s">'
+    '<hp:ctrl>'
+    '<hp:fieldBegin id="%(fid)s" type="HYPERLINK" name=""'
+    ' editable="0" dirty="1" zorder="-1" fieldid="%(fid2)s">'
+    '<hp:parameters cnt="2" name="">'
+    '<hp:integerParam name="Prop">0</hp:integerParam>'
+    '<hp:stringParam name="Command">%(url)s</hp:stringParam>'
+    '</hp:parameters>'
+    '</hp:fieldBegin>'
+    '</hp:ctrl>'
+    '</hp:run>'
+    # Run 2: link display text
+    f'<hp:run charPrIDRef="{CHARPR_LINK}">'
+    '<hp:t>%(text)s</hp:t>'
+    '</hp:run>'
+    # Run 3: fieldEnd
+    '<hp:run charPrIDRef="%(cp)s">'
+    '<hp:ctrl>'
+    '<hp:fieldEnd beginIDRef="%(fid)s" fieldid="%(fid2)s"/>'
+    '</hp:ctrl>'
+    '</hp:run>'
+)
 
 
-def _write_link_runs(run: Run) -> str:
-    """Write a hyperlink as fieldBegin/fieldEnd runs.
+def _write_link_runs(out: list, run: Run) -> None:
+    """Append a hyperlink as fieldBegin/fieldEnd runs to out.
 
     Generates 3 runs: fieldBegin, link text, fieldEnd.
     """
-    field_id = _unique_id()
-    field_id2 = _unique_id()
-    url = _esc_attr(run.link_url)
-    from .constants import CHARPR_LINK
-
-    parts = [
-        # Run 1: fieldBegin
-        f'<hp:run charPrIDRef="{run.char_pr_id_ref}">',
-        '<hp:ctrl>',
-        f'<hp:fieldBegin id="{field_id}" type="HYPERLINK" name=""'
-        f' editable="0" dirty="1" zorder="-1" fieldid="{field_id2}">',
-        '<hp:parameters cnt="2" name="">',
-        '<hp:integerParam name="Prop">0</hp:integerParam>',
-        f'<hp:stringParam name="Command">{_esc(url)}</hp:stringParam>',
-        '</hp:parameters>',
-        '</hp:fieldBegin>',
-        '</hp:ctrl>',
-        '</hp:run>',
-        # Run 2: link display text
-        f'<hp:run charPrIDRef="{CHARPR_LINK}">',
-        f'<hp:t>{_esc(run.text)}</hp:t>',
-        '</hp:run>',
-        # Run 3: fieldEnd
-        f'<hp:run charPrIDRef="{run.char_pr_id_ref}">',
-        '<hp:ctrl>',
-        f'<hp:fieldEnd beginIDRef="{field_id}" fieldid="{field_id2}"/>',
-        '</hp:ctrl>',
-        '</hp:run>',
-    ]
-    return ''.join(parts)
+    field_id, field_id2 = _unique_ids(2)
+    out.append(_LINK_RUNS_TMPL % {
+        'cp': run.char_pr_id_ref,
+        'fid': field_id,
+        'fid2': field_id2,
+        'url': _esc(run.link_url),
+        'text': _esc(run.text),
+    })
 
 
-def _write_header_footer(tag: str, hf: HeaderFooter) -> str:
-    """Write a header or footer ctrl element.
+def _write_header_footer(out: list, tag: str, hf: HeaderFooter) -> None:
+    """Append a header or footer ctrl element to out.
 
     Args:
+        out: Output fragment list.
         tag: "hp:header" or "hp:footer"
         hf: HeaderFooter object with paragraphs and applyPageType
     """
-    hf_id = _unique_id()
-    sub_id = _unique_id()
-    parts = [
-        f'<hp:ctrl>',
-        f'<{tag} id="{hf_id}" applyPageType="{_esc_attr(hf.apply_page_type)}">',
-        f'<hp:subList id="{sub_id}" textDirection="HORIZONTAL"'
-        f' lineWrap="BREAK" vertAlign="TOP" linkListIDRef="0"'
-        f' linkListNextIDRef="0" textWidth="0" textHeight="0"'
-        f' hasTextRef="0" hasNumRef="0">',
-    ]
+    hf_id, sub_id = _unique_ids(2)
+    out.append(
+        f'<hp:ctrl><{tag} id="{hf_id}"'
+        f' applyPageType="{_esc_attr(hf.apply_page_type)}">'
+        + _SUBLIST_OPEN_TMPL % sub_id
+    )
     for p in hf.paragraphs:
-        parts.append(write_paragraph(p, is_first=False))
-    parts.append('</hp:subList>')
-    parts.append(f'</{tag}>')
-    parts.append('</hp:ctrl>')
-    return ''.join(parts)
+        _write_paragraph(out, p)
+    out.append(f'</hp:subList></{tag}></hp:ctrl>')
+
+
+_FIRST_PARA_CTRL = (
+    '\n      <hp:ctrl xmlns:hp="'
+    + NS_HP + '">\n'
+    '        <hp:colPr id="" type="NEWSPAPER" layout="LEFT"'
+    ' colCount="1" sameSz="1" sameGap="0" />\n'
+    '      </hp:ctrl>\n    '
+)
+
+
+def _write_first_run_inner(out: list, page_setup: PageSetup = None,
+                           header: HeaderFooter = None,
+                           footer: HeaderFooter = None) -> None:
+    """Append the secPr + colPr + header/footer block of a section's first run."""
+    if page_setup is None or page_setup == _DEFAULT_PAGE_SETUP:
+        out.append(_DEFAULT_SEC_PR)
+    else:
+        # Append the secPr pieces as-is rather than concatenating them first
+        out.append(_SEC_PR_HEAD)
+        out.append(_write_page_pr(page_setup))
+        out.append(_SEC_PR_TAIL)
+    out.append(_FIRST_PARA_CTRL)
+    if header:
+        _write_header_footer(out, "hp:header", header)
+    if footer:
+        _write_header_footer(out, "hp:footer", footer)
+
+
+_P_OPEN_TMPL = (
+    '<hp:p paraPrIDRef="%s" styleIDRef="%s"'
+    ' pageBreak="%s" columnBreak="0" merged="0">'
+)
+
+
+_P_SINGLE_RUN_TMPL = _P_OPEN_TMPL + _PLAIN_RUN_TMPL + '</hp:p>'
+
+
+def _write_paragraph(out: list, para: Paragraph, is_first: bool = False,
+                     page_setup: PageSetup = None,
+                     header: HeaderFooter = None,
+                     footer: HeaderFooter = None) -> None:
+    """Append a paragraph element to out (see write_paragraph)."""
+    runs = para.runs
+    pb = "1" if para.page_break else "0"
+
+    if not is_first and len(runs) == 1:
+        run = runs[0]
+        if not run.link_url and run.footnote is None and run.endnote is None:
+            # The dominant case: one plain run, one format
+            out.append(_P_SINGLE_RUN_TMPL % (
+                para.para_pr_id_ref, para.style_id_ref, pb,
+                run.char_pr_id_ref, _esc(run.text),
+            ))
+            return
+
+    p_open = _P_OPEN_TMPL % (para.para_pr_id_ref, para.style_id_ref, pb)
+
+    if not is_first:
+        # Body paragraphs: empty spacers collapse to one fragment, and there
+        # is no section block to interleave with the runs
+        if not runs:
+            out.append(p_open + '</hp:p>')
+            return
+        out.append(p_open)
+        for run in runs:
+            if run.link_url:
+                _write_link_runs(out, run)
+            else:
+                _write_run(out, run)
+        out.append('</hp:p>')
+        return
+
+    out.append(p_open)
+    if not runs:
+        # Empty paragraph (no runs) - still valid
+        out.append('<hp:run charPrIDRef="0">')
+        _write_first_run_inner(out, page_setup, header, footer)
+        out.append('</hp:run>')
+    else:
+        first = runs[0]
+        if first.link_url:
+            # Hyperlink runs use fieldBegin/fieldEnd, so the section block
+            # gets a run of its own in front of them
+            out.append('<hp:run charPrIDRef="0">')
+            _write_first_run_inner(out, page_setup, header, footer)
+            out.append('</hp:run>')
+            _write_link_runs(out, first)
+        else:
+            out.append(f'<hp:run charPrIDRef="{first.char_pr_id_ref}">')
+            _write_first_run_inner(out, page_setup, header, footer)
+            _write_run_content(out, first)
+            out.append('</hp:run>')
+        for run in runs[1:]:
+            if run.link_url:
+                _write_link_runs(out, run)
+            else:
+                _write_run(out, run)
+    out.append('</hp:p>')
 
 
 def write_paragraph(para: Paragraph, is_first: bool = False,
@@ -658,139 +849,126 @@ def write_paragraph(para: Paragraph, is_first: bool = False,
         header: Optional header content (only used when is_first=True).
         footer: Optional footer content (only used when is_first=True).
     """
-    pb = "1" if para.page_break else "0"
-    parts = [
-        f'<hp:p paraPrIDRef="{para.para_pr_id_ref}"'
-        f' styleIDRef="{para.style_id_ref}"'
-        f' pageBreak="{pb}" columnBreak="0" merged="0">'
-    ]
+    out = []
+    _write_paragraph(out, para, is_first, page_setup, header, footer)
+    return ''.join(out)
+
+
+_TBL_OPEN_TMPL = (
+    '<hp:p paraPrIDRef="%s" styleIDRef="%s"'
+    ' pageBreak="0" columnBreak="0" merged="0">'
+    '<hp:run charPrIDRef="0">'
+    '<hp:tbl id="%s" zOrder="0" numberingType="TABLE"'
+    ' textWrap="TOP_AND_BOTTOM" textFlow="BOTH_SIDES"'
+    ' lock="0" dropcapstyle="None" pageBreak="CELL"'
+    ' repeatHeader="1" rowCnt="%s"'
+    ' colCnt="%s" cellSpacing="%s"'
+    ' borderFillIDRef="%s" noAdjust="0">'
+    '<hp:sz width="%s" widthRelTo="ABSOLUTE"'
+    ' height="5000" heightRelTo="ABSOLUTE" protect="0"/>'
+    '<hp:pos treatAsChar="0" affectLSpacing="0" flowWithText="1"'
+    ' allowOverlap="0" holdAnchorAndSO="0" vertRelTo="PARA"'
+    ' horzRelTo="COLUMN" vertAlign="TOP" horzAlign="LEFT"'
+    ' vertOffset="0" horzOffset="0"/>'
+    '<hp:outMargin left="0" right="0" top="0" bottom="1417"/>'
+    '<hp:inMargin left="510" right="510" top="141" bottom="141"/>'
+)
 
-    # Helper: build the secPr + colPr + header/footer block for first run
-    def _first_run_inner():
-        inner = write_sec_pr(page_setup)
-        inner += (
-            '\n      <hp:ctrl xmlns:hp="'
-            + NS_HP + '">\n'
-            '        <hp:colPr id="" type="NEWSPAPER" layout="LEFT"'
-            ' colCount="1" sameSz="1" sameGap="0" />\n'
-            '      </hp:ctrl>\n    '
-        )
-        if header:
-            inner += _write_header_footer("hp:header", header)
-        if footer:
-            inner += _write_header_footer("hp:footer", footer)
-        return inner
-
-    for i, run in enumerate(para.runs):
-        # Hyperlink runs use fieldBegin/fieldEnd pattern
-        if run.link_url:
-            if is_first and i == 0:
-                run_start = '<hp:run charPrIDRef="0">'
-                parts.append(run_start + _first_run_inner() + '</hp:run>')
-            parts.append(_write_link_runs(run))
-            continue
-
-        run_start = f'<hp:run charPrIDRef="{run.char_pr_id_ref}">'
-        inner = ""
-        if is_first and i == 0:
-            inner += _first_run_inner()
-        inner += f'<hp:t>{_esc(run.text)}</hp:t>'
-        if run.footnote is not None:
-            inner += _write_footnote_ctrl(run.footnote)
-        if run.endnote is not None:
-            inner += _write_endnote_ctrl(run.endnote)
-        parts.append(run_start + inner + '</hp:run>')
-
-    # Empty paragraph (no runs) - still valid
-    if not para.runs:
-        if is_first:
-            run_start = '<hp:run charPrIDRef="0">'
-            parts.append(run_start + _first_run_inner() + '</hp:run>')
-
-    parts.append('</hp:p>')
-    return ''.join(parts)
+# Table cells are the hottest path in large documents, so their constant
+# scaffolding is kept in %-templates rather than rebuilt per cell.
+_TC_OPEN_TMPL = (
+    '<hp:tc name="" header="%s" hasMargin="0"'
+    ' protect="0" editable="0" dirty="0"'
+    ' borderFillIDRef="%s">'
+) + _SUBLIST_OPEN_TMPL
+
+_TC_CLOSE_TMPL = (
+    '</hp:subList>'
+    '<hp:cellAddr colAddr="%s" rowAddr="%s"/>'
+    '<hp:cellSpan colSpan="%s" rowSpan="%s"/>'
+    '<hp:cellSz width="%s" height="%s"/>'
+    '<hp:cellMargin left="510" right="510" top="141" bottom="141"/>'
+    '</hp:tc>'
+)
 
 
-def write_table_paragraph(table: Table, para_pr_id_ref: int = 0,
-                          style_id_ref: int = 0) -> str:
-    """Write a table wrapped in a paragraph."""
-    tbl_id = _unique_id()
-    total_width = table.width
+# The typical cell holds one paragraph with one plain run; it is rendered
+# with a single format instead of open/paragraph/run/close fragments.
+_TC_SIMPLE_TMPL = (
+    _TC_OPEN_TMPL + _P_OPEN_TMPL + _PLAIN_RUN_TMPL + '</hp:p>' + _TC_CLOSE_TMPL
+)
 
-    parts = [
-        f'<hp:p paraPrIDRef="{para_pr_id_ref}"'
-        f' styleIDRef="{style_id_ref}"'
-        ' pageBreak="0" columnBreak="0" merged="0">',
-        f'<hp:run charPrIDRef="0">',
-        f'<hp:tbl id="{tbl_id}" zOrder="0" numberingType="TABLE"'
-        f' textWrap="TOP_AND_BOTTOM" textFlow="BOTH_SIDES"'
-        f' lock="0" dropcapstyle="None" pageBreak="CELL"'
-        f' repeatHeader="1" rowCnt="{table.row_cnt}"'
-        f' colCnt="{table.col_cnt}" cellSpacing="{table.cell_spacing}"'
-        f' borderFillIDRef="{table.border_fill_id_ref}" noAdjust="0">',
-        f'<hp:sz width="{total_width}" widthRelTo="ABSOLUTE"'
-        f' height="5000" heightRelTo="ABSOLUTE" protect="0"/>',
-        '<hp:pos treatAsChar="0" affectLSpacing="0" flowWithText="1"'
-        ' allowOverlap="0" holdAnchorAndSO="0" vertRelTo="PARA"'
-        ' horzRelTo="COLUMN" vertAlign="TOP" horzAlign="LEFT"'
-        ' vertOffset="0" horzOffset="0"/>',
-        '<hp:outMargin left="0" right="0" top="0" bottom="1417"/>',
-        '<hp:inMargin left="510" right="510" top="141" bottom="141"/>',
-    ]
 
+def _write_table_paragraph(out: list, table: Table, para_pr_id_ref: int = 0,
+                           style_id_ref: int = 0) -> None:
+    """Append a table wrapped in a paragraph to out."""
+    # One ID for the table plus one per cell subList, reserved up front
+    ids = iter(_unique_ids(
+        1 + sum(len(row.cells) for row in table.rows)))
+    out.append(_TBL_OPEN_TMPL % (
+        para_pr_id_ref, style_id_ref, next(ids), table.row_cnt,
+        table.col_cnt, table.cell_spacing, table.border_fill_id_ref,
+        table.width,
+    ))
+
+    # Module globals used per cell are bound to locals for the loop
+    append = out.append
+    write_para = _write_paragraph
+    next_id = ids.__next__
+    tc_open = _TC_OPEN_TMPL
+    tc_close = _TC_CLOSE_TMPL
+    tc_simple = _TC_SIMPLE_TMPL
+    esc = _esc
     for row in table.rows:
-        parts.append('<hp:tr>')
+        append('<hp:tr>')
         for cell in row.cells:
-            sub_id = _unique_id()
-            parts.append(
-                f'<hp:tc name="" header="{cell.header}" hasMargin="0"'
-                f' protect="0" editable="0" dirty="0"'
-                f' borderFillIDRef="{cell.border_fill_id_ref}">'
-            )
-            parts.append(
-                f'<hp:subList id="{sub_id}" textDirection="HORIZONTAL"'
-                f' lineWrap="BREAK" vertAlign="TOP" linkListIDRef="0"'
-                f' linkListNextIDRef="0" textWidth="0" textHeight="0"'
-                f' hasTextRef="0" hasNumRef="0">'
-            )
+            paras = cell.paragraphs
+            if len(paras) == 1:
+                p = paras[0]
+                runs = p.runs
+                if len(runs) == 1:
+                    run = runs[0]
+                    if (not run.link_url and run.footnote is None
+                            and run.endnote is None):
+                        append(tc_simple % (
+                            cell.header, cell.border_fill_id_ref, next_id(),
+                            p.para_pr_id_ref, p.style_id_ref,
+                            "1" if p.page_break else "0",
+                            run.char_pr_id_ref, esc(run.text),
+                            cell.col_addr, cell.row_addr,
+                            cell.col_span, cell.row_span,
+                            cell.width, cell.height,
+                        ))
+                        continue
+            append(tc_open % (cell.header, cell.border_fill_id_ref, next_id()))
             for p in cell.paragraphs:
-                parts.append(write_paragraph(p, is_first=False))
-            parts.append('</hp:subList>')
-            parts.append(
-                f'<hp:cellAddr colAddr="{cell.col_addr}"'
-                f' rowAddr="{cell.row_addr}"/>'
-            )
-            parts.append(
-                f'<hp:cellSpan colSpan="{cell.col_span}"'
-                f' rowSpan="{cell.row_span}"/>'
-            )
-            parts.append(
-                f'<hp:cellSz width="{cell.width}"'
-                f' height="{cell.height}"/>'
-            )
-            parts.append(
-                '<hp:cellMargin left="510" right="510"'
-                ' top="141" bottom="141"/>'
-            )
-            parts.append('</hp:tc>')
-        parts.append('</hp:tr>')
+                write_para(out, p)
+            append(tc_close % (
+                cell.col_addr, cell.row_addr, cell.col_span, cell.row_span,
+                cell.width, cell.height))
+        append('</hp:tr>')
 
-    parts.append('</hp:tbl>')
-    parts.append('</hp:run>')
-    parts.append('</hp:p>')
-    return ''.join(parts)
+    out.append('</hp:tbl></hp:run></hp:p>')
 
 
-def write_image_paragraph(image: Image, para_pr_id_ref: int = 0,
+def write_table_paragraph(table: Table, para_pr_id_ref: int = 0,
                           style_id_ref: int = 0) -> str:
-    """Write an image wrapped in a paragraph."""
-    pic_id = _unique_id()
+    """Write a table wrapped in a paragraph."""
+    out = []
+    _write_table_paragraph(out, table, para_pr_id_ref, style_id_ref)
+    return ''.join(out)
+
+
+def _write_image_paragraph(out: list, image: Image, para_pr_id_ref: int = 0,
+                           style_id_ref: int = 0) -> None:
+    """Append an image wrapped in a paragraph to out."""
+    pic_id, inst_id = _unique_ids(2)
     w = image.width
     h = image.height
     cx = w // 2
     cy = h // 2
 
-    parts = [
+    out.extend([
         f'<hp:p paraPrIDRef="{para_pr_id_ref}"'
         f' styleIDRef="{style_id_ref}"'
         ' pageBreak="0" columnBreak="0" merged="0">',
@@ -798,7 +976,7 @@ def write_image_paragraph(image: Image, para_pr_id_ref: int = 0,
         f'<hp:pic id="{pic_id}" zOrder="0" numberingType="PICTURE"'
         ' textWrap="TOP_AND_BOTTOM" textFlow="BOTH_SIDES"'
         ' lock="0" dropcapstyle="None"'
-        f' href="" groupLevel="0" instid="{_unique_id()}" reverse="0">',
+        f' href="" groupLevel="0" instid="{inst_id}" reverse="0">',
         '<hp:offset x="0" y="0"/>',
         f'<hp:orgSz width="{w}" height="{h}"/>',
         '<hp:curSz width="0" height="0"/>',
@@ -828,12 +1006,61 @@ def write_image_paragraph(image: Image, para_pr_id_ref: int = 0,
         ' horzRelTo="COLUMN" vertAlign="TOP" horzAlign="LEFT"'
         ' vertOffset="0" horzOffset="0"/>',
         '<hp:outMargin left="0" right="0" top="0" bottom="0"/>',
-        '</hp:pic>',
-        '<hp:t/>',
-        '</hp:run>',
-        '</hp:p>',
-    ]
-    return ''.join(parts)
+        '</hp:pic><hp:t/></hp:run></hp:p>',
+    ])
+
+
+def write_image_paragraph(image: Image, para_pr_id_ref: int = 0,
+                          style_id_ref: int = 0) -> str:
+    """Write an image wrapped in a paragraph."""
+    out = []
+    _write_image_paragraph(out, image, para_pr_id_ref, style_id_ref)
+    return ''.join(out)
+
+
+class _StreamSink:
+    """Adapt a text stream to the append/extend interface the emitters use."""
+
+    __slots__ = ('append', 'extend')
+
+    def __init__(self, stream):
+        self.append = stream.write
+        self.extend = stream.writelines
+
+
+def _write_section(out: list, elements: list, first_para_idx: int,
+                   page_setup: PageSetup, header: HeaderFooter,
+                   footer: HeaderFooter):
+    out.append('<?xml version="1.0" encoding="utf-8"?>\n')
+    out.append(f'<hs:sec xmlns:hp="{NS_HP}" xmlns:hs="{NS_HS}"'
+               f' xmlns:hc="{NS_HC}">')
+
+    for i, elem in enumerate(elements):
+        is_first = (i == first_para_idx)
+        if elem[0] == "paragraph":
+            out.append('\n')
+            _write_paragraph(
+                out, elem[1], is_first=is_first, page_setup=page_setup,
+                header=header if is_first else None,
+                footer=footer if is_first else None,
+            )
+        elif elem[0] in ("table", "image"):
+            ppr = elem[2] if len(elem) > 2 else 0
+            sidr = elem[3] if len(elem) > 3 else 0
+            out.append('\n')
+            if is_first:
+                empty_para = Paragraph(runs=[], para_pr_id_ref=0, style_id_ref=0)
+                _write_paragraph(
+                    out, empty_para, is_first=True, page_setup=page_setup,
+                    header=header, footer=footer,
+                )
+                out.append('\n')
+            if elem[0] == "table":
+                _write_table_paragraph(out, elem[1], ppr, sidr)
+            else:
+                _write_image_paragraph(out, elem[1], ppr, sidr)
+
+    out.append('\n</hs:sec>')
 
 
 def write_section_xml(elements: list, first_para_idx: int = 0,
@@ -849,46 +1076,19 @@ def write_section_xml(elements: list, first_para_idx: int = 0,
     header: Optional HeaderFooter for page header.
     footer: Optional HeaderFooter for page footer.
     """
-    lines = [
-        '<?xml version="1.0" encoding="utf-8"?>',
-        f'<hs:sec xmlns:hp="{NS_HP}" xmlns:hs="{NS_HS}"'
-        f' xmlns:hc="{NS_HC}">',
-    ]
+    out = []
+    _write_section(out, elements, first_para_idx, page_setup, header, footer)
+    return ''.join(out)
 
-    for i, elem in enumerate(elements):
-        is_first = (i == first_para_idx)
-        if elem[0] == "paragraph":
-            lines.append(write_paragraph(
-                elem[1], is_first=is_first, page_setup=page_setup,
-                header=header if is_first else None,
-                footer=footer if is_first else None,
-            ))
-        elif elem[0] == "table":
-            tbl = elem[1]
-            ppr = elem[2] if len(elem) > 2 else 0
-            sidr = elem[3] if len(elem) > 3 else 0
-            if is_first:
-                empty_para = Paragraph(runs=[], para_pr_id_ref=0, style_id_ref=0)
-                lines.append(write_paragraph(
-                    empty_para, is_first=True, page_setup=page_setup,
-                    header=header, footer=footer,
-                ))
-                lines.append(write_table_paragraph(tbl, ppr, sidr))
-            else:
-                lines.append(write_table_paragraph(tbl, ppr, sidr))
-        elif elem[0] == "image":
-            img = elem[1]
-            ppr = elem[2] if len(elem) > 2 else 0
-            sidr = elem[3] if len(elem) > 3 else 0
-            if is_first:
-                empty_para = Paragraph(runs=[], para_pr_id_ref=0, style_id_ref=0)
-                lines.append(write_paragraph(
-                    empty_para, is_first=True, page_setup=page_setup,
-                    header=header, footer=footer,
-                ))
-                lines.append(write_image_paragraph(img, ppr, sidr))
-            else:
-                lines.append(write_image_paragraph(img, ppr, sidr))
 
-    lines.append('</hs:sec>')
-    return '\n'.join(lines)
+def stream_section_xml(stream, elements: list, first_para_idx: int = 0,
+                       page_setup: PageSetup = None,
+                       header: HeaderFooter = None,
+                       footer: HeaderFooter = None):
+    """Write the section XML to a text stream fragment by fragment.
+
+    Same output as write_section_xml(), but the document is never held
+    as one string, so a large section costs only the stream's buffer.
+    """
+    _write_section(_StreamSink(stream), elements, first_para_idx,
+                   page_setup, header, footer)
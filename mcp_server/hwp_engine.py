@@ -4,6 +4,7 @@ Converts Markdown AST (from md_parser) to native HWP documents
 using pyhwpx COM automation. Provides singleton HWP instance management.
 """
 import os
+import time
 import atexit
 
 from converters.md_parser import (
@@ -23,17 +24,27 @@ class HwpEngine:
     """Singleton pyhwpx wrapper for MD-to-HWP conversion."""
 
     _hwp = None
+    _last_health_check = 0.0
+    _HEALTH_TTL = 5.0  # seconds between COM health checks
 
     @classmethod
     def get_hwp(cls):
-        """Get or create the HWP COM instance (lazy singleton)."""
+        """Get or create the HWP COM instance (lazy singleton).
+
+        The .Version health check is a COM round trip, so it is only repeated
+        once _HEALTH_TTL has passed (e.g. not per file in convert_all_md).
+        """
+        now = time.monotonic()
         if cls._hwp is None:
             cls._hwp = cls._create_hwp()
-        else:
+        elif now - cls._last_health_check >= cls._HEALTH_TTL:
             try:
                 _ = cls._hwp.Version  # health check
             except Exception:
                 cls._hwp = cls._create_hwp()
+        else:
+            return cls._hwp
+        cls._last_health_check = now
         return cls._hwp
 
     @classmethod
@@ -181,16 +192,25 @@ def _table(hwp, node):
     # Build flat (text, is_header) list for all cells
     cells = [(h, True) for h in node.headers]
     for row in node.rows:
-        padded = (row + [''] * num_cols)[:num_cols]
-        cells.extend((c, False) for c in padded)
-
+        cells.extend((c, False) for c in row[:num_cols])
+        if len(row) < num_cols:
+            cells.extend([('', False)] * (num_cols - len(row)))
+
+    # Each COM call is a marshalled round trip. The caret picks up the new
+    # cell's own char shape after TableRightCell, so the font still has to
+    # be set per cell, but empty (e.g. padded) cells need neither call.
+    # Dispatch attributes on the COM wrapper are resolved once, not per cell.
+    set_font = hwp.set_font
+    insert_text = hwp.insert_text
+    run_cmd = hwp.Run
+    last = len(cells) - 1
     for i, (text, is_header) in enumerate(cells):
-        hwp.set_font(FaceName=DEFAULT_FONT, Height=BODY_SIZE,
-                      Bold=is_header, Italic=False, TextColor=0)
         if text:
-            hwp.insert_text(str(text))
-        if i < len(cells) - 1:
-            hwp.Run("TableRightCell")
+            set_font(FaceName=DEFAULT_FONT, Height=BODY_SIZE,
+                     Bold=is_header, Italic=False, TextColor=0)
+            insert_text(str(text))
+        if i < last:
+            run_cmd("TableRightCell")
 
     # Exit table → document level
     _reset_font(hwp)
@@ -6,14 +6,30 @@ Fallback to pyhwpx COM automation only for open_in_hwp on Windows.
 Run: python mcp_server/server.py
 Or register: claude mcp add --transport stdio hwpxlib -- python mcp_server/server.py
 """
+import asyncio
+import functools
+import multiprocessing
 import os
 import sys
+import threading
 import zipfile
 import xml.etree.ElementTree as ET
 
 # Allowed file extensions for document operations
-_DOCUMENT_EXTENSIONS = {'.hwp', '.hwpx', '.hwt'}
-_INPUT_EXTENSIONS = {'.md', '.txt'}
+_DOCUMENT_EXTENSIONS = frozenset({'.hwp', '.hwpx', '.hwt'})
+_INPUT_EXTENSIONS = frozenset({'.md', '.txt'})
+_DOCUMENT_EXTENSIONS_MSG = ', '.join(sorted(_DOCUMENT_EXTENSIONS))
+# str.endswith takes a tuple of suffixes and checks them in C
+_DOCUMENT_SUFFIXES = tuple(sorted(_DOCUMENT_EXTENSIONS))
+
+
+def _has_document_extension(abspath: str) -> bool:
+    if not abspath.lower().endswith(_DOCUMENT_SUFFIXES):
+        return False
+    # Like os.path.splitext, leading dots belong to the stem, so a bare
+    # '.hwpx' (or '..hwpx') has no extension at all.
+    name = abspath.rpartition(os.sep)[2]
+    return '.' in name.lstrip('.')
 
 
 def _validate_document_path(path: str) -> str:
@@ -22,11 +38,11 @@ def _validate_document_path(path: str) -> str:
     Returns the absolute path if valid, raises ValueError otherwise.
     """
     abspath = os.path.abspath(path)
-    ext = os.path.splitext(abspath)[1].lower()
-    if ext not in _DOCUMENT_EXTENSIONS:
+    if not _has_document_extension(abspath):
+        ext = os.path.splitext(abspath)[1].lower()
         raise ValueError(
             f"파일 확장자가 올바르지 않습니다: {ext!r}. "
-            f"허용: {', '.join(sorted(_DOCUMENT_EXTENSIONS))}"
+            f"허용: {_DOCUMENT_EXTENSIONS_MSG}"
         )
     return abspath
 
@@ -37,11 +53,11 @@ def _validate_output_path(path: str) -> str:
     Returns the absolute path if valid, raises ValueError otherwise.
     """
     abspath = os.path.abspath(path)
-    ext = os.path.splitext(abspath)[1].lower()
-    if ext not in _DOCUMENT_EXTENSIONS:
+    if not _has_document_extension(abspath):
+        ext = os.path.splitext(abspath)[1].lower()
         raise ValueError(
             f"출력 파일 확장자가 올바르지 않습니다: {ext!r}. "
-            f"허용: {', '.join(sorted(_DOCUMENT_EXTENSIONS))}"
+            f"허용: {_DOCUMENT_EXTENSIONS_MSG}"
         )
     return abspath
 
@@ -59,7 +75,7 @@ mcp = FastMCP("hwpxlib")
 # === Conversion Tools (hwpxlib core — cross-platform) ===
 
 @mcp.tool()
-def convert_md_to_hwpx(md_path: str, output_path: str = "") -> str:
+async def convert_md_to_hwpx(md_path: str, output_path: str = "") -> str:
     """Markdown 파일을 HWPX(한글) 문서로 변환합니다.
 
     Args:
@@ -81,65 +97,137 @@ def convert_md_to_hwpx(md_path: str, output_path: str = "") -> str:
 
     try:
         output_path = _validate_output_path(output_path)
-        result = convert_md_file(md_path, output_path)
+        result = await asyncio.to_thread(convert_md_file, md_path, output_path)
         return f"변환 완료: {result}"
     except (ValueError, Exception) as e:
         return f"변환 실패: {e}"
 
 
+def _convert_one_md(md_path: str) -> str:
+    """Convert one .md file next to itself; worker for convert_all_md."""
+    from converters.md2hwpx import convert_md_file
+
+    out_path = os.path.splitext(md_path)[0] + ".hwpx"
+    try:
+        convert_md_file(md_path, out_path)
+        return f"OK: {os.path.basename(out_path)}"
+    except Exception as e:
+        return f"FAIL: {os.path.basename(md_path)} - {e}"
+
+
 @mcp.tool()
-def convert_all_md(directory: str) -> str:
+async def convert_all_md(directory: str) -> str:
     """디렉토리 내 모든 .md 파일을 .hwpx로 일괄 변환합니다.
 
     Args:
         directory: .md 파일이 있는 디렉토리 절대 경로
     """
-    import glob as globmod
-    from converters.md2hwpx import convert_md_file
+    return await asyncio.to_thread(_convert_all_md, directory)
+
+
+_md_pool = None
+_md_pool_lock = threading.Lock()
+
+
+def _get_md_pool():
+    """Return the server-wide conversion pool, starting it on first use.
+
+    Workers are spawned rather than forked: this process already runs the
+    event loop, the default executor and the COM thread, and a forked child
+    can inherit a lock one of them was holding. Spawning is slow, so the
+    pool is kept for the server's lifetime instead of per call.
+    """
+    global _md_pool
+    from concurrent.futures import ProcessPoolExecutor
+
+    with _md_pool_lock:
+        if _md_pool is None:
+            _md_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _md_pool
+
+
+def _drop_md_pool(pool) -> None:
+    """Forget a broken pool so the next _get_md_pool() starts a fresh one."""
+    global _md_pool
+    with _md_pool_lock:
+        if _md_pool is pool:
+            _md_pool = None
+    pool.shutdown(wait=False)
+
+
+def _convert_all_md(directory: str) -> str:
+    from concurrent.futures.process import BrokenProcessPool
 
     if not os.path.isdir(directory):
         return f"Error: directory not found: {directory}"
 
-    md_files = globmod.glob(os.path.join(directory, "*.md"))
+    # Directory order is fine here: the tool returns one block of results,
+    # unlike the CLI's human-facing listing, which stays sorted.
+    with os.scandir(directory) as it:
+        md_files = [e.path for e in it
+                    if e.name.endswith(".md") and not e.name.startswith(".")
+                    and e.is_file()]
     if not md_files:
         return f"변환할 .md 파일이 없습니다: {directory}"
 
-    results = []
-    for md_path in sorted(md_files):
-        out_path = os.path.splitext(md_path)[0] + ".hwpx"
-        try:
-            convert_md_file(md_path, out_path)
-            results.append(f"OK: {os.path.basename(out_path)}")
-        except Exception as e:
-            results.append(f"FAIL: {os.path.basename(md_path)} - {e}")
+    # Conversion is pure-Python CPU work (no COM), so fan out over processes;
+    # a single file isn't worth a pool's startup cost.
+    if len(md_files) == 1:
+        results = [_convert_one_md(md_files[0])]
+    else:
+        results = []
+        pending = md_files
+        # If a worker dies, the files not yet converted get one more try on
+        # a fresh pool; whatever still fails is reported per file.
+        for _attempt in range(2):
+            pool = _get_md_pool()
+            try:
+                for result in pool.map(_convert_one_md, pending):
+                    results.append(result)
+            except BrokenProcessPool:
+                _drop_md_pool(pool)
+                pending = md_files[len(results):]
+            else:
+                pending = []
+                break
+        results.extend(
+            f"FAIL: {os.path.basename(path)} - worker process crashed"
+            for path in pending)
 
     return f"{len(md_files)}개 파일 변환 완료:\n" + "\n".join(results)
 
 
 # === Document Creation Tools ===
 
+def _create_document(md_content: str, output_path: str):
+    from converters.md2hwpx import convert_md_to_hwpx
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    doc = convert_md_to_hwpx(md_content)
+    doc.save(output_path)
+
+
 @mcp.tool()
-def create_document_from_md(md_content: str, output_path: str) -> str:
+async def create_document_from_md(md_content: str, output_path: str) -> str:
     """Markdown 텍스트로 HWPX 문서를 직접 생성합니다.
 
     Args:
         md_content: Markdown 형식의 텍스트 내용
         output_path: 출력 .hwpx 파일의 절대 경로
     """
-    from converters.md2hwpx import convert_md_to_hwpx
-
     try:
         output_path = _validate_output_path(output_path)
-        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
-        doc = convert_md_to_hwpx(md_content)
-        doc.save(output_path)
+        await asyncio.to_thread(_create_document, md_content, output_path)
         return f"문서 생성 완료: {os.path.abspath(output_path)}"
     except (ValueError, Exception) as e:
         return f"문서 생성 실패: {e}"
 
 
 @mcp.tool()
-def open_in_hwp(file_path: str) -> str:
+async def open_in_hwp(file_path: str) -> str:
     """한글에서 파일을 열어 편집 가능 상태로 만듭니다.
 
     Args:
@@ -150,7 +238,7 @@ def open_in_hwp(file_path: str) -> str:
 
     try:
         validated_path = _validate_document_path(file_path)
-        os.startfile(validated_path)
+        await asyncio.to_thread(os.startfile, validated_path)
         return f"한글에서 열림: {validated_path}"
     except (ValueError, Exception) as e:
         return f"열기 실패: {e}"
@@ -158,9 +246,55 @@ def open_in_hwp(file_path: str) -> str:
 
 # === Document Reading Tools ===
 
+_engine = None
+_com_executor = None
+
+
+def _get_engine():
+    """Return the HwpEngine class, importing it on first use."""
+    global _engine
+    if _engine is None:
+        from mcp_server.hwp_engine import HwpEngine
+        _engine = HwpEngine
+    return _engine
+
+
+def _com_thread_init():
+    try:
+        import pythoncom
+    except ImportError:
+        return
+    pythoncom.CoInitialize()
+
+
+async def _run_com(fn, *args):
+    """Run a HwpEngine call off the event loop.
+
+    The HWP COM instance is bound to the apartment of the thread that
+    created it, so engine calls share one dedicated worker thread instead
+    of asyncio's default pool.
+    """
+    global _com_executor
+    if _com_executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _com_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="hwp-com",
+            initializer=_com_thread_init,
+        )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_com_executor, fn, *args)
+
+_HP_T_TAG = "{http://www.hancom.co.kr/hwpml/2011/paragraph}t"
+
+
 def _extract_text_from_hwpx(hwpx_path: str) -> str:
-    """Extract plain text from a HWPX file by parsing section XML."""
-    ns = {"hp": "http://www.hancom.co.kr/hwpml/2011/paragraph"}
+    """Extract plain text from a HWPX file by parsing section XML.
+
+    Sections are streamed with iterparse: each element is cleared once
+    closed, and each finished top-level paragraph is detached from the
+    section root. Memory is therefore bounded by the largest top-level
+    paragraph (e.g. one holding a big table), not by the section size.
+    """
     texts = []
 
     with zipfile.ZipFile(hwpx_path, 'r') as zf:
@@ -170,17 +304,50 @@ def _extract_text_from_hwpx(hwpx_path: str) -> str:
             if n.startswith("Contents/section") and n.endswith(".xml")
         )
         for section_file in section_files:
-            xml_data = zf.read(section_file).decode("utf-8")
-            root = ET.fromstring(xml_data)
-            for t_elem in root.iter(f"{{{ns['hp']}}}t"):
-                if t_elem.text:
-                    texts.append(t_elem.text)
+            with zf.open(section_file) as f:
+                root = None
+                depth = 0
+                for event, elem in ET.iterparse(f, events=("start", "end")):
+                    if event == "start":
+                        if root is None:
+                            root = elem
+                        depth += 1
+                        continue
+                    depth -= 1
+                    if elem.tag == _HP_T_TAG and elem.text:
+                        texts.append(elem.text)
+                    elem.clear()
+                    # clear() leaves the emptied element attached to its
+                    # parent; drop finished children of the root as well
+                    if depth == 1:
+                        root.clear()
 
     return "\n".join(texts)
 
 
+# Reads are keyed on (path, mtime_ns, size), so asking for the same unchanged
+# document again skips the unzip/parse (or the COM round trip for .hwp),
+# while any rewrite of the file misses the cache.
+@functools.lru_cache(maxsize=32)
+def _read_hwpx_cached(path: str, mtime_ns: int, size: int) -> str:
+    return _extract_text_from_hwpx(path)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_hwp_cached(path: str, mtime_ns: int, size: int) -> str:
+    return _get_engine().read_document(path)
+
+
+def _text_or_empty_marker(text: str) -> str:
+    # isspace() stops at the first visible character, whereas strip() would
+    # copy a whole multi-MB document just to test it for emptiness.
+    if not text or text.isspace():
+        return "(빈 문서)"
+    return text
+
+
 @mcp.tool()
-def read_hwpx(hwpx_path: str) -> str:
+async def read_hwpx(hwpx_path: str) -> str:
     """HWPX/HWP 문서의 텍스트 내용을 읽어서 반환합니다.
 
     Args:
@@ -192,21 +359,36 @@ def read_hwpx(hwpx_path: str) -> str:
     try:
         validated_path = _validate_document_path(hwpx_path)
         ext = os.path.splitext(validated_path)[1].lower()
+        st = os.stat(validated_path)
+        key = (validated_path, st.st_mtime_ns, st.st_size)
 
         if ext == '.hwpx':
-            text = _extract_text_from_hwpx(validated_path)
-            return text if text.strip() else "(빈 문서)"
+            text = await asyncio.to_thread(_read_hwpx_cached, *key)
+            return _text_or_empty_marker(text)
         else:
             # .hwp (binary format) — try pyhwpx if available
             try:
-                from mcp_server.hwp_engine import HwpEngine
-                text = HwpEngine.read_document(validated_path)
-                return text if text.strip() else "(빈 문서)"
+                text = await _run_com(_read_hwp_cached, *key)
+                return _text_or_empty_marker(text)
             except ImportError:
                 return "Error: .hwp 바이너리 형식은 pyhwpx가 필요합니다 (Windows 전용)"
     except (ValueError, Exception) as e:
         return f"읽기 실패: {e}"
 
 
+def _warm_imports():
+    """Import the converter and engine before serving.
+
+    The tools import these lazily so the module stays cheap to load, but
+    the first call over stdio should not stall on hwpxlib's import time.
+    """
+    import converters.md2hwpx  # noqa: F401
+    try:
+        _get_engine()
+    except ImportError:
+        pass
+
+
 if __name__ == "__main__":
+    _warm_imports()
     mcp.run(transport="stdio")
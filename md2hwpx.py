@@ -10,7 +10,17 @@ Usage:
 import argparse
 import os
 import sys
-import glob
+
+
+def _convert_one(md_path):
+    """Convert one .md file next to itself; worker for --all mode."""
+    from converters.md2hwpx import convert_md_file
+
+    try:
+        result = convert_md_file(md_path)
+        return f"  OK: {os.path.basename(result)}"
+    except Exception as e:
+        return f"  FAIL: {os.path.basename(md_path)} - {e}"
 
 
 def main():
@@ -36,20 +46,31 @@ def main():
     if args.all:
         # Convert all .md files in directory
         md_dir = os.path.abspath(args.dir)
-        md_files = glob.glob(os.path.join(md_dir, "*.md"))
+        md_files = []
+        if os.path.isdir(md_dir):
+            with os.scandir(md_dir) as it:
+                md_files = sorted(e.path for e in it
+                                  if e.name.endswith(".md") and not e.name.startswith(".")
+                                  and e.is_file())
         if not md_files:
             print(f"No .md files found in {md_dir}")
             return 1
 
         print(f"Converting {len(md_files)} files in {md_dir}...")
-        for md_path in sorted(md_files):
-            try:
-                result = convert_md_file(md_path)
-                basename = os.path.basename(result)
-                print(f"  OK: {basename}")
-            except Exception as e:
-                basename = os.path.basename(md_path)
-                print(f"  FAIL: {basename} - {e}")
+        # Same fan-out as the MCP convert_all_md tool: conversion is CPU
+        # bound, so threads would just queue on the GIL.
+        if len(md_files) == 1:
+            print(_convert_one(md_files[0]))
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            workers = min(len(md_files), os.cpu_count() or 1)
+            # Each worker reads its own files, so disk reads already overlap
+            # with other workers' conversions. Batching cuts the per-file
+            # IPC round trip, and results print as soon as they are in order.
+            chunksize = max(1, len(md_files) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                for line in ex.map(_convert_one, md_files, chunksize=chunksize):
+                    print(line, flush=True)
 
         print("Done.")
         return 0
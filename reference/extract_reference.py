@@ -7,8 +7,10 @@ Extracts all XML/text files from the two reference HWPX files into
 reference/extracted/colorlight/ and reference/extracted/patent/.
 """
 import os
+import shutil
 import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent
@@ -21,6 +23,10 @@ REFERENCES = {
 
 OUTPUT_BASE = SCRIPT_DIR / "extracted"
 
+# Entries larger than this (embedded images, mostly) are copied straight
+# from the archive to disk in chunks instead of being held in memory.
+STREAM_THRESHOLD = 1 << 20
+
 
 def extract_hwpx(name: str, hwpx_path: Path):
     """Extract all entries from an HWPX (ZIP) file."""
@@ -31,24 +37,36 @@ def extract_hwpx(name: str, hwpx_path: Path):
         print(f"[SKIP] {hwpx_path} not found")
         return
 
-    with zipfile.ZipFile(hwpx_path, "r") as zf:
-        for entry in zf.namelist():
-            data = zf.read(entry)
-            dest = out_dir / entry
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            dest.write_bytes(data)
-            print(f"  {entry} ({len(data)} bytes)")
-
-        # Also write ZIP entry metadata
-        meta_lines = []
+    meta_path = out_dir / "_zip_metadata.txt"
+    with zipfile.ZipFile(hwpx_path, "r") as zf, \
+            meta_path.open("w", encoding="utf-8", newline="\n") as meta:
+        # One pass over the central directory: decompress each entry and
+        # write its metadata line. ZipFile reads share one file handle, so
+        # this stays serial; only the entry writes below are overlapped.
+        items = []
+        parents = {out_dir}  # created above
+        sep = ""
         for info in zf.infolist():
+            dest = out_dir / info.filename
+            if dest.parent not in parents:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                parents.add(dest.parent)
+            if info.file_size > STREAM_THRESHOLD:
+                with zf.open(info) as src, dest.open("wb") as dst:
+                    shutil.copyfileobj(src, dst, 65536)
+            else:
+                items.append((dest, zf.read(info)))
+            print(f"  {info.filename} ({info.file_size} bytes)")
             compress = "STORED" if info.compress_type == zipfile.ZIP_STORED else "DEFLATED"
-            meta_lines.append(
-                f"{info.filename}\t{compress}\t{info.file_size}\t{info.compress_size}"
+            meta.write(
+                f"{sep}{info.filename}\t{compress}\t{info.file_size}\t{info.compress_size}"
             )
-        meta_path = out_dir / "_zip_metadata.txt"
-        meta_path.write_text("\n".join(meta_lines), encoding="utf-8")
-        print(f"  _zip_metadata.txt (metadata)")
+            sep = "\n"
+
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            list(ex.map(lambda item: item[0].write_bytes(item[1]), items))
+
+    print(f"  _zip_metadata.txt (metadata)")
 
 
 def main():
@@ -1,3 +1,16 @@
+import re
+import zipfile
+from io import BytesIO
+
+try:  # libxml2 parses faster and compiles XPath expressions once
+    from lxml import etree as ET
+    # lxml parsers can be reused across documents. Test inputs never need
+    # entity expansion or DTD/network lookups, so leave those switched off.
+    XML_PARSER = ET.XMLParser(resolve_entities=False, no_network=True, huge_tree=False)
+except ImportError:
+    from xml.etree import ElementTree as ET
+    XML_PARSER = None  # stdlib parsers are single-use; fromstring makes its own
+
 # Namespace map for XPath queries - shared across all test modules
 NS = {
     "hh": "http://www.hancom.co.kr/hwpml/2011/head",
@@ -7,3 +20,85 @@ NS = {
     "hv": "http://www.hancom.co.kr/hwpml/2011/version",
     "ha": "http://www.hancom.co.kr/hwpml/2011/app",
 }
+
+# Clark-notation tag names, built once instead of per assertion
+HP_CELLADDR = f"{{{NS['hp']}}}cellAddr"
+HP_CELLMARGIN = f"{{{NS['hp']}}}cellMargin"
+HP_CELLSPAN = f"{{{NS['hp']}}}cellSpan"
+HP_CELLSZ = f"{{{NS['hp']}}}cellSz"
+HP_COLPR = f"{{{NS['hp']}}}colPr"
+HP_CTRL = f"{{{NS['hp']}}}ctrl"
+HP_P = f"{{{NS['hp']}}}p"
+HP_PAGEPR = f"{{{NS['hp']}}}pagePr"
+HP_POS = f"{{{NS['hp']}}}pos"
+HP_RUN = f"{{{NS['hp']}}}run"
+HP_SECPR = f"{{{NS['hp']}}}secPr"
+HP_SUBLIST = f"{{{NS['hp']}}}subList"
+HP_SZ = f"{{{NS['hp']}}}sz"
+HP_TBL = f"{{{NS['hp']}}}tbl"
+HP_TC = f"{{{NS['hp']}}}tc"
+HP_TR = f"{{{NS['hp']}}}tr"
+HH_HEAD = f"{{{NS['hh']}}}head"
+HS_SEC = f"{{{NS['hs']}}}sec"
+
+
+def parse_xml(data: bytes) -> ET.Element:
+    """Parse an XML blob with the fastest available parser."""
+    # Bytes: lxml refuses str input that carries an encoding declaration.
+    return ET.fromstring(data, XML_PARSER)
+
+
+_PREFIX_RE = re.compile(r"\b(%s):" % "|".join(NS))
+
+
+def xpath(expr: str):
+    """Compile a prefixed path over NS once; returns ``f(element) -> list``."""
+    if hasattr(ET, "XPath"):
+        return ET.XPath(expr, namespaces=NS)
+    # ElementTree: resolve the prefixes to Clark notation up front, so the
+    # per-call lookup is a plain findall without a namespace map.
+    clark = _PREFIX_RE.sub(lambda m: "{%s}" % NS[m.group(1)], expr)
+    return lambda element: element.findall(clark)
+
+
+def hwpx_entries(doc, *names) -> dict:
+    """Build *doc* in memory (uncompressed) and snapshot members in one open.
+
+    Returns ``{name: bytes}`` for the requested members that exist, or for
+    every member when no names are given.
+    """
+    with zipfile.ZipFile(BytesIO(doc.to_bytes(compression=zipfile.ZIP_STORED))) as zf:
+        present = zf.namelist()
+        if names:
+            available = set(present)
+            present = [n for n in names if n in available]
+        return {n: zf.read(n) for n in present}
+
+
+def hwpx_member(doc, name):
+    """Build *doc* in memory (uncompressed) and return one member's bytes."""
+    return hwpx_entries(doc, name)[name]
+
+
+class HwpxArchive:
+    """Read-only view of a saved .hwpx; each member is read and parsed once."""
+
+    def __init__(self, path):
+        self.path = path
+        self._xml = {}
+        self._trees = {}
+
+    def names(self) -> list:
+        with zipfile.ZipFile(self.path) as zf:
+            return zf.namelist()
+
+    def xml(self, name) -> bytes:
+        if name not in self._xml:
+            with zipfile.ZipFile(self.path) as zf:
+                self._xml[name] = zf.read(name)
+        return self._xml[name]
+
+    def tree(self, name) -> ET.Element:
+        if name not in self._trees:
+            self._trees[name] = parse_xml(self.xml(name))
+        return self._trees[name]
@@ -3,14 +3,16 @@
 Loads reference XML from extracted HWPX files and generates
 hwpxlib output for comparison.
 """
+import io
 import os
 import sys
 import zipfile
 from pathlib import Path
-from xml.etree import ElementTree as ET
 
 import pytest
 
+from tests import ET, parse_xml
+
 # Ensure hwpxlib is importable
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -18,33 +20,36 @@ REFERENCE_DIR = Path(__file__).parent.parent / "reference" / "extracted" / "colo
 PATENT_DIR = Path(__file__).parent.parent / "reference" / "extracted" / "patent"
 
 
-@pytest.fixture
+# Reference files and the generated default header never change during a
+# run and every consumer only reads them, so they are loaded and parsed once
+# per session.
+@pytest.fixture(scope="session")
 def ref_header_xml() -> str:
     """Return the reference header.xml content as string."""
     path = REFERENCE_DIR / "Contents" / "header.xml"
     return path.read_text(encoding="utf-8")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ref_section_xml() -> str:
     """Return the reference section0.xml content as string."""
     path = REFERENCE_DIR / "Contents" / "section0.xml"
     return path.read_text(encoding="utf-8")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ref_version_xml() -> str:
     path = REFERENCE_DIR / "version.xml"
     return path.read_text(encoding="utf-8")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ref_settings_xml() -> str:
     path = REFERENCE_DIR / "settings.xml"
     return path.read_text(encoding="utf-8")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ref_zip_metadata() -> dict:
     """Return ZIP metadata as dict of {filename: compress_method}."""
     path = REFERENCE_DIR / "_zip_metadata.txt"
@@ -55,21 +60,21 @@ def ref_zip_metadata() -> dict:
     return result
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ref_header_tree(ref_header_xml) -> ET.Element:
     """Parse reference header.xml into ElementTree."""
-    return ET.fromstring(ref_header_xml)
+    return parse_xml(ref_header_xml.encode("utf-8"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ref_section_tree(ref_section_xml) -> ET.Element:
     """Parse reference section0.xml (first 2000 chars) into ElementTree."""
-    return ET.fromstring(ref_section_xml)
+    return parse_xml(ref_section_xml.encode("utf-8"))
 
 
-@pytest.fixture
-def generated_hwpx_path(tmp_path) -> Path:
-    """Generate a test HWPX file using hwpxlib and return its path."""
+@pytest.fixture(scope="session")
+def generated_hwpx_bytes() -> bytes:
+    """Generate the sample HWPX package once per session with a plain save()."""
     from hwpxlib.document import HwpxDocument
 
     doc = HwpxDocument.new()
@@ -80,12 +85,38 @@ def generated_hwpx_path(tmp_path) -> Path:
     doc.add_code_block("print('hello')", language="python")
     doc.add_bullet_list(["Item 1", "Item 2"])
 
-    out = tmp_path / "test_output.hwpx"
-    doc.save(str(out))
-    return out
+    out = io.BytesIO()
+    doc.save(out)
+    return out.getvalue()
 
 
 @pytest.fixture
+def generated_hwpx(generated_hwpx_bytes) -> io.BytesIO:
+    """Return the generated package as a fresh file object."""
+    return io.BytesIO(generated_hwpx_bytes)
+
+
+@pytest.fixture(scope="session")
+def generated_zip_infos(generated_hwpx_bytes) -> dict[str, zipfile.ZipInfo]:
+    """Return the generated package's ZipInfo records by name, in archive order."""
+    with zipfile.ZipFile(io.BytesIO(generated_hwpx_bytes), "r") as zf:
+        return {info.filename: info for info in zf.infolist()}
+
+
+@pytest.fixture(scope="session")
+def generated_section_xml_bytes(generated_hwpx_bytes) -> bytes:
+    """Return the generated Contents/section0.xml, read from the package once."""
+    with zipfile.ZipFile(io.BytesIO(generated_hwpx_bytes), "r") as zf:
+        return zf.read("Contents/section0.xml")
+
+
+@pytest.fixture(scope="session")
+def generated_section_root(generated_section_xml_bytes) -> ET.Element:
+    """Parse the generated section0.xml once per session."""
+    return parse_xml(generated_section_xml_bytes)
+
+
+@pytest.fixture(scope="session")
 def generated_header_xml() -> str:
     """Generate header.xml from hwpxlib defaults."""
     from hwpxlib.template import (
@@ -103,9 +134,9 @@ def generated_header_xml() -> str:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def generated_header_tree(generated_header_xml) -> ET.Element:
     """Parse generated header.xml into ElementTree."""
-    return ET.fromstring(generated_header_xml)
+    return parse_xml(generated_header_xml.encode("utf-8"))
 
 
@@ -3,39 +3,70 @@
 Compares hwpxlib-generated header.xml against reference XML.
 Spec: specs/03 through specs/07
 """
-from xml.etree import ElementTree as ET
-
 import pytest
 from tests import NS
 
+# Clark-notation tags resolved once. A plain tag with no namespace map is
+# matched directly by the C find/findall/iter instead of going through
+# ElementPath's prefix translation on every call.
+_HH = f"{{{NS['hh']}}}"
+_FONT = _HH + "font"
+_BOLD = _HH + "bold"
+_ITALIC = _HH + "italic"
+_FONT_REF = _HH + "fontRef"
+_HEADING = _HH + "heading"
+
+
+# The header collections the tests compare, keyed by their element name.
+_COLLECTIONS = ("fontface", "borderFill", "charPr", "paraPr", "style")
+
+
+def _header_items(tree):
+    wanted = {_HH + name: name for name in _COLLECTIONS}
+    items = {name: [] for name in _COLLECTIONS}
+    for el in tree.iter():
+        name = wanted.get(el.tag)
+        if name is not None:
+            items[name].append(el)
+    return items
+
+
+# ElementTree's findall is a Python-level tree walk; each tree is bucketed
+# once per module in a single pass and the lists are only read by the tests.
+@pytest.fixture(scope="module")
+def header_items(ref_header_tree, generated_header_tree):
+    """Map each collection name to its (reference, generated) element lists."""
+    ref = _header_items(ref_header_tree)
+    gen = _header_items(generated_header_tree)
+    return {name: (ref[name], gen[name]) for name in _COLLECTIONS}
+
 
 class TestFontFaces:
     """Spec: specs/03-header-fontfaces.md"""
 
-    def test_fontface_count(self, ref_header_tree, generated_header_tree):
-        ref_ff = ref_header_tree.findall(".//hh:fontface", NS)
-        gen_ff = generated_header_tree.findall(".//hh:fontface", NS)
-        assert len(gen_ff) == len(ref_ff) == 7
+    def test_fontface_count(self, header_items):
+        ref_fontfaces, gen_fontfaces = header_items["fontface"]
+        assert len(gen_fontfaces) == len(ref_fontfaces) == 7
 
-    def test_fontface_langs(self, ref_header_tree, generated_header_tree):
-        ref_langs = [ff.get("lang") for ff in ref_header_tree.findall(".//hh:fontface", NS)]
-        gen_langs = [ff.get("lang") for ff in generated_header_tree.findall(".//hh:fontface", NS)]
+    def test_fontface_langs(self, header_items):
+        ref_fontfaces, gen_fontfaces = header_items["fontface"]
+        ref_langs = [ff.get("lang") for ff in ref_fontfaces]
+        gen_langs = [ff.get("lang") for ff in gen_fontfaces]
         assert gen_langs == ref_langs
 
-    def test_font_count_per_face(self, ref_header_tree, generated_header_tree):
-        for ref_ff, gen_ff in zip(
-            ref_header_tree.findall(".//hh:fontface", NS),
-            generated_header_tree.findall(".//hh:fontface", NS),
-        ):
-            ref_fonts = ref_ff.findall("hh:font", NS)
-            gen_fonts = gen_ff.findall("hh:font", NS)
+    def test_font_count_per_face(self, header_items):
+        ref_fontfaces, gen_fontfaces = header_items["fontface"]
+        for ref_ff, gen_ff in zip(ref_fontfaces, gen_fontfaces):
+            ref_fonts = ref_ff.findall(_FONT)
+            gen_fonts = gen_ff.findall(_FONT)
             lang = ref_ff.get("lang")
             assert len(gen_fonts) == len(ref_fonts), \
                 f"Font count mismatch for {lang}: {len(gen_fonts)} vs {len(ref_fonts)}"
 
-    def test_font_names(self, ref_header_tree, generated_header_tree):
-        ref_fonts = ref_header_tree.findall(".//hh:fontface/hh:font", NS)
-        gen_fonts = generated_header_tree.findall(".//hh:fontface/hh:font", NS)
+    def test_font_names(self, header_items):
+        ref_fontfaces, gen_fontfaces = header_items["fontface"]
+        ref_fonts = [f for ff in ref_fontfaces for f in ff.findall(_FONT)]
+        gen_fonts = [f for ff in gen_fontfaces for f in ff.findall(_FONT)]
         for ref_f, gen_f in zip(ref_fonts, gen_fonts):
             assert gen_f.get("face") == ref_f.get("face"), \
                 f"Font face mismatch: {gen_f.get('face')} vs {ref_f.get('face')}"
@@ -44,22 +75,20 @@ class TestFontFaces:
 class TestBorderFills:
     """Spec: specs/04-header-borderfills.md"""
 
-    def test_borderfill_count(self, ref_header_tree, generated_header_tree):
-        ref_bf = ref_header_tree.findall(".//hh:borderFill", NS)
-        gen_bf = generated_header_tree.findall(".//hh:borderFill", NS)
+    def test_borderfill_count(self, header_items):
+        ref_borderfills, gen_borderfills = header_items["borderFill"]
         # Generated has more borderFills than reference (HR border added)
-        assert len(gen_bf) >= len(ref_bf)
-        assert len(gen_bf) == 8
+        assert len(gen_borderfills) >= len(ref_borderfills)
+        assert len(gen_borderfills) == 8
 
-    def test_borderfill_ids_are_1_based(self, generated_header_tree):
-        bfs = generated_header_tree.findall(".//hh:borderFill", NS)
-        ids = [int(bf.get("id")) for bf in bfs]
+    def test_borderfill_ids_are_1_based(self, header_items):
+        gen_borderfills = header_items["borderFill"][1]
+        ids = [int(bf.get("id")) for bf in gen_borderfills]
         assert ids == list(range(1, 9))
 
-    def test_borderfill_attributes_match(self, ref_header_tree, generated_header_tree):
-        ref_bfs = ref_header_tree.findall(".//hh:borderFill", NS)
-        gen_bfs = generated_header_tree.findall(".//hh:borderFill", NS)
-        for ref_bf, gen_bf in zip(ref_bfs, gen_bfs):
+    def test_borderfill_attributes_match(self, header_items):
+        ref_borderfills, gen_borderfills = header_items["borderFill"]
+        for ref_bf, gen_bf in zip(ref_borderfills, gen_borderfills):
             bf_id = ref_bf.get("id")
             for attr in ["threeD", "shadow", "centerLine", "breakCellSeparateLine"]:
                 assert gen_bf.get(attr) == ref_bf.get(attr), \
@@ -69,43 +98,39 @@ class TestBorderFills:
 class TestCharProperties:
     """Spec: specs/05-header-char-properties.md"""
 
-    def test_charpr_count(self, ref_header_tree, generated_header_tree):
-        ref_cp = ref_header_tree.findall(".//hh:charPr", NS)
-        gen_cp = generated_header_tree.findall(".//hh:charPr", NS)
+    def test_charpr_count(self, header_items):
+        ref_charprs, gen_charprs = header_items["charPr"]
         # Generated has more charPrs than reference (hyperlink style added)
-        assert len(gen_cp) >= len(ref_cp)
-        assert len(gen_cp) == 18
+        assert len(gen_charprs) >= len(ref_charprs)
+        assert len(gen_charprs) == 18
 
-    def test_charpr_attributes_match(self, ref_header_tree, generated_header_tree):
-        ref_cps = ref_header_tree.findall(".//hh:charPr", NS)
-        gen_cps = generated_header_tree.findall(".//hh:charPr", NS)
-        for ref_cp, gen_cp in zip(ref_cps, gen_cps):
+    def test_charpr_attributes_match(self, header_items):
+        ref_charprs, gen_charprs = header_items["charPr"]
+        for ref_cp, gen_cp in zip(ref_charprs, gen_charprs):
             cp_id = ref_cp.get("id")
             for attr in ["height", "textColor", "shadeColor", "borderFillIDRef"]:
                 assert gen_cp.get(attr) == ref_cp.get(attr), \
                     f"charPr {cp_id} attr {attr}: {gen_cp.get(attr)} vs {ref_cp.get(attr)}"
 
-    def test_charpr_bold_italic_presence(self, ref_header_tree, generated_header_tree):
+    def test_charpr_bold_italic_presence(self, header_items):
         """Bold/italic elements must match reference for each charPr."""
-        ref_cps = ref_header_tree.findall(".//hh:charPr", NS)
-        gen_cps = generated_header_tree.findall(".//hh:charPr", NS)
-        for ref_cp, gen_cp in zip(ref_cps, gen_cps):
+        ref_charprs, gen_charprs = header_items["charPr"]
+        for ref_cp, gen_cp in zip(ref_charprs, gen_charprs):
             cp_id = ref_cp.get("id")
-            ref_bold = ref_cp.find("hh:bold", NS) is not None
-            gen_bold = gen_cp.find("hh:bold", NS) is not None
+            ref_bold = ref_cp.find(_BOLD) is not None
+            gen_bold = gen_cp.find(_BOLD) is not None
             assert gen_bold == ref_bold, f"charPr {cp_id} bold: {gen_bold} vs {ref_bold}"
 
-            ref_italic = ref_cp.find("hh:italic", NS) is not None
-            gen_italic = gen_cp.find("hh:italic", NS) is not None
+            ref_italic = ref_cp.find(_ITALIC) is not None
+            gen_italic = gen_cp.find(_ITALIC) is not None
             assert gen_italic == ref_italic, f"charPr {cp_id} italic: {gen_italic} vs {ref_italic}"
 
-    def test_charpr_fontref_match(self, ref_header_tree, generated_header_tree):
-        ref_cps = ref_header_tree.findall(".//hh:charPr", NS)
-        gen_cps = generated_header_tree.findall(".//hh:charPr", NS)
-        for ref_cp, gen_cp in zip(ref_cps, gen_cps):
+    def test_charpr_fontref_match(self, header_items):
+        ref_charprs, gen_charprs = header_items["charPr"]
+        for ref_cp, gen_cp in zip(ref_charprs, gen_charprs):
             cp_id = ref_cp.get("id")
-            ref_fr = ref_cp.find("hh:fontRef", NS)
-            gen_fr = gen_cp.find("hh:fontRef", NS)
+            ref_fr = ref_cp.find(_FONT_REF)
+            gen_fr = gen_cp.find(_FONT_REF)
             for attr in ["hangul", "latin", "hanja", "japanese", "other", "symbol", "user"]:
                 assert gen_fr.get(attr) == ref_fr.get(attr), \
                     f"charPr {cp_id} fontRef.{attr}: {gen_fr.get(attr)} vs {ref_fr.get(attr)}"
@@ -114,29 +139,26 @@ class TestCharProperties:
 class TestParaProperties:
     """Spec: specs/06-header-para-properties.md"""
 
-    def test_parapr_count(self, ref_header_tree, generated_header_tree):
-        ref_pp = ref_header_tree.findall(".//hh:paraPr", NS)
-        gen_pp = generated_header_tree.findall(".//hh:paraPr", NS)
+    def test_parapr_count(self, header_items):
+        ref_paraprs, gen_paraprs = header_items["paraPr"]
         # Generated has more paraPrs than reference (ordered/nested list levels + HR added)
-        assert len(gen_pp) >= len(ref_pp)
-        assert len(gen_pp) == 17
+        assert len(gen_paraprs) >= len(ref_paraprs)
+        assert len(gen_paraprs) == 17
 
-    def test_parapr_attributes_match(self, ref_header_tree, generated_header_tree):
-        ref_pps = ref_header_tree.findall(".//hh:paraPr", NS)
-        gen_pps = generated_header_tree.findall(".//hh:paraPr", NS)
-        for ref_pp, gen_pp in zip(ref_pps, gen_pps):
+    def test_parapr_attributes_match(self, header_items):
+        ref_paraprs, gen_paraprs = header_items["paraPr"]
+        for ref_pp, gen_pp in zip(ref_paraprs, gen_paraprs):
             pp_id = ref_pp.get("id")
             for attr in ["tabPrIDRef", "condense", "fontLineHeight", "snapToGrid"]:
                 assert gen_pp.get(attr) == ref_pp.get(attr), \
                     f"paraPr {pp_id} attr {attr}: {gen_pp.get(attr)} vs {ref_pp.get(attr)}"
 
-    def test_parapr_heading_match(self, ref_header_tree, generated_header_tree):
-        ref_pps = ref_header_tree.findall(".//hh:paraPr", NS)
-        gen_pps = generated_header_tree.findall(".//hh:paraPr", NS)
-        for ref_pp, gen_pp in zip(ref_pps, gen_pps):
+    def test_parapr_heading_match(self, header_items):
+        ref_paraprs, gen_paraprs = header_items["paraPr"]
+        for ref_pp, gen_pp in zip(ref_paraprs, gen_paraprs):
             pp_id = ref_pp.get("id")
-            ref_h = ref_pp.find("hh:heading", NS)
-            gen_h = gen_pp.find("hh:heading", NS)
+            ref_h = ref_pp.find(_HEADING)
+            gen_h = gen_pp.find(_HEADING)
             for attr in ["type", "idRef", "level"]:
                 assert gen_h.get(attr) == ref_h.get(attr), \
                     f"paraPr {pp_id} heading.{attr}: {gen_h.get(attr)} vs {ref_h.get(attr)}"
@@ -145,21 +167,19 @@ class TestParaProperties:
 class TestStyles:
     """Spec: specs/07-header-styles-numbering.md"""
 
-    def test_style_count(self, ref_header_tree, generated_header_tree):
-        ref_st = ref_header_tree.findall(".//hh:style", NS)
-        gen_st = generated_header_tree.findall(".//hh:style", NS)
-        assert len(gen_st) == len(ref_st) == 7
+    def test_style_count(self, header_items):
+        ref_styles, gen_styles = header_items["style"]
+        assert len(gen_styles) == len(ref_styles) == 7
 
-    def test_style_langid(self, ref_header_tree, generated_header_tree):
-        gen_styles = generated_header_tree.findall(".//hh:style", NS)
+    def test_style_langid(self, header_items):
+        gen_styles = header_items["style"][1]
         for st in gen_styles:
             assert st.get("langID") == "1042", \
                 f"Style {st.get('id')} langID must be 1042, got {st.get('langID')}"
 
-    def test_style_attributes_match(self, ref_header_tree, generated_header_tree):
-        ref_sts = ref_header_tree.findall(".//hh:style", NS)
-        gen_sts = generated_header_tree.findall(".//hh:style", NS)
-        for ref_st, gen_st in zip(ref_sts, gen_sts):
+    def test_style_attributes_match(self, header_items):
+        ref_styles, gen_styles = header_items["style"]
+        for ref_st, gen_st in zip(ref_styles, gen_styles):
             st_id = ref_st.get("id")
             for attr in ["type", "name", "engName", "paraPrIDRef",
                           "charPrIDRef", "nextStyleIDRef", "langID"]:
@@ -0,0 +1,112 @@
+"""Tests for image embedding and Markdown-to-HWPX roundtrips.
+
+Kept apart from test_new_features so the build-and-zip tests can be
+scheduled separately from the cheap parser/API tests (e.g. pytest -n).
+"""
+import functools
+import struct
+import zipfile
+import zlib
+from io import BytesIO
+
+import pytest
+
+from hwpxlib.document import HwpxDocument
+from hwpxlib.constants import PARAPR_BULLET, PARAPR_BULLET_L2, PARAPR_BULLET_L3
+from converters.md2hwpx import convert_md_to_hwpx
+from tests import hwpx_member
+
+
+# === Image Support ===
+
+_U32 = struct.Struct('>I').pack
+_IHDR = struct.Struct('>IIBBBBB').pack
+
+# IEND carries no data, so its chunk (CRC included) is a constant.
+_IEND_CHUNK = struct.pack('>I4sI', 0, b'IEND', 0xae426082)
+
+
+@functools.lru_cache(maxsize=8)
+def _make_png(width=10, height=10):
+    """Create a minimal valid PNG (cached: the bytes are immutable)."""
+    ihdr = _IHDR(width, height, 8, 2, 0, 0, 0)
+    # All-black scanlines; level 1 is plenty, the tests never check size.
+    idat = zlib.compress(bytes((width * 3 + 1) * height), 1)
+    png = bytearray(b'\x89PNG\r\n\x1a\n')
+    for tag, payload in ((b'IHDR', ihdr), (b'IDAT', idat)):
+        png += _U32(len(payload))
+        png += tag
+        png += payload
+        png += _U32(zlib.crc32(payload, zlib.crc32(tag)))
+    png += _IEND_CHUNK
+    return bytes(png)
+
+
+@pytest.fixture(scope="module")
+def png_10():
+    return _make_png(10, 10)
+
+
+@pytest.fixture(scope="module")
+def png_100_50():
+    return _make_png(100, 50)
+
+
+class TestImageSupport:
+
+    def test_add_image_from_bytes(self, png_100_50):
+        doc = HwpxDocument.new()
+        img = doc.add_image(image_data=png_100_50)
+        assert img.binary_item_id == "image1"
+        assert img.media_type == "image/png"
+        assert img.width == 100 * 75   # pixels * 75 HWPUNIT
+        assert img.height == 50 * 75
+
+    def test_add_image_custom_size(self, png_10):
+        doc = HwpxDocument.new()
+        img = doc.add_image(image_data=png_10, width=20000, height=10000)
+        assert img.width == 20000
+        assert img.height == 10000
+
+    def test_image_in_output_zip(self, png_10):
+        doc = HwpxDocument.new()
+        doc.add_image(image_data=png_10)
+        with zipfile.ZipFile(BytesIO(doc.to_bytes())) as zf:
+            names = zf.namelist()
+            assert any("BinData/" in n for n in names)
+            # content.hpf should reference the image
+            with zf.open("Contents/content.hpf") as fp:
+                hpf = fp.read()
+            assert b"image1" in hpf
+            assert b'isEmbeded="1"' in hpf
+            # ...and the section should place it
+            section = zf.read("Contents/section0.xml")
+            assert b"hp:pic" in section
+            assert b"image1" in section
+
+
+# === End-to-End: MD with nested lists ===
+
+_BULLET_LEVEL_REFS = tuple(
+    f'paraPrIDRef="{ref}"'.encode()
+    for ref in (PARAPR_BULLET, PARAPR_BULLET_L2, PARAPR_BULLET_L3)
+)
+
+
+class TestMdConversionNewFeatures:
+
+    def test_md_ordered_list_roundtrip(self, tmp_path):
+        md = "1. First\n2. Second\n3. Third"
+        doc = convert_md_to_hwpx(md)
+        out = tmp_path / "ordered.hwpx"
+        doc.save(str(out), compression=zipfile.ZIP_STORED)
+        assert out.exists()
+        assert out.stat().st_size > 0
+
+    def test_md_nested_bullet_roundtrip(self):
+        md = "- A\n  - A1\n    - A1a\n- B"
+        doc = convert_md_to_hwpx(md)
+        section = hwpx_member(doc, "Contents/section0.xml")
+        # Should have different paraPrIDRef values for different levels
+        for expected in _BULLET_LEVEL_REFS:
+            assert expected in section
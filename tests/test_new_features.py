@@ -1,9 +1,5 @@
-"""Tests for ordered lists, nested lists, page setup, style customization, and images."""
-import os
-import struct
-import zipfile
-from io import BytesIO
-from xml.etree import ElementTree as ET
+"""Tests for ordered lists, nested lists, page setup, style customization, and more."""
+import re
 
 import pytest
 
@@ -16,7 +12,42 @@ from hwpxlib.constants import (
     PARAPR_ORDERED_L2, PARAPR_ORDERED_L3,
     mm_to_hwpunit, PAGE_WIDTH, PAGE_HEIGHT,
 )
-from converters.md_parser import parse_markdown, BulletList, OrderedList
+from converters.md_parser import parse_markdown, iter_markdown, BulletList, OrderedList
+from converters.md2hwpx import convert_md_to_hwpx
+from tests import hwpx_entries, hwpx_member, parse_xml, xpath
+
+_HEADER_XPATH = xpath(".//hp:header")
+_SUBLIST_XPATH = xpath("hp:subList")
+_P_XPATH = xpath("hp:p")
+
+
+def _charpr_body(header: bytes, charpr_id: int) -> bytes:
+    """Inner XML of ``<hh:charPr id=charpr_id>``, scanned from the raw bytes.
+
+    The writer always emits ``id`` as the first charPr attribute, so a regex
+    is enough and no DOM has to be built.
+    """
+    m = re.search(rb'<hh:charPr id="%d"[^>]*>(.*?)</hh:charPr>' % charpr_id,
+                  header, re.DOTALL)
+    assert m is not None, f"charPr id={charpr_id} missing"
+    return m.group(1)
+
+
+@pytest.fixture(scope="module")
+def feature_header():
+    """header.xml of one document using blockquote, strike, super and sub.
+
+    Each of those features only touches its own charPr/borderFill entry, so
+    the header-level tests share a single build instead of one per feature.
+    """
+    doc = HwpxDocument.new(seed=42)
+    doc.add_blockquote("Test")
+    doc.add_mixed_paragraph([
+        {"text": "strike", "strikethrough": True},
+        {"text": "x", "superscript": True},
+        {"text": "x", "subscript": True},
+    ])
+    return hwpx_member(doc, "Contents/header.xml")
 
 
 # === Markdown Parser: Ordered Lists ===
@@ -41,7 +72,7 @@ class TestOrderedListParser:
         md = "1. **Bold** item\n2. Normal item"
         ast = parse_markdown(md)
         segments, level = ast[0].items[0]
-        assert any(s.bold for s in segments)
+        assert [s.bold for s in segments] == [True, False]
 
     def test_ordered_list_dot_and_paren(self):
         md = "1) First\n2) Second"
@@ -54,23 +85,14 @@ class TestOrderedListParser:
 
 class TestNestedListParser:
 
-    def test_nested_bullet_levels(self):
-        md = "- Level 0\n  - Level 1\n    - Level 2"
-        ast = parse_markdown(md)
-        assert isinstance(ast[0], BulletList)
-        items = ast[0].items
-        assert items[0][1] == 0
-        assert items[1][1] == 1
-        assert items[2][1] == 2
-
-    def test_nested_ordered_levels(self):
-        md = "1. Level 0\n  1. Level 1\n    1. Level 2"
+    @pytest.mark.parametrize("md, node_type", [
+        ("- Level 0\n  - Level 1\n    - Level 2", BulletList),
+        ("1. Level 0\n  1. Level 1\n    1. Level 2", OrderedList),
+    ], ids=["bullet", "ordered"])
+    def test_nested_levels(self, md, node_type):
         ast = parse_markdown(md)
-        assert isinstance(ast[0], OrderedList)
-        items = ast[0].items
-        assert items[0][1] == 0
-        assert items[1][1] == 1
-        assert items[2][1] == 2
+        assert isinstance(ast[0], node_type)
+        assert [level for _, level in ast[0].items] == [0, 1, 2]
 
     def test_max_level_capped_at_2(self):
         md = "- L0\n        - Deep indent"
@@ -88,6 +110,15 @@ class TestNestedListParser:
         assert items[2][1] == 1
         assert items[3][1] == 0
 
+    def test_iter_markdown_matches_parse(self):
+        md = "# T\n\n- A\n  - A1\n\n1. x\n\n> q\n\ntext\n\n"
+        assert list(iter_markdown(md)) == parse_markdown(md)
+
+    def test_parse_results_are_not_shared(self):
+        md = "- A\n- B\n"
+        parse_markdown(md)[0].items.clear()
+        assert len(parse_markdown(md)[0].items) == 2
+
 
 # === Document API: Ordered List ===
 
@@ -96,17 +127,14 @@ class TestOrderedListDocument:
     def test_add_ordered_list_creates_elements(self):
         doc = HwpxDocument.new()
         doc.add_ordered_list(["A", "B", "C"])
-        assert len(doc._elements) == 3
-        for elem in doc._elements:
-            assert elem[0] == "paragraph"
-            assert elem[1].para_pr_id_ref == PARAPR_ORDERED
+        assert [kind for kind, _ in doc._elements] == ["paragraph"] * 3
+        assert [p.para_pr_id_ref for _, p in doc._elements] == [PARAPR_ORDERED] * 3
 
     def test_add_ordered_list_with_level(self):
         doc = HwpxDocument.new()
         doc.add_ordered_list([("L0", 0), ("L1", 1), ("L2", 2)])
-        assert doc._elements[0][1].para_pr_id_ref == PARAPR_ORDERED
-        assert doc._elements[1][1].para_pr_id_ref == PARAPR_ORDERED_L2
-        assert doc._elements[2][1].para_pr_id_ref == PARAPR_ORDERED_L3
+        assert [p.para_pr_id_ref for _, p in doc._elements] == [
+            PARAPR_ORDERED, PARAPR_ORDERED_L2, PARAPR_ORDERED_L3]
 
 
 # === Document API: Nested Bullet List ===
@@ -116,43 +144,31 @@ class TestNestedBulletDocument:
     def test_nested_bullet_parapr_ids(self):
         doc = HwpxDocument.new()
         doc.add_bullet_list([("A", 0), ("B", 1), ("C", 2)])
-        assert doc._elements[0][1].para_pr_id_ref == PARAPR_BULLET
-        assert doc._elements[1][1].para_pr_id_ref == PARAPR_BULLET_L2
-        assert doc._elements[2][1].para_pr_id_ref == PARAPR_BULLET_L3
+        assert [p.para_pr_id_ref for _, p in doc._elements] == [
+            PARAPR_BULLET, PARAPR_BULLET_L2, PARAPR_BULLET_L3]
 
     def test_backward_compat_no_level(self):
         """Plain strings should still work (level 0)."""
         doc = HwpxDocument.new()
         doc.add_bullet_list(["A", "B"])
-        for elem in doc._elements:
-            assert elem[1].para_pr_id_ref == PARAPR_BULLET
+        assert [p.para_pr_id_ref for _, p in doc._elements] == [PARAPR_BULLET] * 2
 
 
 # === Page Setup ===
 
 class TestPageSetup:
 
-    def test_a4_defaults(self):
-        ps = PageSetup.a4()
-        assert ps.width == PAGE_WIDTH
-        assert ps.height == PAGE_HEIGHT
-        assert ps.orientation == "WIDELY"
-
-    def test_a4_landscape(self):
-        ps = PageSetup.a4(landscape=True)
-        assert ps.width == PAGE_HEIGHT
-        assert ps.height == PAGE_WIDTH
-        assert ps.orientation == "NARROWLY"
-
-    def test_letter_size(self):
-        ps = PageSetup.letter()
-        assert ps.width == mm_to_hwpunit(216)
-        assert ps.height == mm_to_hwpunit(279)
-
-    def test_a3_size(self):
-        ps = PageSetup.a3()
-        assert ps.width == mm_to_hwpunit(297)
-        assert ps.height == mm_to_hwpunit(420)
+    @pytest.mark.parametrize("factory, width, height, orientation", [
+        (PageSetup.a4, PAGE_WIDTH, PAGE_HEIGHT, "WIDELY"),
+        (lambda: PageSetup.a4(landscape=True), PAGE_HEIGHT, PAGE_WIDTH, "NARROWLY"),
+        (PageSetup.letter, mm_to_hwpunit(216), mm_to_hwpunit(279), "WIDELY"),
+        (PageSetup.a3, mm_to_hwpunit(297), mm_to_hwpunit(420), "WIDELY"),
+    ], ids=["a4", "a4_landscape", "letter", "a3"])
+    def test_paper_sizes(self, factory, width, height, orientation):
+        ps = factory()
+        assert ps.width == width
+        assert ps.height == height
+        assert ps.orientation == orientation
 
     def test_usable_width(self):
         ps = PageSetup()
@@ -170,17 +186,13 @@ class TestPageSetup:
         assert doc.page_setup.margin_left == 5000
         assert doc.page_setup.margin_right == 5000
 
-    def test_page_setup_in_output_xml(self, tmp_path):
-        doc = HwpxDocument.new(seed=1)
+    def test_page_setup_in_output_xml(self):
+        doc = HwpxDocument.new()
         doc.set_page_setup(PageSetup.a4(landscape=True))
         doc.add_paragraph("Test")
-        out = tmp_path / "landscape.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            section = zf.read("Contents/section0.xml").decode("utf-8")
-        assert 'landscape="NARROWLY"' in section
-        assert f'width="{PAGE_HEIGHT}"' in section
+        section = hwpx_member(doc, "Contents/section0.xml")
+        assert b'landscape="NARROWLY"' in section
+        assert f'width="{PAGE_HEIGHT}"'.encode() in section
 
     def test_table_width_uses_page_setup(self):
         doc = HwpxDocument.new()
@@ -207,28 +219,20 @@ class TestStyleConfig:
         assert cfg.font_body == "맑은 고딕"
         assert cfg.font_size_body == 1100
 
-    def test_set_style_changes_fonts(self, tmp_path):
-        doc = HwpxDocument.new(seed=1)
+    def test_set_style_changes_fonts(self):
+        doc = HwpxDocument.new()
         doc.set_style(font_body="맑은 고딕", font_code="D2Coding")
         doc.add_paragraph("Test")
-        out = tmp_path / "custom_font.hwpx"
-        doc.save(str(out))
+        header = hwpx_member(doc, "Contents/header.xml")
+        assert '맑은 고딕'.encode("utf-8") in header
+        assert b'D2Coding' in header
 
-        with zipfile.ZipFile(str(out)) as zf:
-            header = zf.read("Contents/header.xml").decode("utf-8")
-        assert '맑은 고딕' in header
-        assert 'D2Coding' in header
-
-    def test_set_style_changes_colors(self, tmp_path):
-        doc = HwpxDocument.new(seed=1)
+    def test_set_style_changes_colors(self):
+        doc = HwpxDocument.new()
         doc.set_style(color_heading="#FF0000")
         doc.add_heading("Red Heading", level=1)
-        out = tmp_path / "custom_color.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            header = zf.read("Contents/header.xml").decode("utf-8")
-        assert '#FF0000' in header
+        header = hwpx_member(doc, "Contents/header.xml")
+        assert b'#FF0000' in header
 
     def test_set_style_with_config_object(self):
         doc = HwpxDocument.new()
@@ -242,104 +246,69 @@ class TestStyleConfig:
         result = doc.set_style(font_body="맑은 고딕")
         assert result is doc  # returns self
 
-
-# === Image Support ===
-
-class TestImageSupport:
-
-    @staticmethod
-    def _make_png(width=10, height=10):
-        """Create a minimal valid PNG."""
-        import zlib
-        signature = b'\x89PNG\r\n\x1a\n'
-        # IHDR
-        ihdr_data = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
-        ihdr_crc = zlib.crc32(b'IHDR' + ihdr_data) & 0xFFFFFFFF
-        ihdr = struct.pack('>I', 13) + b'IHDR' + ihdr_data + struct.pack('>I', ihdr_crc)
-        # IDAT (minimal)
-        raw = b'\x00' * (width * 3 + 1) * height
-        compressed = zlib.compress(raw)
-        idat_crc = zlib.crc32(b'IDAT' + compressed) & 0xFFFFFFFF
-        idat = struct.pack('>I', len(compressed)) + b'IDAT' + compressed + struct.pack('>I', idat_crc)
-        # IEND
-        iend_crc = zlib.crc32(b'IEND') & 0xFFFFFFFF
-        iend = struct.pack('>I', 0) + b'IEND' + struct.pack('>I', iend_crc)
-        return signature + ihdr + idat + iend
-
-    def test_add_image_from_bytes(self):
-        doc = HwpxDocument.new()
-        png = self._make_png(100, 50)
-        img = doc.add_image(image_data=png)
-        assert img.binary_item_id == "image1"
-        assert img.media_type == "image/png"
-        assert img.width == 100 * 75   # pixels * 75 HWPUNIT
-        assert img.height == 50 * 75
-
-    def test_add_image_custom_size(self):
+    def test_default_header_matches_fresh_render(self):
+        from hwpxlib.xml_writer import write_header_xml
         doc = HwpxDocument.new()
-        png = self._make_png()
-        img = doc.add_image(image_data=png, width=20000, height=10000)
-        assert img.width == 20000
-        assert img.height == 10000
-
-    def test_image_in_output_zip(self, tmp_path):
-        doc = HwpxDocument.new(seed=1)
-        png = self._make_png(10, 10)
-        doc.add_image(image_data=png)
-        out = tmp_path / "with_image.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            names = zf.namelist()
-            assert any("BinData/" in n for n in names)
-            # content.hpf should reference the image
-            hpf = zf.read("Contents/content.hpf").decode("utf-8")
-            assert "image1" in hpf
-            assert 'isEmbeded="1"' in hpf
-
-    def test_image_in_section_xml(self, tmp_path):
-        doc = HwpxDocument.new(seed=1)
-        png = self._make_png(10, 10)
-        doc.add_image(image_data=png)
-        out = tmp_path / "img_section.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            section = zf.read("Contents/section0.xml").decode("utf-8")
-        assert "hp:pic" in section
-        assert "image1" in section
-
-
-# === End-to-End: MD with nested lists ===
-
-class TestMdConversionNewFeatures:
-
-    def test_md_ordered_list_roundtrip(self, tmp_path):
-        from converters.md2hwpx import convert_md_to_hwpx
-        md = "1. First\n2. Second\n3. Third"
-        doc = convert_md_to_hwpx(md)
-        out = tmp_path / "ordered.hwpx"
-        doc.save(str(out))
-        assert out.exists()
-        assert out.stat().st_size > 0
-
-    def test_md_nested_bullet_roundtrip(self, tmp_path):
-        from converters.md2hwpx import convert_md_to_hwpx
-        md = "- A\n  - A1\n    - A1a\n- B"
-        doc = convert_md_to_hwpx(md)
-        out = tmp_path / "nested.hwpx"
-        doc.save(str(out))
+        expected = write_header_xml(
+            doc._font_faces, doc._border_fills, doc._char_prs,
+            doc._para_prs, doc._styles,
+        ).encode("utf-8")
+        assert doc._build_header_xml() == expected
 
-        with zipfile.ZipFile(str(out)) as zf:
-            section = zf.read("Contents/section0.xml").decode("utf-8")
-        # Should have different paraPrIDRef values for different levels
-        assert f'paraPrIDRef="{PARAPR_BULLET}"' in section
-        assert f'paraPrIDRef="{PARAPR_BULLET_L2}"' in section
-        assert f'paraPrIDRef="{PARAPR_BULLET_L3}"' in section
+    def test_modified_properties_bypass_default_header(self):
+        doc = HwpxDocument.new()
+        doc._char_prs[0].height = 1234
+        assert b'height="1234"' in doc._build_header_xml()
+        # A fresh document still gets the untouched default
+        assert b'height="1234"' not in HwpxDocument.new()._build_header_xml()
+
+    def test_char_prs_share_font_refs(self):
+        from hwpxlib.template import default_char_prs, FONT_REF_DEFAULT, FONT_REF_CODE
+        cps = default_char_prs()
+        assert cps[0].font_ref is FONT_REF_DEFAULT
+        assert cps[11].font_ref is FONT_REF_CODE
+        assert default_char_prs(StyleConfig(font_body="Arial"))[0].font_ref is FONT_REF_DEFAULT
+
+    def test_char_pr_render_tracks_field_edits(self):
+        from hwpxlib.models.head import CharPr
+        from hwpxlib.xml_writer import _write_char_pr
+        cp = CharPr(id=0, height=1000)
+        assert 'height="1000"' in _write_char_pr(cp)
+        cp.height = 1500
+        assert 'height="1500"' in _write_char_pr(cp)
+
+    def test_char_pr_render_distinguishes_equal_values(self):
+        """1000 and 1000.0 compare equal but must render as given."""
+        from hwpxlib.models.head import CharPr, FontRef
+        from hwpxlib.xml_writer import _write_char_pr
+        assert 'height="1000"' in _write_char_pr(CharPr(id=0, height=1000))
+        assert 'height="1000.0"' in _write_char_pr(CharPr(id=0, height=1000.0))
+        assert 'hangul="1"' in _write_char_pr(CharPr(id=0, font_ref=FontRef(hangul=1)))
+        assert 'hangul="True"' in _write_char_pr(CharPr(id=0, font_ref=FontRef(hangul=True)))
+
+    def test_font_faces_share_fonts(self):
+        from hwpxlib.template import default_font_faces
+        faces = default_font_faces(StyleConfig(font_body="Arial"))
+        assert all(ff.fonts[0] is faces[0].fonts[0] for ff in faces)
+        assert faces[-1].fonts[0].face == "Arial"
 
 
 # === Header/Footer Support ===
 
+@pytest.fixture(scope="module")
+def hf_section():
+    """section0.xml of one document with both a header and a footer.
+
+    The output tests below are read-only views of the same section, so the
+    document is built once for all of them.
+    """
+    doc = HwpxDocument.new(seed=42)
+    doc.set_header("Report Header")
+    doc.set_footer("Page Footer")
+    doc.add_paragraph("Body text")
+    return hwpx_member(doc, "Contents/section0.xml")
+
+
 class TestHeaderFooter:
 
     def test_set_header_text(self):
@@ -357,62 +326,27 @@ class TestHeaderFooter:
         assert doc._footer.paragraphs[0].runs[0].text == "Page Footer"
         assert doc._footer.apply_page_type == "ODD"
 
-    def test_header_in_section_xml(self, tmp_path):
-        doc = HwpxDocument.new(seed=42)
-        doc.set_header("Report Header")
-        doc.add_paragraph("Body text")
-        out = tmp_path / "header.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            section = zf.read("Contents/section0.xml").decode("utf-8")
-        assert "hp:header" in section
-        assert "Report Header" in section
-        assert 'applyPageType="BOTH"' in section
-
-    def test_footer_in_section_xml(self, tmp_path):
-        doc = HwpxDocument.new(seed=42)
-        doc.set_footer("Page Footer")
-        doc.add_paragraph("Body text")
-        out = tmp_path / "footer.hwpx"
-        doc.save(str(out))
+    def test_header_in_section_xml(self, hf_section):
+        assert b"hp:header" in hf_section
+        assert b"Report Header" in hf_section
+        assert b'applyPageType="BOTH"' in hf_section
 
-        with zipfile.ZipFile(str(out)) as zf:
-            section = zf.read("Contents/section0.xml").decode("utf-8")
-        assert "hp:footer" in section
-        assert "Page Footer" in section
+    def test_footer_in_section_xml(self, hf_section):
+        assert b"hp:footer" in hf_section
+        assert b"Page Footer" in hf_section
 
-    def test_both_header_and_footer(self, tmp_path):
-        doc = HwpxDocument.new(seed=42)
-        doc.set_header("Header")
-        doc.set_footer("Footer")
-        doc.add_paragraph("Body")
-        out = tmp_path / "both.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            section = zf.read("Contents/section0.xml").decode("utf-8")
-        assert "hp:header" in section
-        assert "hp:footer" in section
-        assert "Header" in section
-        assert "Footer" in section
-
-    def test_header_has_sublist_structure(self, tmp_path):
-        doc = HwpxDocument.new(seed=42)
-        doc.set_header("Test")
-        doc.add_paragraph("Body")
-        out = tmp_path / "hf_struct.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            section = zf.read("Contents/section0.xml").decode("utf-8")
-        tree = ET.fromstring(section)
-        ns = {"hp": "http://www.hancom.co.kr/hwpml/2011/paragraph"}
-        headers = tree.findall(".//hp:header", ns)
+    def test_both_header_and_footer(self, hf_section):
+        assert b"hp:header" in hf_section
+        assert b"hp:footer" in hf_section
+        assert b"Body text" in hf_section
+
+    def test_header_has_sublist_structure(self, hf_section):
+        tree = parse_xml(hf_section)
+        headers = _HEADER_XPATH(tree)
         assert len(headers) == 1
-        sublists = headers[0].findall("hp:subList", ns)
+        sublists = _SUBLIST_XPATH(headers[0])
         assert len(sublists) == 1
-        paras = sublists[0].findall("hp:p", ns)
+        paras = _P_XPATH(sublists[0])
         assert len(paras) >= 1
 
     def test_header_footer_chaining(self):
@@ -451,30 +385,22 @@ class TestTOC:
         assert texts[1] == "  H2"     # 2-space indent for level 2
         assert texts[2] == "    H3"   # 4-space indent for level 3
 
-    def test_toc_in_output_xml(self, tmp_path):
+    def test_toc_in_output_xml(self):
         doc = HwpxDocument.new(seed=42)
         doc.add_heading("Introduction", level=1)
         doc.add_heading("Methods", level=1)
         doc.add_toc(title="TOC")
-        out = tmp_path / "toc.hwpx"
-        doc.save(str(out))
+        section = hwpx_member(doc, "Contents/section0.xml")
+        assert b"Introduction" in section
+        assert b"Methods" in section
+        assert b"TOC" in section
 
-        with zipfile.ZipFile(str(out)) as zf:
-            section = zf.read("Contents/section0.xml").decode("utf-8")
-        assert "Introduction" in section
-        assert "Methods" in section
-        assert "TOC" in section
-
-    def test_no_header_footer_by_default(self, tmp_path):
+    def test_no_header_footer_by_default(self):
         doc = HwpxDocument.new(seed=42)
         doc.add_paragraph("Body only")
-        out = tmp_path / "no_hf.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            section = zf.read("Contents/section0.xml").decode("utf-8")
-        assert "hp:header" not in section
-        assert "hp:footer" not in section
+        section = hwpx_member(doc, "Contents/section0.xml")
+        assert b"hp:header" not in section
+        assert b"hp:footer" not in section
 
 
 class TestBlockQuote:
@@ -495,32 +421,17 @@ class TestBlockQuote:
         assert para.runs[0].char_pr_id_ref == 1  # CHARPR_BOLD
         assert para.para_pr_id_ref == 16  # PARAPR_BLOCKQUOTE
 
-    def test_blockquote_in_output_xml(self, tmp_path):
+    def test_blockquote_in_output_xml(self):
         doc = HwpxDocument.new(seed=42)
         doc.add_blockquote("Quoted text")
-        out = tmp_path / "bq.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            section = zf.read("Contents/section0.xml").decode("utf-8")
-        assert "Quoted text" in section
+        section = hwpx_member(doc, "Contents/section0.xml")
+        assert b"Quoted text" in section
         # paraPrIDRef="16" in the output
-        assert 'paraPrIDRef="16"' in section
+        assert b'paraPrIDRef="16"' in section
 
-    def test_blockquote_borderfill_in_header(self, tmp_path):
-        doc = HwpxDocument.new(seed=42)
-        doc.add_blockquote("Test")
-        out = tmp_path / "bq_hdr.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            header = zf.read("Contents/header.xml").decode("utf-8")
+    def test_blockquote_borderfill_in_header(self, feature_header):
         # borderFill id=8 should exist with left border
-        root = ET.fromstring(header)
-        ns = {"hh": "http://www.hancom.co.kr/hwpml/2011/head"}
-        bfs = root.findall(".//hh:borderFill", ns)
-        bf_ids = [bf.get("id") for bf in bfs]
-        assert "8" in bf_ids
+        assert b'<hh:borderFill id="8" ' in feature_header
 
     def test_blockquote_no_curly_quotes(self):
         """Blockquote should NOT wrap text in curly quotes anymore."""
@@ -532,8 +443,6 @@ class TestBlockQuote:
 
     def test_md_blockquote_conversion(self):
         """Markdown blockquote should use add_blockquote, not italic paragraph."""
-        from converters.md_parser import parse_markdown
-        from converters.md2hwpx import convert_md_to_hwpx
 
         md = "> This is a blockquote"
         doc = convert_md_to_hwpx(md)
@@ -560,22 +469,9 @@ class TestStrikethrough:
         para = doc.add_mixed_paragraph(segments)
         assert para.runs[1].char_pr_id_ref == 15  # CHARPR_STRIKETHROUGH
 
-    def test_strikethrough_in_output_xml(self, tmp_path):
-        doc = HwpxDocument.new(seed=42)
-        doc.add_mixed_paragraph([{"text": "strike", "strikethrough": True}])
-        out = tmp_path / "strike.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            header = zf.read("Contents/header.xml").decode("utf-8")
+    def test_strikethrough_in_output_xml(self, feature_header):
         # charPr id=15 should have strikeout shape="SOLID"
-        root = ET.fromstring(header)
-        ns = {"hh": "http://www.hancom.co.kr/hwpml/2011/head"}
-        cps = root.findall(".//hh:charPr", ns)
-        cp15 = [cp for cp in cps if cp.get("id") == "15"][0]
-        strike = cp15.find("hh:strikeout", ns)
-        assert strike is not None
-        assert strike.get("shape") == "SOLID"
+        assert b'<hh:strikeout shape="SOLID"' in _charpr_body(feature_header, 15)
 
     def test_md_strikethrough_parsing(self):
         from converters.md_parser import parse_inline
@@ -585,7 +481,6 @@ class TestStrikethrough:
         assert segs[1].text == "deleted"
 
     def test_md_strikethrough_conversion(self):
-        from converters.md2hwpx import convert_md_to_hwpx
         doc = convert_md_to_hwpx("This has ~~deleted~~ text")
         found = False
         for elem in doc._elements:
@@ -603,30 +498,22 @@ class TestPageBreak:
         para = doc.add_page_break()
         assert para.page_break is True
 
-    def test_page_break_in_xml(self, tmp_path):
+    def test_page_break_in_xml(self):
         doc = HwpxDocument.new(seed=42)
         doc.add_paragraph("Page 1 content")
         doc.add_page_break()
         doc.add_paragraph("Page 2 content")
-        out = tmp_path / "pb.hwpx"
-        doc.save(str(out))
+        section = hwpx_member(doc, "Contents/section0.xml")
+        assert b'pageBreak="1"' in section
+        assert b"Page 1 content" in section
+        assert b"Page 2 content" in section
 
-        with zipfile.ZipFile(str(out)) as zf:
-            section = zf.read("Contents/section0.xml").decode("utf-8")
-        assert 'pageBreak="1"' in section
-        assert "Page 1 content" in section
-        assert "Page 2 content" in section
-
-    def test_normal_paragraph_no_page_break(self, tmp_path):
+    def test_normal_paragraph_no_page_break(self):
         doc = HwpxDocument.new(seed=42)
         doc.add_paragraph("Normal text")
-        out = tmp_path / "no_pb.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            section = zf.read("Contents/section0.xml").decode("utf-8")
+        section = hwpx_member(doc, "Contents/section0.xml")
         # All normal paragraphs should have pageBreak="0"
-        assert 'pageBreak="1"' not in section
+        assert b'pageBreak="1"' not in section
 
 
 class TestSuperSubscript:
@@ -642,37 +529,11 @@ class TestSuperSubscript:
         para = doc.add_mixed_paragraph(segs)
         assert para.runs[1].char_pr_id_ref == 17  # CHARPR_SUBSCRIPT
 
-    def test_superscript_offset_in_xml(self, tmp_path):
-        doc = HwpxDocument.new(seed=42)
-        doc.add_mixed_paragraph([{"text": "x", "superscript": True}])
-        out = tmp_path / "sup.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            header = zf.read("Contents/header.xml").decode("utf-8")
-        root = ET.fromstring(header)
-        ns = {"hh": "http://www.hancom.co.kr/hwpml/2011/head"}
-        cps = root.findall(".//hh:charPr", ns)
-        cp16 = [cp for cp in cps if cp.get("id") == "16"][0]
-        offset = cp16.find("hh:offset", ns)
-        assert offset is not None
-        assert offset.get("hangul") == "50"
-
-    def test_subscript_offset_in_xml(self, tmp_path):
-        doc = HwpxDocument.new(seed=42)
-        doc.add_mixed_paragraph([{"text": "x", "subscript": True}])
-        out = tmp_path / "sub.hwpx"
-        doc.save(str(out))
+    def test_superscript_offset_in_xml(self, feature_header):
+        assert b'<hh:offset hangul="50"' in _charpr_body(feature_header, 16)
 
-        with zipfile.ZipFile(str(out)) as zf:
-            header = zf.read("Contents/header.xml").decode("utf-8")
-        root = ET.fromstring(header)
-        ns = {"hh": "http://www.hancom.co.kr/hwpml/2011/head"}
-        cps = root.findall(".//hh:charPr", ns)
-        cp17 = [cp for cp in cps if cp.get("id") == "17"][0]
-        offset = cp17.find("hh:offset", ns)
-        assert offset is not None
-        assert offset.get("hangul") == "-50"
+    def test_subscript_offset_in_xml(self, feature_header):
+        assert b'<hh:offset hangul="-50"' in _charpr_body(feature_header, 17)
 
 
 class TestFootnoteEndnote:
@@ -692,18 +553,14 @@ class TestFootnoteEndnote:
         assert fn1.number == 1
         assert fn2.number == 2
 
-    def test_footnote_in_xml(self, tmp_path):
+    def test_footnote_in_xml(self):
         doc = HwpxDocument.new(seed=42)
         doc.add_footnote("anchor", "footnote content")
-        out = tmp_path / "fn.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            section = zf.read("Contents/section0.xml").decode("utf-8")
-        assert "hp:footNote" in section
-        assert "footnote content" in section
-        assert "anchor" in section
-        assert "hp:subList" in section
+        section = hwpx_member(doc, "Contents/section0.xml")
+        assert b"hp:footNote" in section
+        assert b"footnote content" in section
+        assert b"anchor" in section
+        assert b"hp:subList" in section
 
     def test_endnote_creates_paragraph(self):
         doc = HwpxDocument.new(seed=42)
@@ -711,99 +568,76 @@ class TestFootnoteEndnote:
         assert para.runs[0].endnote is not None
         assert para.runs[0].endnote.number == 1
 
-    def test_endnote_in_xml(self, tmp_path):
+    def test_endnote_in_xml(self):
         doc = HwpxDocument.new(seed=42)
         doc.add_endnote("anchor", "endnote content")
-        out = tmp_path / "en.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            section = zf.read("Contents/section0.xml").decode("utf-8")
-        assert "hp:endNote" in section
-        assert "endnote content" in section
+        section = hwpx_member(doc, "Contents/section0.xml")
+        assert b"hp:endNote" in section
+        assert b"endnote content" in section
 
 
 class TestMultiSection:
-    def test_single_section_backward_compat(self, tmp_path):
+    def test_single_section_backward_compat(self):
         """Documents without add_section() still work as before."""
         doc = HwpxDocument.new(seed=42)
         doc.add_paragraph("Single section")
-        out = tmp_path / "single.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            names = zf.namelist()
+        names = hwpx_entries(doc).keys()
         assert "Contents/section0.xml" in names
         assert "Contents/section1.xml" not in names
 
-    def test_two_sections(self, tmp_path):
+    def test_two_sections(self):
         doc = HwpxDocument.new(seed=42)
         doc.add_heading("Section 1", level=1)
         doc.add_paragraph("Content of section 1")
         doc.add_section()  # start new section
         doc.add_heading("Section 2", level=1)
         doc.add_paragraph("Content of section 2")
-        out = tmp_path / "multi.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            names = zf.namelist()
-            sec0 = zf.read("Contents/section0.xml").decode("utf-8")
-            sec1 = zf.read("Contents/section1.xml").decode("utf-8")
-            hpf = zf.read("Contents/content.hpf").decode("utf-8")
-            rdf = zf.read("META-INF/container.rdf").decode("utf-8")
+        entries = hwpx_entries(doc)
+        names = entries.keys()
+        sec0 = entries["Contents/section0.xml"]
+        sec1 = entries["Contents/section1.xml"]
+        hpf = entries["Contents/content.hpf"]
+        rdf = entries["META-INF/container.rdf"]
 
         assert "Contents/section0.xml" in names
         assert "Contents/section1.xml" in names
-        assert "Section 1" in sec0
-        assert "Section 2" in sec1
-        assert "Section 1" not in sec1
-        assert "section0" in hpf
-        assert "section1" in hpf
-        assert "section0.xml" in rdf
-        assert "section1.xml" in rdf
-
-    def test_section_with_different_page_setup(self, tmp_path):
-        from hwpxlib.models.body import PageSetup
+        assert b"Section 1" in sec0
+        assert b"Section 2" in sec1
+        assert b"Section 1" not in sec1
+        assert b"section0" in hpf
+        assert b"section1" in hpf
+        assert b"section0.xml" in rdf
+        assert b"section1.xml" in rdf
+
+    def test_section_with_different_page_setup(self):
         doc = HwpxDocument.new(seed=42)
         doc.add_paragraph("Portrait content")
         doc.add_section(page_setup=PageSetup.a4(landscape=True))
         doc.add_paragraph("Landscape content")
-        out = tmp_path / "landscape.hwpx"
-        doc.save(str(out))
+        sec1 = hwpx_member(doc, "Contents/section1.xml")
+        assert b'landscape="NARROWLY"' in sec1
 
-        with zipfile.ZipFile(str(out)) as zf:
-            sec1 = zf.read("Contents/section1.xml").decode("utf-8")
-        assert 'landscape="NARROWLY"' in sec1
-
-    def test_section_with_header_footer(self, tmp_path):
+    def test_section_with_header_footer(self):
         doc = HwpxDocument.new(seed=42)
         doc.set_header("Header 1")
         doc.add_paragraph("First section")
         doc.add_section()
         doc.set_header("Header 2")
         doc.add_paragraph("Second section")
-        out = tmp_path / "multi_hf.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            sec0 = zf.read("Contents/section0.xml").decode("utf-8")
-            sec1 = zf.read("Contents/section1.xml").decode("utf-8")
-        assert "Header 1" in sec0
-        assert "Header 2" in sec1
+        entries = hwpx_entries(doc, "Contents/section0.xml", "Contents/section1.xml")
+        sec0 = entries["Contents/section0.xml"]
+        sec1 = entries["Contents/section1.xml"]
+        assert b"Header 1" in sec0
+        assert b"Header 2" in sec1
 
-    def test_three_sections(self, tmp_path):
+    def test_three_sections(self):
         doc = HwpxDocument.new(seed=42)
         doc.add_paragraph("S1")
         doc.add_section()
         doc.add_paragraph("S2")
         doc.add_section()
         doc.add_paragraph("S3")
-        out = tmp_path / "three.hwpx"
-        doc.save(str(out))
-
-        with zipfile.ZipFile(str(out)) as zf:
-            names = zf.namelist()
+        names = hwpx_entries(doc).keys()
         assert "Contents/section0.xml" in names
         assert "Contents/section1.xml" in names
         assert "Contents/section2.xml" in names
@@ -3,11 +3,12 @@
 Spec: specs/11-md-conversion.md
 """
 import zipfile
-from pathlib import Path
-from xml.etree import ElementTree as ET
+from collections import Counter
 
 import pytest
-from tests import NS
+from tests import (
+    NS, HwpxArchive, HH_HEAD, HP_P, HP_RUN, HP_SECPR, HP_TBL, HS_SEC,
+)
 
 
 SAMPLE_MD = """\
@@ -34,84 +35,71 @@ Normal paragraph here.
 """
 
 
+# Every test only reads the converted file, so it is built once per module
+# and each member is parsed at most once.
+@pytest.fixture(scope="module")
+def roundtrip_hwpx(tmp_path_factory) -> HwpxArchive:
+    from converters.md2hwpx import convert_md_to_hwpx
+    doc = convert_md_to_hwpx(SAMPLE_MD)
+    out = tmp_path_factory.mktemp("roundtrip") / "roundtrip.hwpx"
+    doc.save(str(out), compression=zipfile.ZIP_STORED)
+    return HwpxArchive(out)
+
+
+@pytest.fixture(scope="module")
+def para_pr_counts(roundtrip_hwpx) -> Counter:
+    """paraPrIDRef -> number of top-level paragraphs, from one scan."""
+    root = roundtrip_hwpx.tree("Contents/section0.xml")
+    return Counter(p.get("paraPrIDRef") for p in root.iterfind(HP_P))
+
+
 class TestMarkdownRoundtrip:
-    @pytest.fixture
-    def roundtrip_hwpx(self, tmp_path) -> Path:
-        from converters.md2hwpx import convert_md_to_hwpx
-        doc = convert_md_to_hwpx(SAMPLE_MD)
-        out = tmp_path / "roundtrip.hwpx"
-        doc.save(str(out))
-        return out
 
     def test_hwpx_is_valid_zip(self, roundtrip_hwpx):
-        assert zipfile.is_zipfile(roundtrip_hwpx)
+        assert zipfile.is_zipfile(roundtrip_hwpx.path)
 
     def test_has_all_entries(self, roundtrip_hwpx):
-        with zipfile.ZipFile(roundtrip_hwpx, "r") as zf:
-            names = zf.namelist()
-            assert "mimetype" in names
-            assert "Contents/header.xml" in names
-            assert "Contents/section0.xml" in names
+        names = roundtrip_hwpx.names()
+        assert "mimetype" in names
+        assert "Contents/header.xml" in names
+        assert "Contents/section0.xml" in names
 
     def test_header_is_valid_xml(self, roundtrip_hwpx):
-        with zipfile.ZipFile(roundtrip_hwpx, "r") as zf:
-            xml = zf.read("Contents/header.xml").decode("utf-8")
-        root = ET.fromstring(xml)
-        assert root.tag == f"{{{NS['hh']}}}head"
+        root = roundtrip_hwpx.tree("Contents/header.xml")
+        assert root.tag == HH_HEAD
 
     def test_section_is_valid_xml(self, roundtrip_hwpx):
-        with zipfile.ZipFile(roundtrip_hwpx, "r") as zf:
-            xml = zf.read("Contents/section0.xml").decode("utf-8")
-        root = ET.fromstring(xml)
-        assert root.tag == f"{{{NS['hs']}}}sec"
+        root = roundtrip_hwpx.tree("Contents/section0.xml")
+        assert root.tag == HS_SEC
 
     def test_section_has_heading(self, roundtrip_hwpx):
-        with zipfile.ZipFile(roundtrip_hwpx, "r") as zf:
-            xml = zf.read("Contents/section0.xml").decode("utf-8")
-        root = ET.fromstring(xml)
-        paragraphs = root.findall(f"{{{NS['hp']}}}p")
+        root = roundtrip_hwpx.tree("Contents/section0.xml")
         # First paragraph should be heading 1
-        first_p = paragraphs[0]
+        first_p = root.find(HP_P)
         assert first_p.get("styleIDRef") == "1"  # Heading 1 style
 
     def test_section_has_table(self, roundtrip_hwpx):
-        with zipfile.ZipFile(roundtrip_hwpx, "r") as zf:
-            xml = zf.read("Contents/section0.xml").decode("utf-8")
-        root = ET.fromstring(xml)
-        tables = root.findall(f".//{{{NS['hp']}}}tbl")
-        assert len(tables) >= 1, "Should have at least one table"
-
-    def test_section_has_bullets(self, roundtrip_hwpx):
-        with zipfile.ZipFile(roundtrip_hwpx, "r") as zf:
-            xml = zf.read("Contents/section0.xml").decode("utf-8")
-        root = ET.fromstring(xml)
+        root = roundtrip_hwpx.tree("Contents/section0.xml")
+        # find() stops at the first match
+        assert root.find(".//" + HP_TBL) is not None, "Should have at least one table"
+
+    def test_section_has_bullets(self, para_pr_counts):
         # Bullet paragraphs use paraPrIDRef="8"
-        bullet_paras = [p for p in root.findall(f"{{{NS['hp']}}}p")
-                        if p.get("paraPrIDRef") == "8"]
-        assert len(bullet_paras) >= 2
-
-    def test_section_has_code_block(self, roundtrip_hwpx):
-        with zipfile.ZipFile(roundtrip_hwpx, "r") as zf:
-            xml = zf.read("Contents/section0.xml").decode("utf-8")
-        root = ET.fromstring(xml)
+        assert para_pr_counts["8"] >= 2
+
+    def test_section_has_code_block(self, para_pr_counts):
         # Code block paragraphs use paraPrIDRef="7"
-        code_paras = [p for p in root.findall(f"{{{NS['hp']}}}p")
-                      if p.get("paraPrIDRef") == "7"]
-        assert len(code_paras) >= 1
+        assert para_pr_counts["7"] >= 1
 
     def test_first_para_has_secpr(self, roundtrip_hwpx):
-        with zipfile.ZipFile(roundtrip_hwpx, "r") as zf:
-            xml = zf.read("Contents/section0.xml").decode("utf-8")
-        root = ET.fromstring(xml)
-        first_p = root.find(f"{{{NS['hp']}}}p")
-        first_run = first_p.find(f"{{{NS['hp']}}}run")
-        sec_pr = first_run.find(f"{{{NS['hp']}}}secPr")
+        root = roundtrip_hwpx.tree("Contents/section0.xml")
+        first_p = root.find(HP_P)
+        first_run = first_p.find(HP_RUN)
+        sec_pr = first_run.find(HP_SECPR)
         assert sec_pr is not None
 
     def test_styles_have_langid_1042(self, roundtrip_hwpx):
-        with zipfile.ZipFile(roundtrip_hwpx, "r") as zf:
-            xml = zf.read("Contents/header.xml").decode("utf-8")
-        root = ET.fromstring(xml)
+        root = roundtrip_hwpx.tree("Contents/header.xml")
         styles = root.findall(".//hh:style", NS)
         for st in styles:
             assert st.get("langID") == "1042"
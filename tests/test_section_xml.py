@@ -2,72 +2,61 @@
 
 Spec: specs/08-section-structure.md, specs/09-paragraph-runs.md
 """
-from xml.etree import ElementTree as ET
+from itertools import islice
 
 import pytest
-from tests import NS
+from tests import HP_COLPR, HP_CTRL, HP_P, HP_PAGEPR, HP_RUN, HP_SECPR, HS_SEC
 
 
 class TestSectionRoot:
     """Spec: specs/08-section-structure.md"""
 
     def test_root_tag_is_hs_sec(self, ref_section_tree):
-        expected_tag = f"{{{NS['hs']}}}sec"
+        expected_tag = HS_SEC
         assert ref_section_tree.tag == expected_tag
 
-    def test_generated_root_tag(self, generated_hwpx_path):
-        import zipfile
-        with zipfile.ZipFile(generated_hwpx_path, "r") as zf:
-            xml = zf.read("Contents/section0.xml").decode("utf-8")
-        root = ET.fromstring(xml)
-        expected_tag = f"{{{NS['hs']}}}sec"
+    def test_generated_root_tag(self, generated_section_root):
+        root = generated_section_root
+        expected_tag = HS_SEC
         assert root.tag == expected_tag
 
-    def test_section_has_namespaces(self, generated_hwpx_path):
-        import zipfile
-        with zipfile.ZipFile(generated_hwpx_path, "r") as zf:
-            xml = zf.read("Contents/section0.xml").decode("utf-8")
+    def test_section_has_namespaces(self, generated_section_xml_bytes):
+        xml = generated_section_xml_bytes
         # Check all three required namespace declarations
-        assert 'xmlns:hp=' in xml
-        assert 'xmlns:hs=' in xml
-        assert 'xmlns:hc=' in xml
+        assert b'xmlns:hp=' in xml
+        assert b'xmlns:hs=' in xml
+        assert b'xmlns:hc=' in xml
 
 
 class TestSecPr:
     """First paragraph must contain secPr."""
 
     def test_first_para_has_secpr(self, ref_section_tree):
-        first_p = ref_section_tree.find(f"{{{NS['hp']}}}p")
+        first_p = ref_section_tree.find(HP_P)
         assert first_p is not None, "No paragraphs in section"
-        first_run = first_p.find(f"{{{NS['hp']}}}run")
+        first_run = first_p.find(HP_RUN)
         assert first_run is not None, "No run in first paragraph"
-        sec_pr = first_run.find(f"{{{NS['hp']}}}secPr")
+        sec_pr = first_run.find(HP_SECPR)
         assert sec_pr is not None, "First run must contain secPr"
 
-    def test_generated_first_para_has_secpr(self, generated_hwpx_path):
-        import zipfile
-        with zipfile.ZipFile(generated_hwpx_path, "r") as zf:
-            xml = zf.read("Contents/section0.xml").decode("utf-8")
-        root = ET.fromstring(xml)
-        first_p = root.find(f"{{{NS['hp']}}}p")
-        first_run = first_p.find(f"{{{NS['hp']}}}run")
-        sec_pr = first_run.find(f"{{{NS['hp']}}}secPr")
+    def test_generated_first_para_has_secpr(self, generated_section_root):
+        root = generated_section_root
+        first_p = root.find(HP_P)
+        first_run = first_p.find(HP_RUN)
+        sec_pr = first_run.find(HP_SECPR)
         assert sec_pr is not None, "Generated first run must contain secPr"
 
     def test_secpr_page_dimensions(self, ref_section_tree):
-        sec_pr = ref_section_tree.find(f".//{{{NS['hp']}}}secPr")
-        page_pr = sec_pr.find(f"{{{NS['hp']}}}pagePr")
+        sec_pr = ref_section_tree.find(".//" + HP_SECPR)
+        page_pr = sec_pr.find(HP_PAGEPR)
         assert page_pr.get("width") == "59530"
         assert page_pr.get("height") == "84190"
         assert page_pr.get("landscape") == "WIDELY"
 
-    def test_generated_page_dimensions(self, generated_hwpx_path):
-        import zipfile
-        with zipfile.ZipFile(generated_hwpx_path, "r") as zf:
-            xml = zf.read("Contents/section0.xml").decode("utf-8")
-        root = ET.fromstring(xml)
-        sec_pr = root.find(f".//{{{NS['hp']}}}secPr")
-        page_pr = sec_pr.find(f"{{{NS['hp']}}}pagePr")
+    def test_generated_page_dimensions(self, generated_section_root):
+        root = generated_section_root
+        sec_pr = root.find(".//" + HP_SECPR)
+        page_pr = sec_pr.find(HP_PAGEPR)
         assert page_pr.get("width") == "59530"
         assert page_pr.get("height") == "84190"
 
@@ -76,23 +65,20 @@ class TestColPr:
     """First paragraph must contain colPr after secPr."""
 
     def test_first_para_has_colpr(self, ref_section_tree):
-        first_p = ref_section_tree.find(f"{{{NS['hp']}}}p")
-        first_run = first_p.find(f"{{{NS['hp']}}}run")
-        ctrl = first_run.find(f"{{{NS['hp']}}}ctrl")
+        first_p = ref_section_tree.find(HP_P)
+        first_run = first_p.find(HP_RUN)
+        ctrl = first_run.find(HP_CTRL)
         assert ctrl is not None, "First run must contain ctrl"
-        col_pr = ctrl.find(f"{{{NS['hp']}}}colPr")
+        col_pr = ctrl.find(HP_COLPR)
         assert col_pr is not None, "ctrl must contain colPr"
 
-    def test_generated_first_para_has_colpr(self, generated_hwpx_path):
-        import zipfile
-        with zipfile.ZipFile(generated_hwpx_path, "r") as zf:
-            xml = zf.read("Contents/section0.xml").decode("utf-8")
-        root = ET.fromstring(xml)
-        first_p = root.find(f"{{{NS['hp']}}}p")
-        first_run = first_p.find(f"{{{NS['hp']}}}run")
-        ctrl = first_run.find(f"{{{NS['hp']}}}ctrl")
+    def test_generated_first_para_has_colpr(self, generated_section_root):
+        root = generated_section_root
+        first_p = root.find(HP_P)
+        first_run = first_p.find(HP_RUN)
+        ctrl = first_run.find(HP_CTRL)
         assert ctrl is not None
-        col_pr = ctrl.find(f"{{{NS['hp']}}}colPr")
+        col_pr = ctrl.find(HP_COLPR)
         assert col_pr is not None
 
 
@@ -100,8 +86,8 @@ class TestParagraphRuns:
     """Spec: specs/09-paragraph-runs.md"""
 
     def test_paragraph_has_required_attrs(self, ref_section_tree):
-        paragraphs = ref_section_tree.findall(f"{{{NS['hp']}}}p")
-        for p in paragraphs[:5]:
+        # iterfind stops after the sampled elements instead of listing them all
+        for p in islice(ref_section_tree.iterfind(HP_P), 5):
             assert p.get("paraPrIDRef") is not None
             assert p.get("styleIDRef") is not None
             assert p.get("pageBreak") is not None
@@ -109,6 +95,5 @@ class TestParagraphRuns:
             assert p.get("merged") is not None
 
     def test_run_has_charpr_ref(self, ref_section_tree):
-        runs = ref_section_tree.findall(f".//{{{NS['hp']}}}run")
-        for run in runs[:10]:
+        for run in islice(ref_section_tree.iterfind(".//" + HP_RUN), 10):
             assert run.get("charPrIDRef") is not None
@@ -7,16 +7,30 @@ Covers:
 - MCP server input validation
 """
 import threading
-import xml.etree.ElementTree as ET
 
 import pytest
 
 from hwpxlib.xml_writer import (
     _esc, _esc_attr, _write_font_face, _write_style,
-    set_id_seed, reset_id_seed, _unique_id,
+    set_id_seed, reset_id_seed, _unique_id, _unique_ids, _id_gen,
 )
 from hwpxlib.package import HwpxPackage
 from hwpxlib.models.head import Font, FontFace, Style
+from tests import parse_xml
+
+
+# Writer fragments use a bare namespace prefix; a fixed <root> declaring it
+# as http://test makes them parseable. The wrappers are encoded once.
+_FRAGMENT_OPEN = {
+    prefix: f'<root xmlns:{prefix}="http://test">'.encode()
+    for prefix in ("hh", "hp")
+}
+_FRAGMENT_CLOSE = b'</root>'
+
+
+def _parse_fragment(prefix: str, xml: str):
+    """Parse a writer fragment that uses *prefix* without declaring it."""
+    return parse_xml(_FRAGMENT_OPEN[prefix] + xml.encode("utf-8") + _FRAGMENT_CLOSE)
 
 
 class TestXmlEscaping:
@@ -26,19 +40,23 @@ class TestXmlEscaping:
         assert _esc('<script>') == '&lt;script&gt;'
         assert _esc('a & b') == 'a &amp; b'
 
-    def test_esc_attr_escapes_double_quotes(self):
-        result = _esc_attr('value" evil="injected')
-        assert '"' not in result or '&quot;' in result
-        assert '&quot;' in result
-
-    def test_esc_attr_escapes_angle_brackets(self):
-        result = _esc_attr('<evil>')
-        assert '&lt;' in result
-        assert '&gt;' in result
-
-    def test_esc_attr_escapes_ampersand(self):
-        result = _esc_attr('a&b')
-        assert '&amp;' in result
+    @pytest.mark.parametrize("raw, must_have", [
+        ('value" evil="injected', ['&quot;']),
+        ('<evil>', ['&lt;', '&gt;']),
+        ('<script>', ['&lt;', '&gt;']),
+        ('a&b', ['&amp;']),
+        ('a & b', ['&amp;']),
+    ])
+    def test_esc_attr_escapes(self, raw, must_have):
+        result = _esc_attr(raw)
+        for entity in must_have:
+            assert entity in result
+        assert '"' not in result and '<' not in result and '>' not in result
+
+    def test_esc_attr_cache_distinguishes_equal_values(self):
+        """1 and True hash alike; the memoized escape must keep them apart."""
+        assert _esc_attr(1) == '1'
+        assert _esc_attr(True) == 'True'
 
     def test_font_face_with_malicious_name(self):
         """Font name containing " should not break XML attribute boundary."""
@@ -48,8 +66,7 @@ class TestXmlEscaping:
         # Should produce valid XML (no unescaped quotes in attributes)
         assert '&quot;' in xml
         # Verify it parses as valid XML
-        wrapped = f'<root xmlns:hh="http://test">{xml}</root>'
-        tree = ET.fromstring(wrapped)
+        tree = _parse_fragment("hh", xml)
         font_el = tree.find('.//{http://test}font')
         assert font_el is not None
         # The face attribute should contain the original text (decoded)
@@ -64,11 +81,20 @@ class TestXmlEscaping:
         )
         xml = _write_style(s)
         assert '&quot;' in xml
-        wrapped = f'<root xmlns:hh="http://test">{xml}</root>'
-        tree = ET.fromstring(wrapped)
+        tree = _parse_fragment("hh", xml)
         style_el = tree.find('.//{http://test}style')
         assert style_el.get('name') == 'Evil" extra="x'
 
+    def test_link_url_round_trips(self):
+        """Hyperlink Command text is escaped exactly once."""
+        from hwpxlib.xml_writer import write_paragraph
+        from hwpxlib.models.body import Paragraph, Run
+        url = 'http://x?a=1&b="2"<'
+        xml = write_paragraph(Paragraph(runs=[Run(text="t", link_url=url)]))
+        tree = _parse_fragment("hp", xml)
+        param = tree.find('.//{http://test}stringParam')
+        assert param.text == url
+
 
 class TestZipPathTraversal:
     """Verify ZIP path traversal prevention."""
@@ -114,27 +140,51 @@ class TestThreadSafeIdGeneration:
 
     def test_deterministic_seed_produces_same_ids(self):
         set_id_seed(42)
-        ids_a = [_unique_id() for _ in range(10)]
+        ids_a = list(_unique_ids(10))
         set_id_seed(42)
-        ids_b = [_unique_id() for _ in range(10)]
+        ids_b = list(_unique_ids(10))
         reset_id_seed()
         assert ids_a == ids_b
 
     def test_different_seeds_produce_different_ids(self):
         set_id_seed(42)
-        ids_a = [_unique_id() for _ in range(10)]
+        ids_a = list(_unique_ids(10))
         set_id_seed(99)
-        ids_b = [_unique_id() for _ in range(10)]
+        ids_b = list(_unique_ids(10))
         reset_id_seed()
         assert ids_a != ids_b
 
+    def test_ids_are_distinct_nine_digit_ints(self):
+        set_id_seed(7)
+        ids = list(_unique_ids(1000))
+        reset_id_seed()
+        assert len(set(ids)) == len(ids)
+        assert all(100000000 <= i <= 999999999 for i in ids)
+
+    def test_ids_wrap_instead_of_growing_past_nine_digits(self):
+        set_id_seed(7)
+        _id_gen._local.counter = _id_gen._count_from(_id_gen._ID_MAX - 1)
+        ids = [_unique_id() for _ in range(3)] + list(_unique_ids(3))
+        _id_gen._local.counter = _id_gen._count_from(_id_gen._ID_MAX)
+        ids += list(_unique_ids(2))
+        reset_id_seed()
+        assert all(100000000 <= i <= 999999999 for i in ids)
+        assert ids[:3] == [999999998, 999999999, 100000000]
+
+    def test_reserved_id_block_is_not_reissued(self):
+        set_id_seed(7)
+        block = list(_unique_ids(50))
+        later = [_unique_id() for _ in range(50)]
+        reset_id_seed()
+        assert len(set(block) | set(later)) == 100
+
     def test_thread_isolation(self):
         """IDs generated in one thread should not affect another thread's sequence."""
         results = {}
 
         def generate_ids(thread_name, seed):
             set_id_seed(seed)
-            results[thread_name] = [_unique_id() for _ in range(5)]
+            results[thread_name] = list(_unique_ids(5))
             reset_id_seed()
 
         t1 = threading.Thread(target=generate_ids, args=("t1", 42))
@@ -149,10 +199,10 @@ class TestThreadSafeIdGeneration:
 
         # Verify sequences are deterministic by re-running with same seeds
         set_id_seed(42)
-        expected_t1 = [_unique_id() for _ in range(5)]
+        expected_t1 = list(_unique_ids(5))
         reset_id_seed()
         set_id_seed(99)
-        expected_t2 = [_unique_id() for _ in range(5)]
+        expected_t2 = list(_unique_ids(5))
         reset_id_seed()
 
         assert results["t1"] == expected_t1
@@ -205,3 +255,11 @@ class TestMcpInputValidation:
         from mcp_server.server import _validate_output_path
         with pytest.raises(ValueError, match="확장자"):
             _validate_output_path("output.txt")
+
+    @pytest.mark.parametrize("name", [".hwpx", "..hwp", "dir/.hwt"])
+    def test_validate_paths_reject_bare_extension(self, name):
+        from mcp_server.server import _validate_document_path, _validate_output_path
+        with pytest.raises(ValueError, match="확장자"):
+            _validate_document_path(name)
+        with pytest.raises(ValueError, match="확장자"):
+            _validate_output_path(name)
@@ -2,6 +2,7 @@
 
 Spec: specs/01-zip-container.md
 """
+import io
 import zipfile
 from pathlib import Path
 
@@ -24,35 +25,30 @@ REQUIRED_ENTRIES = [
 
 
 class TestZipContainer:
-    def test_mimetype_is_first_entry(self, generated_hwpx_path):
-        with zipfile.ZipFile(generated_hwpx_path, "r") as zf:
-            first = zf.namelist()[0]
-            assert first == "mimetype", f"First entry must be 'mimetype', got '{first}'"
-
-    def test_mimetype_is_stored(self, generated_hwpx_path):
-        with zipfile.ZipFile(generated_hwpx_path, "r") as zf:
-            info = zf.getinfo("mimetype")
-            assert info.compress_type == zipfile.ZIP_STORED, \
-                "mimetype must use ZIP_STORED (no compression)"
-
-    def test_mimetype_content(self, generated_hwpx_path):
-        with zipfile.ZipFile(generated_hwpx_path, "r") as zf:
+    def test_mimetype_is_first_entry(self, generated_zip_infos):
+        first = next(iter(generated_zip_infos))
+        assert first == "mimetype", f"First entry must be 'mimetype', got '{first}'"
+
+    def test_mimetype_is_stored(self, generated_zip_infos):
+        info = generated_zip_infos["mimetype"]
+        assert info.compress_type == zipfile.ZIP_STORED, \
+            "mimetype must use ZIP_STORED (no compression)"
+
+    def test_mimetype_content(self, generated_hwpx):
+        with zipfile.ZipFile(generated_hwpx, "r") as zf:
             content = zf.read("mimetype")
             assert content == b"application/hwp+zip"
 
-    def test_all_required_entries_exist(self, generated_hwpx_path):
-        with zipfile.ZipFile(generated_hwpx_path, "r") as zf:
-            names = zf.namelist()
-            for entry in REQUIRED_ENTRIES:
-                assert entry in names, f"Missing required entry: {entry}"
+    def test_all_required_entries_exist(self, generated_zip_infos):
+        for entry in REQUIRED_ENTRIES:
+            assert entry in generated_zip_infos, f"Missing required entry: {entry}"
 
-    def test_xml_files_are_deflated(self, generated_hwpx_path):
-        with zipfile.ZipFile(generated_hwpx_path, "r") as zf:
-            for info in zf.infolist():
-                if info.filename == "mimetype":
-                    continue
-                assert info.compress_type == zipfile.ZIP_DEFLATED, \
-                    f"{info.filename} should use ZIP_DEFLATED"
+    def test_xml_files_are_deflated(self, generated_zip_infos):
+        for info in generated_zip_infos.values():
+            if info.filename == "mimetype":
+                continue
+            assert info.compress_type == zipfile.ZIP_DEFLATED, \
+                f"{info.filename} should use ZIP_DEFLATED"
 
     def test_reference_zip_structure_matches(self, ref_zip_metadata):
         """Verify our required entries match the reference HWPX."""
@@ -60,3 +56,64 @@ class TestZipContainer:
             assert entry in ref_zip_metadata, \
                 f"Reference HWPX missing {entry} — check extract_reference.py"
         assert ref_zip_metadata["mimetype"] == "STORED"
+
+    def test_streamed_section_matches_string_writer(self):
+        """The section streamed into the zip is the same XML as the string writer."""
+        from hwpxlib.document import HwpxDocument
+        from hwpxlib.xml_writer import write_section_xml, set_id_seed, reset_id_seed
+
+        doc = HwpxDocument(seed=3)
+        doc.add_paragraph("a < b & c")
+        with zipfile.ZipFile(io.BytesIO(doc.to_bytes())) as zf:
+            streamed = zf.read("Contents/section0.xml").decode("utf-8")
+        set_id_seed(3)
+        try:
+            elements, page_setup, header, footer = doc._get_all_sections()[0]
+            expected = write_section_xml(elements, page_setup=page_setup,
+                                         header=header, footer=footer)
+        finally:
+            reset_id_seed()
+        assert streamed == expected
+
+    def test_compresslevel_changes_only_compression(self):
+        from hwpxlib.document import HwpxDocument
+
+        doc = HwpxDocument(seed=3)
+        for i in range(200):
+            doc.add_paragraph(f"paragraph {i}")
+        fast = zipfile.ZipFile(io.BytesIO(doc.to_bytes(compresslevel=1)))
+        default = zipfile.ZipFile(io.BytesIO(doc.to_bytes()))
+        assert fast.getinfo("mimetype").compress_type == zipfile.ZIP_STORED
+        for name in default.namelist():
+            assert fast.read(name) == default.read(name)
+        section = "Contents/section0.xml"
+        assert fast.getinfo(section).compress_size != default.getinfo(section).compress_size
+
+    def test_stored_compression_keeps_content(self):
+        from hwpxlib.document import HwpxDocument
+
+        doc = HwpxDocument(seed=3)
+        doc.add_paragraph("stored")
+        stored = zipfile.ZipFile(io.BytesIO(
+            doc.to_bytes(compression=zipfile.ZIP_STORED)))
+        default = zipfile.ZipFile(io.BytesIO(doc.to_bytes()))
+        assert stored.namelist()[0] == "mimetype"
+        for info in stored.infolist():
+            assert info.compress_type == zipfile.ZIP_STORED
+            assert stored.read(info.filename) == default.read(info.filename)
+
+    def test_stored_compression_rejects_level(self):
+        from hwpxlib.document import HwpxDocument
+
+        doc = HwpxDocument(seed=3)
+        with pytest.raises(ValueError, match="ZIP_STORED"):
+            doc.to_bytes(compression=zipfile.ZIP_STORED, compresslevel=1)
+
+    def test_save_accepts_file_object(self):
+        from hwpxlib.document import HwpxDocument
+
+        doc = HwpxDocument(seed=3)
+        doc.add_paragraph("in memory")
+        buf = io.BytesIO()
+        doc.save(buf)
+        assert buf.getvalue() == doc.to_bytes()
@@ -1,25 +1,39 @@
 """Standalone XML diff tool: compare hwpxlib output against reference XML.
 
 Usage:
-    python tests/validate_xml.py [--verbose]
+    python tests/validate_xml.py [--verbose] [--fail-fast]
 
 Exit code 0 = all match, 1 = differences found.
+--fail-fast stops comparing at each check's first difference (the exit code
+is the same, the report just lists that one difference per failing check).
 This script serves as a backpressure gate for the Ralph build loop.
 """
+import functools
+import io
 import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from xml.etree import ElementTree as ET
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from tests import ET, HP_SUBLIST, HP_TBL  # lxml when installed, else ElementTree
+# Imported up front: main() runs the validators on worker threads, and two
+# threads importing the package at once can trip the import-lock deadlock check.
+from hwpxlib.template import (
+    default_font_faces, default_border_fills,
+    default_char_prs, default_para_prs, default_styles,
+)
+from hwpxlib.xml_writer import write_header_xml, write_version_xml, write_settings_xml
+
 REFERENCE_DIR = PROJECT_ROOT / "reference" / "extracted" / "colorlight"
 
 
-def normalize_xml(xml_str: str) -> ET.Element:
-    """Parse XML and return normalized ElementTree."""
-    return ET.fromstring(xml_str)
+@functools.lru_cache(maxsize=None)
+def _ref_bytes(relpath: str) -> bytes:
+    """Read a reference file once; the extracted corpus never changes."""
+    return (REFERENCE_DIR / relpath).read_bytes()
 
 
 # Tags where generated may have MORE items than reference (intentional extensions)
@@ -28,81 +42,205 @@ _EXTENSIBLE_TAGS = {
 }
 
 
+# Tags whose 'id' is a random ID (table and subList ids differ per build)
+_ID_SKIP_TAGS = frozenset({HP_TBL, HP_SUBLIST})
+
+
 def _is_extensible(tag: str) -> bool:
     """Check if this element is an extensible collection (may have extra items)."""
     return any(tag.endswith("}" + t) for t in _EXTENSIBLE_TAGS)
 
 
-def compare_elements(ref: ET.Element, gen: ET.Element, path: str = "") -> list:
-    """Recursively compare two XML elements, returning list of differences."""
-    diffs = []
+def _release(elem) -> None:
+    """Free a fully compared element (and, under lxml, its finished siblings)."""
+    elem.clear()
+    if hasattr(elem, "getprevious"):
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def _skip(events) -> None:
+    """Consume the rest of the subtree whose start event was just read."""
+    depth = 1
+    for event, elem in events:
+        if event == "start":
+            depth += 1
+        else:
+            depth -= 1
+            _release(elem)
+            if depth == 0:
+                return
+
+
+def _count_rest(events) -> int:
+    """Skip the remaining children of an open element; return how many there were."""
+    count = 0
+    for event, elem in events:
+        if event == "end":
+            return count
+        count += 1
+        _skip(events)
+    return count
+
+
+# Stop comparing once this many differences are known; a tree that is this
+# far off needs fixing before the rest of the report is useful.
+MAX_DIFFS = 100
+
+
+class _Frame:
+    """An element pair whose start tags were read but whose end tags were not."""
+
+    __slots__ = ("ref", "gen", "current", "diffs", "child_diffs",
+                 "ref_count", "gen_count")
+
+    def __init__(self, ref, gen, current: str, diffs: list):
+        self.ref = ref
+        self.gen = gen
+        self.current = current
+        self.diffs = diffs
+        self.child_diffs = []
+        self.ref_count = 0
+        self.gen_count = 0
+
+
+def _open_pair(ref, gen, path: str, ref_events, gen_events):
+    """Start comparing two elements whose start events were just read.
+
+    Returns ``(frame, diffs)``. On a tag mismatch both subtrees are skipped,
+    frame is None and diffs holds the mismatch; otherwise diffs are the
+    attribute differences (complete as soon as the start tag is read).
+    """
     current = f"{path}/{ref.tag}" if path else ref.tag
 
     # Compare tag
     if ref.tag != gen.tag:
-        diffs.append(f"TAG MISMATCH at {current}: ref={ref.tag} gen={gen.tag}")
-        return diffs
+        _skip(ref_events)
+        _skip(gen_events)
+        return None, [f"TAG MISMATCH at {current}: ref={ref.tag} gen={gen.tag}"]
 
     # Compare attributes
-    ref_attrs = dict(ref.attrib)
-    gen_attrs = dict(gen.attrib)
-
-    # Skip 'id' attributes that are random IDs (like subList id, tbl id)
-    skip_attrs = set()
-    if ref.tag.endswith("}tbl") or ref.tag.endswith("}subList"):
-        skip_attrs.add("id")
-    # Skip itemCnt for extensible collections (generated may have more)
-    if _is_extensible(ref.tag):
-        skip_attrs.add("itemCnt")
-
-    for key in sorted(set(ref_attrs.keys()) | set(gen_attrs.keys())):
-        if key in skip_attrs:
-            continue
-        ref_val = ref_attrs.get(key)
-        gen_val = gen_attrs.get(key)
-        if ref_val != gen_val:
-            diffs.append(f"ATTR {current}@{key}: ref={ref_val!r} gen={gen_val!r}")
+    diffs = []
+    if ref.attrib != gen.attrib:
+        # Skip 'id' attributes that are random IDs (like subList id, tbl id)
+        skip_attrs = set()
+        if ref.tag in _ID_SKIP_TAGS:
+            skip_attrs.add("id")
+        # Skip itemCnt for extensible collections (generated may have more)
+        if _is_extensible(ref.tag):
+            skip_attrs.add("itemCnt")
+
+        ref_attrs = {k: v for k, v in ref.attrib.items() if k not in skip_attrs}
+        gen_attrs = {k: v for k, v in gen.attrib.items() if k not in skip_attrs}
+        for key in sorted(ref_attrs.keys() | gen_attrs.keys()):
+            ref_val = ref_attrs.get(key)
+            gen_val = gen_attrs.get(key)
+            if ref_val != gen_val:
+                diffs.append(f"ATTR {current}@{key}: ref={ref_val!r} gen={gen_val!r}")
+    return _Frame(ref, gen, current, diffs), diffs
+
+
+def _close_pair(frame: _Frame) -> list:
+    """Finish a pair once both end tags were read; returns the new diffs."""
+    ref, gen, current = frame.ref, frame.gen, frame.current
+    diffs = []
 
-    # Compare text
+    # Compare text (only complete once the end tag is read)
     ref_text = (ref.text or "").strip()
     gen_text = (gen.text or "").strip()
     if ref_text != gen_text:
         diffs.append(f"TEXT {current}: ref={ref_text!r} gen={gen_text!r}")
 
     # Compare children
-    ref_children = list(ref)
-    gen_children = list(gen)
-
+    ref_count, gen_count = frame.ref_count, frame.gen_count
     if _is_extensible(ref.tag):
         # For extensible collections: generated must have AT LEAST as many items
-        if len(gen_children) < len(ref_children):
-            diffs.append(
-                f"CHILDREN COUNT {current}: gen={len(gen_children)} < ref={len(ref_children)}"
-            )
-        # Compare only the overlapping portion
-        for i, (rc, gc) in enumerate(zip(ref_children, gen_children)):
-            diffs.extend(compare_elements(rc, gc, f"{current}[{i}]"))
-    elif len(ref_children) != len(gen_children):
-        diffs.append(
-            f"CHILDREN COUNT {current}: ref={len(ref_children)} gen={len(gen_children)}"
-        )
-        for i, (rc, gc) in enumerate(zip(ref_children, gen_children)):
-            diffs.extend(compare_elements(rc, gc, f"{current}[{i}]"))
-    else:
-        for i, (rc, gc) in enumerate(zip(ref_children, gen_children)):
-            diffs.extend(compare_elements(rc, gc, f"{current}[{i}]"))
-
+        if gen_count < ref_count:
+            diffs.append(f"CHILDREN COUNT {current}: gen={gen_count} < ref={ref_count}")
+    elif ref_count != gen_count:
+        diffs.append(f"CHILDREN COUNT {current}: ref={ref_count} gen={gen_count}")
+
+    frame.diffs.extend(diffs)
+    _release(ref)
+    _release(gen)
     return diffs
 
 
-def validate_header():
+def iter_compare(ref_xml: str | bytes, gen_xml: str | bytes,
+                 limit: int | None = MAX_DIFFS) -> list:
+    """Stream-compare two XML documents, returning list of differences.
+
+    Both documents are walked in lockstep with an explicit stack of open
+    element pairs, so only the open ancestors are kept in memory.
+
+    Once *limit* differences are known (None compares everything), nothing
+    further is compared. The rest of each document is still scanned, but
+    only to settle the open ancestors' TEXT and CHILDREN COUNT diffs, which
+    precede their children's in the report. The result is therefore exactly
+    the first *limit* differences of the full report, in document order.
+    """
+    # Bytes: lxml refuses str input that carries an encoding declaration.
+    if isinstance(ref_xml, str):
+        ref_xml = ref_xml.encode("utf-8")
+    if isinstance(gen_xml, str):
+        gen_xml = gen_xml.encode("utf-8")
+    # Identical documents (version.xml and settings.xml today) need no walk.
+    if ref_xml == gen_xml:
+        return []
+    ref_events = ET.iterparse(io.BytesIO(ref_xml), events=("start", "end"))
+    gen_events = ET.iterparse(io.BytesIO(gen_xml), events=("start", "end"))
+    _, ref = next(ref_events)
+    _, gen = next(gen_events)
+
+    root, found = _open_pair(ref, gen, "", ref_events, gen_events)
+    if root is None:
+        return found
+    found = len(found)
+    stack = [root]
+    while stack and (limit is None or found < limit):
+        frame = stack[-1]
+        ref_event, ref_child = next(ref_events)
+        gen_event, gen_child = next(gen_events)
+        if ref_event == "start" and gen_event == "start":
+            child, diffs = _open_pair(
+                ref_child, gen_child, f"{frame.current}[{frame.ref_count}]",
+                ref_events, gen_events,
+            )
+            frame.ref_count += 1
+            frame.gen_count += 1
+            found += len(diffs)
+            if child is None:
+                frame.child_diffs.extend(diffs)
+            else:
+                stack.append(child)
+            continue
+        # Whichever side runs out of children first ends the overlap; the
+        # other side's remainder is only counted.
+        if ref_event == "start":
+            _skip(ref_events)
+            frame.ref_count += 1 + _count_rest(ref_events)
+        elif gen_event == "start":
+            _skip(gen_events)
+            frame.gen_count += 1 + _count_rest(gen_events)
+        stack.pop()
+        found += len(_close_pair(frame))
+        if stack:
+            stack[-1].child_diffs.extend(frame.diffs + frame.child_diffs)
+
+    # Cap reached: count (without comparing) the children still left under
+    # each open pair, innermost first, so their text/count diffs are settled.
+    while stack:
+        frame = stack.pop()
+        frame.ref_count += _count_rest(ref_events)
+        frame.gen_count += _count_rest(gen_events)
+        _close_pair(frame)
+        if stack:
+            stack[-1].child_diffs.extend(frame.diffs + frame.child_diffs)
+    return (root.diffs + root.child_diffs)[:limit]
+
+
+def validate_header(limit: int | None = MAX_DIFFS):
     """Compare generated header.xml against reference."""
-    from hwpxlib.template import (
-        default_font_faces, default_border_fills,
-        default_char_prs, default_para_prs, default_styles,
-    )
-    from hwpxlib.xml_writer import write_header_xml
-
     gen_xml = write_header_xml(
         font_faces=default_font_faces(),
         border_fills=default_border_fills(),
@@ -110,43 +248,43 @@ def validate_header():
         para_prs=default_para_prs(),
         styles=default_styles(),
     )
-    ref_xml = (REFERENCE_DIR / "Contents" / "header.xml").read_text(encoding="utf-8")
+    ref_xml = _ref_bytes("Contents/header.xml")
 
-    ref_tree = normalize_xml(ref_xml)
-    gen_tree = normalize_xml(gen_xml)
+    return iter_compare(ref_xml, gen_xml, limit)
 
-    return compare_elements(ref_tree, gen_tree)
 
-
-def validate_meta():
+def validate_meta(limit: int | None = MAX_DIFFS):
     """Compare generated meta files against reference."""
-    from hwpxlib.xml_writer import write_version_xml, write_settings_xml
-
     diffs = []
 
     # version.xml
     gen = write_version_xml()
-    ref = (REFERENCE_DIR / "version.xml").read_text(encoding="utf-8")
-    ref_tree = normalize_xml(ref)
-    gen_tree = normalize_xml(gen)
-    diffs.extend(compare_elements(ref_tree, gen_tree))
+    ref = _ref_bytes("version.xml")
+    diffs.extend(iter_compare(ref, gen, limit))
+    if limit is not None and len(diffs) >= limit:
+        return diffs
 
     # settings.xml
     gen = write_settings_xml()
-    ref = (REFERENCE_DIR / "settings.xml").read_text(encoding="utf-8")
-    ref_tree = normalize_xml(ref)
-    gen_tree = normalize_xml(gen)
-    diffs.extend(compare_elements(ref_tree, gen_tree))
+    ref = _ref_bytes("settings.xml")
+    diffs.extend(iter_compare(ref, gen, None if limit is None else limit - len(diffs)))
 
     return diffs
 
 
 def main():
     verbose = "--verbose" in sys.argv or "-v" in sys.argv
+    limit = 1 if "--fail-fast" in sys.argv else MAX_DIFFS
     all_diffs = []
 
+    # The two checks are independent; run them side by side and report in order.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        header_future = executor.submit(validate_header, limit)
+        meta_future = executor.submit(validate_meta, limit)
+        header_diffs = header_future.result()
+        meta_diffs = meta_future.result()
+
     print("=== Validating header.xml ===")
-    header_diffs = validate_header()
     all_diffs.extend(header_diffs)
     if header_diffs:
         print(f"  {len(header_diffs)} difference(s) found")
@@ -157,7 +295,6 @@ def main():
         print("  PASS")
 
     print("\n=== Validating meta files ===")
-    meta_diffs = validate_meta()
     all_diffs.extend(meta_diffs)
     if meta_diffs:
         print(f"  {len(meta_diffs)} difference(s) found")